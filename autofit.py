@@ -0,0 +1,142 @@
+import sys
+
+import freetype
+import numpy as np
+
+from glyph_render import render_glyphset
+from glyphset import save_glyphset
+from placement import default_baseline, render_aligned
+
+# Finds the largest pixel size at which a whole charset fits a target cell (7x13, 22x39,
+# ...) from glyph metrics alone, so the real render happens once at the right size instead
+# of after rounds of trial renders, clipping or LANCZOS squashing in bitmap_to_xbm.
+#
+# For a candidate size every glyph is loaded with FT_LOAD_NO_BITMAP and not rendered; its
+# outline control box, rounded out to whole pixels the way FreeType sizes the bitmap it
+# would render, gives the bitmap's extent. The overflow of every glyph is then computed
+# for the whole charset at once. The size is binary searched between 1 and max_size;
+# hinting can make fitting very slightly non-monotonic, so the search is a good answer,
+# not a proof that no larger size fits.
+#
+# align "top" matches the original scripts (bitmap copied from the cell's top-left, so
+# only its width and rows count); "baseline" and "center" match placement.py, where the
+# ink has to sit between the cell's top and bottom around the baseline.
+
+LOAD_FLAGS = freetype.FT_LOAD_DEFAULT | freetype.FT_LOAD_NO_BITMAP
+
+
+# Returns (left, bottom, right, top, advance) pixel arrays for chars at pixel_size.
+def measure(face, chars, pixel_size, load_flags=LOAD_FLAGS):
+    face.set_pixel_sizes(0, pixel_size)
+    boxes = np.zeros((len(chars), 5), dtype=np.int64)
+    for i, char in enumerate(chars):
+        face.load_char(char, load_flags)
+        cbox = face.glyph.outline.get_cbox()
+        boxes[i] = (cbox.xMin, cbox.yMin, cbox.xMax, cbox.yMax, face.glyph.advance.x)
+    return (boxes[:, 0] >> 6, boxes[:, 1] >> 6, (boxes[:, 2] + 63) >> 6, (boxes[:, 3] + 63) >> 6,
+            (boxes[:, 4] + 32) >> 6)
+
+
+# Pixels by which every glyph overflows a width x height cell (0 where it fits).
+def overflow(metrics, width, height, align="top", baseline=None, check_advance=False):
+    left, bottom, right, top, advance = metrics
+    columns = right - left
+    rows = top - bottom
+
+    if align == "top":
+        over = np.maximum(rows - height, 0) + np.maximum(columns - width, 0)
+    else:
+        over = np.maximum(top - baseline, 0) + np.maximum(baseline - bottom - height, 0)
+        if align == "center":
+            over += np.maximum(columns - width, 0)
+        else:
+            # placement.place_glyphs clamps a negative left bearing to the cell's left edge
+            over += np.maximum(np.maximum(left, 0) + columns - width, 0)
+    if check_advance:
+        over += np.maximum(advance - width, 0)
+    return over
+
+
+# Binary searches the largest pixel size at which at most `allow` glyphs overflow the cell.
+# Returns a dict with "size" (None if not even 1px fits), "outliers" (glyphs overflowing at
+# that size) and "limiting" (glyphs overflowing at the next size up), each as
+# [(char, overflow pixels)] largest first, and "measured" (sizes tried).
+def autofit(ttf_path, char_list, width, height, align="top", baseline=None, allow=0,
+            check_advance=False, max_size=None, face=None):
+    if face is None:
+        face = freetype.Face(ttf_path)
+    chars = list(dict.fromkeys(char_list))
+    if align != "top" and baseline is None:
+        baseline = default_baseline(face, height)
+
+    results = {}
+
+    def evaluate(size):
+        if size not in results:
+            results[size] = overflow(measure(face, chars, size), width, height, align, baseline, check_advance)
+        return results[size]
+
+    def fits(size):
+        return np.count_nonzero(evaluate(size)) <= allow
+
+    low, high = 0, max_size or 4 * height
+    while low < high:
+        middle = (low + high + 1) // 2
+        if fits(middle):
+            low = middle
+        else:
+            high = middle - 1
+    size = low or None
+
+    def offenders(over):
+        order = np.argsort(-over, kind="stable")
+        return [(chars[i], int(over[i])) for i in order if over[i] > 0]
+
+    return {
+        "size": size,
+        "outliers": offenders(evaluate(size)) if size else [],
+        "limiting": offenders(evaluate((size or 0) + 1)),
+        "measured": sorted(results),
+    }
+
+
+def print_fit(report, width, height, limit=20):
+    sizes = ", ".join(str(size) for size in report["measured"])
+    if report["size"] is None:
+        print(f"No pixel size fits {width}x{height} (measured {sizes}).")
+    else:
+        print(f"Largest size that fits {width}x{height}: {report['size']}px (measured {sizes}, nothing rendered).")
+    if report["outliers"]:
+        print(f"Allowed outliers at {report['size']}px: "
+              + ", ".join(f"{char!r} +{pixels}" for char, pixels in report["outliers"][:limit]))
+    if report["limiting"]:
+        print(f"Overflowing one size up: "
+              + ", ".join(f"{char!r} +{pixels}" for char, pixels in report["limiting"][:limit])
+              + (f" ... {len(report['limiting']) - limit} more" if len(report["limiting"]) > limit else ""))
+
+
+# Finds the size, prints the report and renders the charset once at that size.
+def fit_and_render(ttf_path, char_list, width, height, output=None, align="top", allow=0,
+                   check_advance=False, max_size=None):
+    face = freetype.Face(ttf_path)
+    report = autofit(ttf_path, char_list, width, height, align, allow=allow, check_advance=check_advance,
+                     max_size=max_size, face=face)
+    print_fit(report, width, height)
+    if output and report["size"]:
+        if align == "top":
+            glyphs = render_glyphset(ttf_path, char_list, width, height, face=face, pixel_size=report["size"])
+        else:
+            glyphs, _ = render_aligned(ttf_path, char_list, width, height, align="center" if align == "center" else "bearing",
+                                       face=face, pixel_size=report["size"])
+        save_glyphset(glyphs, output)
+    return report
+
+
+if __name__ == "__main__":
+    # Path to the TTF font file
+    ttf_path = r"C:\Users\theda\OneDrive\Desktop\ttf_testuing\Courier.ttf"
+
+    # Characters that must fit the cell
+    char_list = sys.argv[1] if len(sys.argv) > 1 else "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+
+    fit_and_render(ttf_path, char_list, 7, 13, output="output/autofit.h", align="baseline")
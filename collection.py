@@ -0,0 +1,158 @@
+import re
+import struct
+import sys
+
+import freetype
+
+from glyph_render import pack_bitmap
+from glyphset import GlyphSet, save_glyphset
+
+# Renders every face of a .ttc/.otc collection and any number of variable-font instances
+# in one process, instead of one run (and one parse of the file) per face or weight.
+#
+# The file is read once and every face is opened from that same buffer
+# (FT_New_Memory_Face). Named and explicit instances are both applied as design
+# coordinates (set_var_design_coords) on the already open face.
+#
+# Collections usually share tables between faces (e.g. one 'glyf' for Regular and
+# Oblique with different 'name' tables). A face's render key is the file location of its
+# outline, metrics and hinting tables plus the instance's design coordinates; glyphs are
+# cached by (render key, glyph index), so any face/instance pair that would produce the
+# same bitmap reuses it instead of rendering again.
+#
+# Instances are given as named instance names ("Bold") or explicit axis values
+# ("wght=650,wdth=87.5"); "named" expands to every named instance of the face. Static
+# faces always render once as "default". Outputs are namespaced with {face} (family and
+# style) and {instance} in the output template.
+
+# Tables that decide what a rendered glyph looks like at a given size
+RENDER_TABLES = (b"glyf", b"loca", b"CFF ", b"CFF2", b"head", b"hhea", b"hmtx", b"maxp",
+                 b"cvt ", b"fpgm", b"prep", b"gasp", b"gvar", b"fvar", b"avar", b"HVAR", b"EBLC", b"EBDT")
+
+DEFAULT_OUTPUT = "output/{face}_{instance}.h"
+
+
+class _SharedBuffer:
+    # freetype.Face reads file-like objects with read(); handing out the same bytes
+    # object keeps one copy of the font in memory for every face.
+    def __init__(self, data):
+        self.data = data
+
+    def read(self):
+        return self.data
+
+
+# Parses the sfnt table directory of every face in a font file.
+# Returns one {tag: (offset, length)} dict per face.
+def read_table_directories(data):
+    if data[:4] == b"ttcf":
+        (count,) = struct.unpack_from(">I", data, 8)
+        offsets = struct.unpack_from(f">{count}I", data, 12)
+    else:
+        offsets = (0,)
+
+    directories = []
+    for offset in offsets:
+        (num_tables,) = struct.unpack_from(">H", data, offset + 4)
+        tables = {}
+        for i in range(num_tables):
+            tag, _, table_offset, length = struct.unpack_from(">4sIII", data, offset + 12 + 16 * i)
+            tables[tag] = (table_offset, length)
+        directories.append(tables)
+    return directories
+
+
+def _slug(text):
+    return re.sub(r"[^0-9A-Za-z._-]+", "-", text).strip("-") or "face"
+
+
+def face_name(face):
+    family = (face.family_name or b"").decode("utf-8", "replace")
+    style = (face.style_name or b"").decode("utf-8", "replace")
+    return _slug(f"{family}-{style}")
+
+
+# Expands instance specs for one face into [(instance name, design coords or None)].
+# Static faces get [("default", None)].
+def resolve_instances(face, specs=None):
+    if not face.has_multiple_masters:
+        return [("default", None)]
+    info = face.get_variation_info()
+    named = {instance.name: instance.coords for instance in info.instances}
+    defaults = [axis.default for axis in info.axes]
+    tags = [axis.tag for axis in info.axes]
+
+    resolved = []
+    for spec in specs or ["named"]:
+        if spec == "named":
+            resolved.extend((_slug(name), coords) for name, coords in named.items())
+        elif spec == "default":
+            resolved.append(("default", tuple(defaults)))
+        elif "=" in spec:
+            coords = list(defaults)
+            for assignment in spec.split(","):
+                tag, value = assignment.split("=")
+                if tag.strip() not in tags:
+                    raise ValueError(f"{face_name(face)} has no axis {tag.strip()!r}, expected one of {', '.join(tags)}")
+                coords[tags.index(tag.strip())] = float(value)
+            resolved.append((_slug(spec.replace("=", "").replace(",", "-")), tuple(coords)))
+        elif spec in named:
+            resolved.append((_slug(spec), named[spec]))
+        else:
+            raise ValueError(f"{face_name(face)} has no named instance {spec!r}, expected one of {', '.join(named)}")
+    return resolved
+
+
+# Renders char_list for every face and instance of font_path from one read of the file.
+# Returns {output path: GlyphSet}.
+def render_collection(font_path, char_list, forced_width=None, height=13, instances=None,
+                      output=DEFAULT_OUTPUT):
+    with open(font_path, "rb") as f:
+        data = f.read()
+    directories = read_table_directories(data)
+    chars = list(dict.fromkeys(char_list))
+
+    cache = {}
+    rendered = reused = 0
+    outputs = {}
+    for face_index, tables in enumerate(directories):
+        face = freetype.Face(_SharedBuffer(data), face_index)
+        name = face_name(face)
+        location = tuple((tag, tables[tag]) for tag in RENDER_TABLES if tag in tables)
+
+        for instance_name, coords in resolve_instances(face, instances):
+            if coords is not None:
+                face.set_var_design_coords(coords)
+            face.set_pixel_sizes(0, height)
+            render_key = (location, coords, height, forced_width)
+
+            glyphs = GlyphSet(bit_order="lsb")
+            for char in chars:
+                key = (render_key, face.get_char_index(char))
+                result = cache.get(key)
+                if result is None:
+                    face.load_glyph(key[1], freetype.FT_LOAD_RENDER)
+                    bitmap = face.glyph.bitmap
+                    width = forced_width if forced_width else bitmap.width
+                    result = cache[key] = (width, pack_bitmap(bitmap, width, height))
+                    rendered += 1
+                else:
+                    reused += 1
+                glyphs.add(char, result[0], height, result[1])
+
+            path = output.format(face=name, instance=instance_name, index=face_index)
+            save_glyphset(glyphs, path)
+            outputs[path] = glyphs
+
+    print(f"{len(directories)} faces, {len(outputs)} outputs: {rendered} glyphs rendered, {reused} reused.")
+    return outputs
+
+
+if __name__ == "__main__":
+    # Path to a .ttc/.otc collection or a variable font
+    font_path = r"C:\Users\theda\OneDrive\Desktop\ttf_testuing\NotoSansCJK.ttc"
+
+    # Characters to convert
+    char_list = sys.argv[1] if len(sys.argv) > 1 else "ABC中文"
+
+    render_collection(font_path, char_list, forced_width=14, height=13, output="output/{face}_{instance}.h")
@@ -0,0 +1,110 @@
+import os
+import struct
+import sys
+
+import freetype
+
+from glyph_render import render_glyphset
+from glyphset import GlyphSet, save_glyphset
+
+# Renders one charset from an ordered chain of fonts instead of a single ttf_path.
+#
+# Each font's cmap is walked once to build a merged codepoint -> font routing index (the
+# first font in the chain that maps a codepoint wins). Characters are then grouped by the
+# font they route to and every group is rendered in one pass over a single open face.
+# Codepoints no font maps are rendered from the primary font (its .notdef box, as before)
+# and reported as missing.
+
+MISSING = 0xFFFF
+
+
+# Walks every font's cmap once. Returns {codepoint: font index} for the whole chain.
+def build_routing_index(faces):
+    routing = {}
+    for font_index, face in enumerate(faces):
+        for codepoint, glyph_index in face.get_chars():
+            if glyph_index:
+                routing.setdefault(codepoint, font_index)
+    return routing
+
+
+# Renders char_list through the fallback chain.
+# Returns (GlyphSet in char_list order, [font index per glyph, MISSING if no font has it]).
+def render_fallback_chain(font_paths, char_list, forced_width=None, height=13):
+    faces = [freetype.Face(path) for path in font_paths]
+    routing = build_routing_index(faces)
+    chars = list(dict.fromkeys(char_list))
+
+    groups = {}
+    for char in chars:
+        groups.setdefault(routing.get(ord(char), MISSING), []).append(char)
+
+    rendered = {}
+    for font_index, group in groups.items():
+        face_index = 0 if font_index == MISSING else font_index
+        print(f"Rendering {len(group)} glyphs from {os.path.basename(font_paths[face_index])}"
+              + (" (missing in every font)" if font_index == MISSING else ""))
+        partial = render_glyphset(font_paths[face_index], group, forced_width, height, face=faces[face_index])
+        for char in group:
+            rendered[char] = partial.get(char)
+
+    glyphs = GlyphSet(bit_order="lsb")
+    sources = []
+    for char in chars:
+        glyphs.add(char, *rendered[char])
+        sources.append(routing.get(ord(char), MISSING))
+    return glyphs, sources
+
+
+# Encodes per-glyph attribution for the glyph pack:
+# font count (u16), then per font a u16 length + UTF-8 file name, then one u16 font index per glyph.
+def sources_section(font_paths, sources):
+    payload = struct.pack("<H", len(font_paths))
+    for path in font_paths:
+        name = os.path.basename(path).encode("utf-8")
+        payload += struct.pack("<H", len(name)) + name
+    return payload + struct.pack(f"<{len(sources)}H", *sources)
+
+
+# Decodes a SRCS section back into ([font names], [font index per glyph]).
+def read_sources_section(payload):
+    (count,) = struct.unpack_from("<H", payload)
+    pos = 2
+    names = []
+    for _ in range(count):
+        (length,) = struct.unpack_from("<H", payload, pos)
+        names.append(payload[pos + 2:pos + 2 + length].decode("utf-8"))
+        pos += 2 + length
+    sources = list(struct.unpack_from(f"<{(len(payload) - pos) // 2}H", payload, pos))
+    return names, sources
+
+
+# Renders through the chain and writes one combined output with source attribution:
+# a comment per glyph in headers, a SRCS section in glyph packs.
+def convert_with_fallback(font_paths, char_list, output, forced_width=None, height=13):
+    glyphs, sources = render_fallback_chain(font_paths, char_list, forced_width, height)
+
+    names = [os.path.basename(path) for path in font_paths]
+    comments = {char: f"source: {names[source]}" if source != MISSING else "source: missing in every font"
+                for char, source in zip(glyphs.chars, sources)}
+    save_glyphset(glyphs, output, sections={b"SRCS": sources_section(font_paths, sources)}, comments=comments)
+
+    missing = [char for char, source in zip(glyphs.chars, sources) if source == MISSING]
+    for font_index, name in enumerate(names):
+        print(f"{name}: {sources.count(font_index)} glyphs")
+    if missing:
+        print(f"Missing in every font: {''.join(missing)!r}")
+    return glyphs, sources
+
+
+if __name__ == "__main__":
+    # Fonts in priority order: the first font that has a codepoint renders it
+    font_paths = [
+        r"C:\Users\theda\OneDrive\Desktop\ttf_testuing\Courier.ttf",
+        r"C:\Users\theda\OneDrive\Desktop\ttf_testuing\NotoSansCJK.ttf",
+    ]
+
+    # Characters to convert
+    char_list = sys.argv[1] if len(sys.argv) > 1 else "ABC中文"
+
+    convert_with_fallback(font_paths, char_list, "output/fallback.h", forced_width=14, height=13)
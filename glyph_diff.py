@@ -0,0 +1,91 @@
+import sys
+import time
+
+import numpy as np
+
+from preview import save_contact_sheet, stack_glyphs
+from xbm_reader import load_outputs
+
+# Tells which glyphs changed between two runs, e.g. after a font version bump or a new
+# forced_width/threshold_value, without eyeballing .xbm files.
+#
+# Either side can be a directory of .xbm files, a header (write_c_header or
+# write_glyphset_header) or a .gpk glyph pack; bit order and layout may differ between
+# them. Glyphs are aligned by codepoint, both sides of the common set are unpacked into
+# (N, H, W) stacks padded to a shared cell, and the XOR pixel count of every glyph comes
+# from one vectorized comparison.
+
+
+# Compares two GlyphSets. Returns a dict with
+#   "added"/"removed": chars only in new/old,
+#   "changed": [(char, differing pixels, (old w, old h), (new w, new h))], largest first,
+#   "unchanged": number of identical common glyphs.
+def diff_glyphsets(old, new):
+    common = [char for char in new.chars if char in old]
+    added = [char for char in new.chars if char not in old]
+    removed = [char for char in old.chars if char not in new]
+
+    sizes_old = [(old.widths[old.index(char)], old.heights[old.index(char)]) for char in common]
+    sizes_new = [(new.widths[new.index(char)], new.heights[new.index(char)]) for char in common]
+    height = max((max(h0, h1) for (_, h0), (_, h1) in zip(sizes_old, sizes_new)), default=0)
+    width = max((max(w0, w1) for (w0, _), (w1, _) in zip(sizes_old, sizes_new)), default=0)
+
+    before = stack_glyphs(old, common, height, width)
+    after = stack_glyphs(new, common, height, width)
+    counts = np.count_nonzero(before != after, axis=(1, 2))
+    resized = np.array([a != b for a, b in zip(sizes_old, sizes_new)], dtype=bool)
+
+    # A resize with identical ink still counts as a change (0 pixels but a new cell)
+    differs = (counts > 0) | resized
+    order = np.lexsort((np.arange(len(common)), -counts))
+    changed = [(common[i], int(counts[i]), sizes_old[i], sizes_new[i]) for i in order if differs[i]]
+    return {
+        "added": added,
+        "removed": removed,
+        "changed": changed,
+        "unchanged": len(common) - len(changed),
+    }
+
+
+def _describe(char):
+    return f"{char!r} U+{ord(char):04X}"
+
+
+def print_report(report, limit=50):
+    changed = report["changed"]
+    print(f"{len(changed)} changed, {len(report['added'])} added, {len(report['removed'])} removed, "
+          f"{report['unchanged']} unchanged.")
+    for char, pixels, old_size, new_size in changed[:limit]:
+        resize = f"  {old_size[0]}x{old_size[1]} -> {new_size[0]}x{new_size[1]}" if old_size != new_size else ""
+        print(f"  {_describe(char)}: {pixels} pixels{resize}")
+    if len(changed) > limit:
+        print(f"  ... {len(changed) - limit} more")
+    for label in ("added", "removed"):
+        if report[label]:
+            chars = report[label]
+            print(f"{label.capitalize()}: {', '.join(_describe(char) for char in chars[:limit])}"
+                  + (f" ... {len(chars) - limit} more" if len(chars) > limit else ""))
+
+
+# Loads both outputs, diffs them and prints the report. Optionally also writes a
+# contact sheet with the changes overlaid (see preview.py).
+def diff_outputs(old_path, new_path, limit=50, sheet=None):
+    old = load_outputs(old_path)
+    new = load_outputs(new_path)
+
+    start = time.perf_counter()
+    report = diff_glyphsets(old, new)
+    print(f"Compared {len(old)} and {len(new)} glyphs in {(time.perf_counter() - start) * 1000:.0f} ms.")
+    print_report(report, limit)
+
+    if sheet:
+        save_contact_sheet(new, sheet, previous=old, labels=True)
+    return report
+
+
+if __name__ == "__main__":
+    # Previous and new outputs: .xbm directories, .h headers or .gpk packs
+    old_path = sys.argv[1] if len(sys.argv) > 1 else "output_old"
+    new_path = sys.argv[2] if len(sys.argv) > 2 else "output"
+
+    diff_outputs(old_path, new_path)
@@ -0,0 +1,69 @@
+import freetype
+import numpy as np
+
+from glyphset import GlyphSet
+
+# Packs a FreeType bitmap into XBM rows in one numpy pass.
+# Same output as Idk2.bitmap_to_xbm: LSB-first, (forced_width + 7) // 8 bytes per row,
+# clipped to forced_width x height and padded with zero rows.
+# A pixel is ink when its 8-bit coverage is above threshold (0 = any coverage, like Idk2).
+def pack_bitmap(bitmap, forced_width, height, threshold=0):
+    return pack_pixels(bitmap_pixels(bitmap), forced_width, height, threshold)
+
+
+# Copies a FreeType bitmap's coverage into a (rows, width) uint8 array.
+# 1bpp bitmaps (embedded strikes) are expanded to full coverage.
+def bitmap_pixels(bitmap):
+    if not bitmap.rows:
+        return np.zeros((0, bitmap.width), dtype=np.uint8)
+    pixels = np.array(bitmap.buffer, dtype=np.uint8).reshape(bitmap.rows, bitmap.pitch)
+    if bitmap.pixel_mode == freetype.FT_PIXEL_MODE_MONO:
+        pixels = np.unpackbits(pixels, axis=1) * np.uint8(255)
+    return pixels[:, :bitmap.width]
+
+
+# Packs a (rows, width) coverage array the same way as pack_bitmap.
+def pack_pixels(pixels, forced_width, height, threshold=0):
+    bytes_per_row = (forced_width + 7) // 8
+    cell = np.zeros((height, bytes_per_row * 8), dtype=np.uint8)
+
+    rows = min(height, pixels.shape[0])
+    cols = min(forced_width, pixels.shape[1])
+    if rows and cols:
+        cell[:rows, :cols] = pixels[:rows, :cols] > threshold
+
+    return np.packbits(cell, axis=1, bitorder="little").tobytes()
+
+
+# Renders one character with the face's current pixel size. Returns (width, packed rows).
+def render_glyph(face, char, forced_width, height, load_flags=freetype.FT_LOAD_RENDER, threshold=0):
+    face.load_char(char, load_flags)
+    bitmap = face.glyph.bitmap
+    actual_width = forced_width if forced_width else bitmap.width
+    return actual_width, pack_bitmap(bitmap, actual_width, height, threshold)
+
+
+# Renders char_list into a GlyphSet without writing any files.
+# With forced_width every glyph gets that cell width (Idk2.py behaviour); without it
+# each glyph keeps its natural bitmap width, which is what proportional layouts want.
+# pixel_size renders at a different size than the cell height (default: the same).
+def render_glyphset(ttf_path, char_list, forced_width=None, height=13, face=None,
+                    load_flags=freetype.FT_LOAD_RENDER, threshold=0, pixel_size=None):
+    if face is None:
+        face = freetype.Face(ttf_path)
+    face.set_pixel_sizes(0, pixel_size or height)
+
+    glyphs = GlyphSet(bit_order="lsb")
+    for char in char_list:
+        actual_width, bits = render_glyph(face, char, forced_width, height, load_flags, threshold)
+        glyphs.add(char, actual_width, height, bits)
+
+    return glyphs
+
+
+if __name__ == "__main__":
+    from golden import GOLDEN_CHARS, SYNTHETIC_FONT, check_against_golden
+
+    # The numpy packer must stay bit-exact with Idk2.py
+    glyphs = render_glyphset(SYNTHETIC_FONT, GOLDEN_CHARS, forced_width=7, height=13)
+    check_against_golden("Idk2", glyphs)
@@ -0,0 +1,262 @@
+import os
+import struct
+import sys
+from array import array
+
+# Compact in-memory container for a whole run of glyphs.
+# The packed rows of every glyph live back-to-back in a single bytearray, and the
+# per-glyph width, height, offset and size are kept in parallel typed arrays, so
+# thousands of glyphs cost a handful of Python objects instead of one list each.
+#
+# bit_order describes how pixels are packed inside each byte:
+#   "lsb" - XBM layout, pixel x of a row lives in (1 << (x % 8)) of byte x // 8
+#   "msb" - testing.py header layout, pixel x is bit (width - 1 - x) of the row value,
+#           stored big-endian across the row bytes
+# For the vertical layouts, "lsb" puts the topmost pixel of each byte in bit 0 and
+# "msb" puts it in bit 7.
+#
+# layout says how the bytes walk the glyph (see transcode.py for the conversions):
+#   "row"    - one run of horizontal bytes per row, top row first (every converter here)
+#   "column" - one run of vertical bytes per column, left column first
+#   "page"   - 8-row bands, one vertical byte per column (SSD1306/ST7565 GDDRAM order)
+class GlyphSet:
+    def __init__(self, bit_order="lsb", layout="row"):
+        self.bit_order = bit_order
+        self.layout = layout
+        self.chars = []
+        self.widths = array("H")
+        self.heights = array("H")
+        self.offsets = array("I")
+        self.sizes = array("I")
+        self.data = bytearray()
+        self._index = {}
+
+    def __len__(self):
+        return len(self.chars)
+
+    def __contains__(self, char):
+        return char in self._index
+
+    def __iter__(self):
+        return iter(self.chars)
+
+    # Adds (or replaces) a glyph. bits is any bytes-like object holding the packed rows.
+    # A replaced glyph keeps its position; its old bytes are simply left unreferenced.
+    def add(self, char, width, height, bits):
+        offset = len(self.data)
+        self.data += bits
+
+        i = self._index.get(char)
+        if i is None:
+            self._index[char] = len(self.chars)
+            self.chars.append(char)
+            self.widths.append(width)
+            self.heights.append(height)
+            self.offsets.append(offset)
+            self.sizes.append(len(bits))
+        else:
+            self.widths[i] = width
+            self.heights[i] = height
+            self.offsets[i] = offset
+            self.sizes[i] = len(bits)
+
+    def index(self, char):
+        return self._index[char]
+
+    # Returns (width, height, packed_bits) for a glyph.
+    def get(self, char):
+        i = self._index[char]
+        start = self.offsets[i]
+        return self.widths[i], self.heights[i], bytes(self.data[start:start + self.sizes[i]])
+
+    def bytes_per_row(self, char):
+        return (self.widths[self._index[char]] + 7) // 8
+
+    # Unpacks one glyph into a list of rows of 0/1 pixels, honouring bit_order.
+    # Only the "row" layout is handled here; use transcode.py for the others.
+    def pixel_rows(self, char):
+        if self.layout != "row":
+            raise ValueError(f"pixel_rows needs a row layout GlyphSet, not {self.layout!r}")
+        width, height, bits = self.get(char)
+        bytes_per_row = (width + 7) // 8
+        rows = []
+        for row in range(height):
+            chunk = bits[row * bytes_per_row:(row + 1) * bytes_per_row]
+            if len(chunk) < bytes_per_row:
+                rows.append([0] * width)
+                continue
+            value = int.from_bytes(chunk, "little" if self.bit_order == "lsb" else "big")
+            if self.bit_order == "lsb":
+                rows.append([(value >> col) & 1 for col in range(width)])
+            else:
+                rows.append([(value >> (width - 1 - col)) & 1 for col in range(width)])
+        return rows
+
+
+# Pure-Python equivalent of glyph_render.pack_bitmap for a raw 8-bit coverage buffer
+# (or, with mono, a 1bpp MSB-first buffer from an embedded strike).
+# Kept free of numpy so tiny jobs (a single glyph in CI) do not pay for importing it.
+def pack_rows(buffer, pitch, rows, cols, forced_width, height, mono=False):
+    bytes_per_row = (forced_width + 7) // 8
+    packed = bytearray(bytes_per_row * height)
+    for row in range(min(height, rows)):
+        base = row * pitch
+        for col in range(min(forced_width, cols)):
+            ink = buffer[base + col // 8] & (0x80 >> (col % 8)) if mono else buffer[base + col]
+            if ink:
+                packed[row * bytes_per_row + col // 8] |= 1 << (col % 8)
+    return bytes(packed)
+
+
+# Writes every glyph as its own {char}.xbm file, in the same format as write_xbm_file.
+def write_xbm_dir(glyphs, output_dir="output"):
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+
+    for char in glyphs:
+        width, height, bits = glyphs.get(char)
+        # C has no empty arrays; readers take the glyph size from the #defines
+        bits = bits or b"\x00"
+        file_name = os.path.join(output_dir, f"{char}.xbm")
+        with open(file_name, "w") as f:
+            f.write(f"#define {char}_width {width}\n")
+            f.write(f"#define {char}_height {height}\n")
+            f.write(f"static char {char}_bits[] = {{\n")
+
+            # Write bytes in XBM format with max 12 bytes per line for readability
+            for i, byte in enumerate(bits):
+                f.write(f"0x{byte:02x}")
+                if i < len(bits) - 1:
+                    f.write(", ")
+                if (i + 1) % 12 == 0:
+                    f.write("\n")
+            f.write("\n};\n")
+
+    print(f"{len(glyphs)} XBM files saved in {output_dir}.")
+
+
+# Writes a whole GlyphSet as one C header, using the char_{code} naming of testing.py's write_c_header.
+# The bytes are written exactly as stored, so xbm_reader.load_c_header reads them back unchanged.
+# comments optionally maps a char to a note written above its block (e.g. the source font).
+def write_glyphset_header(glyphs, output_file, comments=None):
+    with open(output_file, "w") as header_file:
+        header_file.write(f"/* {len(glyphs)} glyphs, bit order: {glyphs.bit_order}, layout: {glyphs.layout} */\n\n")
+        for char in glyphs:
+            width, height, bits = glyphs.get(char)
+            if comments and char in comments:
+                header_file.write(f"/* {comments[char]} */\n")
+            header_file.write(f"#define char_{ord(char)}_width {width}\n")
+            header_file.write(f"#define char_{ord(char)}_height {height}\n")
+            header_file.write(f"static unsigned char char_{ord(char)}_bits[] = {{\n")
+            # A zero-width glyph (natural-width space) still needs one byte to be valid C
+            hex_values = [f"0x{byte:02x}" for byte in bits] or ["0x00"]
+            header_file.write(f"   {', '.join(hex_values)}\n")
+            header_file.write("};\n\n")
+
+    print(f"Header with {len(glyphs)} glyphs saved as {output_file}.")
+
+
+_PACK_MAGIC = b"GPK1"
+_BIT_ORDERS = ("lsb", "msb")
+_LAYOUTS = ("row", "column", "page")
+
+
+# Typed arrays are written little-endian regardless of the host.
+def pack_array(values):
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def unpack_array(typecode, data):
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+# Writes a GlyphSet as a binary glyph pack:
+#   "GPK1", bit order (u8), layout (u8), 2 pad bytes, glyph count (u32),
+#   codepoints (u32[n]), widths (u16[n]), heights (u16[n]), offsets (u32[n]), sizes (u32[n]),
+#   data length (u32), packed data,
+# followed by optional tagged sections (4-byte tag, u32 length, payload) such as metrics.
+# All integers are little-endian.
+def write_glyph_pack(glyphs, output_file, sections=None):
+    # Compact the data so orphaned bytes from replaced glyphs are not written out
+    data = bytearray()
+    offsets = array("I")
+    for i in range(len(glyphs)):
+        offsets.append(len(data))
+        data += glyphs.data[glyphs.offsets[i]:glyphs.offsets[i] + glyphs.sizes[i]]
+
+    with open(output_file, "wb") as f:
+        f.write(_PACK_MAGIC + struct.pack("<BB2xI", _BIT_ORDERS.index(glyphs.bit_order),
+                                             _LAYOUTS.index(glyphs.layout), len(glyphs)))
+        f.write(pack_array(array("I", (ord(char) for char in glyphs.chars))))
+        f.write(pack_array(glyphs.widths))
+        f.write(pack_array(glyphs.heights))
+        f.write(pack_array(offsets))
+        f.write(pack_array(glyphs.sizes))
+        f.write(struct.pack("<I", len(data)))
+        f.write(data)
+        for tag, payload in (sections or {}).items():
+            f.write(struct.pack("<4sI", tag, len(payload)))
+            f.write(payload)
+
+    print(f"Glyph pack with {len(glyphs)} glyphs saved as {output_file}.")
+
+
+# Reads a binary glyph pack. Returns (GlyphSet, {tag: payload}) for any extra sections.
+def read_glyph_pack(file_name):
+    with open(file_name, "rb") as f:
+        blob = f.read()
+
+    if blob[:4] != _PACK_MAGIC:
+        raise ValueError(f"{file_name} is not a glyph pack")
+    order, layout, count = struct.unpack_from("<BB2xI", blob, 4)
+    pos = 12
+
+    def take(typecode, itemsize):
+        nonlocal pos
+        values = unpack_array(typecode, blob[pos:pos + itemsize * count])
+        pos += itemsize * count
+        return values
+
+    codepoints = take("I", 4)
+    glyphs = GlyphSet(bit_order=_BIT_ORDERS[order], layout=_LAYOUTS[layout])
+    glyphs.widths = take("H", 2)
+    glyphs.heights = take("H", 2)
+    glyphs.offsets = take("I", 4)
+    glyphs.sizes = take("I", 4)
+    (data_length,) = struct.unpack_from("<I", blob, pos)
+    pos += 4
+    glyphs.data = bytearray(blob[pos:pos + data_length])
+    pos += data_length
+    glyphs.chars = [chr(code) for code in codepoints]
+    glyphs._index = {char: i for i, char in enumerate(glyphs.chars)}
+
+    sections = {}
+    while pos < len(blob):
+        tag, length = struct.unpack_from("<4sI", blob, pos)
+        pos += 8
+        sections[tag] = blob[pos:pos + length]
+        pos += length
+
+    return glyphs, sections
+
+
+# Saves a GlyphSet in the format implied by the output path:
+# "*.h" -> one C header, "*.gpk" -> binary glyph pack, anything else -> directory of .xbm files.
+def save_glyphset(glyphs, output, sections=None, comments=None):
+    directory = os.path.dirname(output)
+    if output.endswith((".h", ".gpk")) and directory and not os.path.exists(directory):
+        os.makedirs(directory)
+
+    if output.endswith(".h"):
+        write_glyphset_header(glyphs, output, comments)
+    elif output.endswith(".gpk"):
+        write_glyph_pack(glyphs, output, sections)
+    else:
+        write_xbm_dir(glyphs, output)
@@ -0,0 +1,230 @@
+import contextlib
+import importlib.util
+import io
+import os
+import sys
+
+from glyphset import GlyphSet, write_glyphset_header
+from xbm_reader import load_c_header
+
+# Golden-output regression harness.
+# Every converter variant in this repo packs bits its own way, so each one is run
+# against the bundled synthetic font and its packed output is stored under golden/.
+# New fast paths pick one variant as their reference in FAST_PATHS and must match it bit
+# for bit.
+#
+# The stored goldens depend on the FreeType rasterizer; regenerate them with
+# "python golden.py --update" after upgrading freetype-py and review the diff.
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+SYNTHETIC_FONT = os.path.join(REPO_DIR, "fonts", "synthetic.ttf")
+GOLDEN_DIR = os.path.join(REPO_DIR, "golden")
+GOLDEN_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789.- "
+
+# variant name -> (source file, convert kwargs, bit order)
+VARIANTS = {
+    "WORKING": ("WORKING.py", {"forced_width": 7, "forced_height": 13}, "lsb"),
+    "Round2": ("Round2.py", {"forced_width": 7, "forced_height": 13}, "lsb"),
+    "Multibyte": ("Multibyte.py", {"width": 7, "height": 13}, "lsb"),
+    "Idk2": ("Idk2.py", {"forced_width": 7, "height": 13}, "lsb"),
+    "ttf_xbm": ("ttf_xbm.py", {"width": 7, "height": 13}, "lsb"),
+    "tf2": ("tf2.py", {"max_width": 7, "height": 13}, "lsb"),
+    "pynew": ("pynew.py", {"max_width": 7, "height": 13}, "lsb"),
+    "testing": ("testing.py", {"grid_size": (7, 13)}, "msb"),
+}
+
+
+# Fast path renderers, each called as fn(font_path, chars) -> GlyphSet for a 7x13 cell.
+# Imported on use so the harness itself only needs the variants' dependencies.
+def _render_glyph_render(font_path, chars):
+    from glyph_render import render_glyphset
+    return render_glyphset(font_path, chars, forced_width=7, height=13)
+
+
+def _render_pack_rows(font_path, chars):
+    import freetype
+    from ttf_xbm_cli import render_small_job
+    return render_small_job(freetype.Face(font_path), chars, 7, 13)
+
+
+# place_glyphs with every origin at the cell's top-left corner is the "top" copy of the
+# original scripts, so the vectorized scatter and PACKERS["row"] can be held to Idk2.
+def _render_place_glyphs(font_path, chars):
+    import freetype
+    import numpy as np
+    from placement import collect_bitmaps, place_glyphs
+    from transcode import PACKERS
+
+    face = freetype.Face(font_path)
+    face.set_pixel_sizes(0, 13)
+    bitmaps, _, _, _ = collect_bitmaps(face, chars)
+    origins = np.zeros(len(chars), dtype=np.int64)
+    cells, _ = place_glyphs(bitmaps, origins, origins, 13, 7, baseline=0)
+    glyphs = GlyphSet(bit_order="lsb")
+    for char, bits in zip(chars, PACKERS["row"](cells, "lsb")):
+        glyphs.add(char, 7, 13, bits.tobytes())
+    return glyphs
+
+
+# fast path name -> (reference variant, renderer)
+FAST_PATHS = {
+    "glyph_render": ("Idk2", _render_glyph_render),
+    "pack_rows": ("Idk2", _render_pack_rows),
+    "place_glyphs": ("Idk2", _render_place_glyphs),
+}
+
+_modules = {}
+
+
+# Imports a variant script by path (several of them are not importable by name).
+def load_variant(name):
+    if name not in _modules:
+        source = VARIANTS[name][0]
+        spec = importlib.util.spec_from_file_location(f"variant_{name}", os.path.join(REPO_DIR, source))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _modules[name] = module
+    return _modules[name]
+
+
+# Runs a variant's own conversion function, capturing what it would have written to disk.
+# Each character is converted on its own so a crash on one glyph (WORKING.py cannot
+# resize an empty bitmap, for instance) is recorded instead of aborting the whole run.
+# Returns (GlyphSet, {char: error message}).
+def render_variant(name, font_path=SYNTHETIC_FONT, chars=GOLDEN_CHARS):
+    _, kwargs, bit_order = VARIANTS[name]
+    module = load_variant(name)
+    glyphs = GlyphSet(bit_order=bit_order)
+    errors = {}
+
+    def capture_xbm(char, xbm_data, width, height, output_dir=None):
+        glyphs.add(char, width, height, bytes(xbm_data))
+
+    def capture_header(output_file, char_code, bitmap_data, grid_width, grid_height):
+        bytes_per_row = (grid_width + 7) // 8
+        bits = b"".join(value.to_bytes(bytes_per_row, "big") for value in bitmap_data)
+        glyphs.add(chr(char_code), grid_width, grid_height, bits)
+
+    if name == "testing":
+        module.write_c_header = capture_header
+    else:
+        module.write_xbm_file = capture_xbm
+
+    for char in chars:
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                if name == "testing":
+                    module.generate_c_header(font_path, None, char, kwargs["grid_size"])
+                else:
+                    module.convert_ttf_to_xbm(font_path, char, **kwargs)
+        except Exception as e:
+            errors[char] = f"{type(e).__name__}: {e}"
+
+    return glyphs, errors
+
+
+def golden_path(name):
+    return os.path.join(GOLDEN_DIR, f"{name}.h")
+
+
+def load_golden(name):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return load_c_header(golden_path(name), bit_order=VARIANTS[name][2])
+
+
+def update_golden(names=None):
+    if not os.path.exists(GOLDEN_DIR):
+        os.makedirs(GOLDEN_DIR)
+
+    for name in names or VARIANTS:
+        glyphs, errors = render_variant(name)
+        with contextlib.redirect_stdout(io.StringIO()):
+            write_glyphset_header(glyphs, golden_path(name))
+        print(f"{name}: {len(glyphs)} golden glyphs written, {len(errors)} failed ({''.join(errors)!r}).")
+
+
+# Renders expected and actual side by side plus a diff column:
+# "#" ink in both, "-" ink only in expected, "+" ink only in actual.
+def visual_diff(expected, actual, char):
+    expected_rows = expected.pixel_rows(char)
+    actual_rows = actual.pixel_rows(char)
+    height = max(len(expected_rows), len(actual_rows))
+    width = max([len(row) for row in expected_rows + actual_rows] or [0])
+
+    lines = [f"{'expected'.ljust(width)}  {'actual'.ljust(width)}  diff"]
+    for row in range(height):
+        e = expected_rows[row] if row < len(expected_rows) else []
+        a = actual_rows[row] if row < len(actual_rows) else []
+        e = e + [0] * (width - len(e))
+        a = a + [0] * (width - len(a))
+        diff = "".join("#" if x and y else "-" if x else "+" if y else "." for x, y in zip(e, a))
+        lines.append(f"{''.join('#' if x else '.' for x in e)}  {''.join('#' if y else '.' for y in a)}  {diff}")
+    return "\n".join(lines)
+
+
+# Compares two GlyphSets bit for bit. Returns a list of (char, reason) mismatches.
+def compare_glyphsets(expected, actual):
+    mismatches = []
+    for char in expected:
+        if char not in actual:
+            mismatches.append((char, "missing"))
+            continue
+        e_width, e_height, e_bits = expected.get(char)
+        a_width, a_height, a_bits = actual.get(char)
+        if (e_width, e_height) != (a_width, a_height):
+            mismatches.append((char, f"size {a_width}x{a_height}, expected {e_width}x{e_height}"))
+        elif expected.bit_order != actual.bit_order:
+            if expected.pixel_rows(char) != actual.pixel_rows(char):
+                mismatches.append((char, "pixels differ"))
+        elif bytes(e_bits) != bytes(a_bits):
+            mismatches.append((char, "pixels differ"))
+    for char in actual:
+        if char not in expected:
+            mismatches.append((char, "unexpected"))
+    return mismatches
+
+
+# Checks a fast path's output against the golden of its chosen reference variant.
+# Prints a visual diff for every mismatching glyph and returns True when bit-exact.
+def check_against_golden(reference, glyphs):
+    expected = load_golden(reference)
+    mismatches = compare_glyphsets(expected, glyphs)
+    for char, reason in mismatches:
+        print(f"Mismatch for {char!r} against {reference}: {reason}")
+        if char in expected and char in glyphs:
+            print(visual_diff(expected, glyphs, char))
+    if not mismatches:
+        print(f"All {len(expected)} glyphs match the {reference} golden output.")
+    return not mismatches
+
+
+# Renders a fast path the way its GlyphSet would be produced for a real job.
+def render_fast_path(name, font_path=SYNTHETIC_FONT, chars=GOLDEN_CHARS):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return FAST_PATHS[name][1](font_path, chars)
+
+
+# Re-runs every variant against its own golden output and every fast path against its
+# reference. Returns the names that failed.
+def check_all():
+    failed = []
+    for name in VARIANTS:
+        print(f"\n== {name}")
+        if not check_against_golden(name, render_variant(name)[0]):
+            failed.append(name)
+    for name, (reference, _) in FAST_PATHS.items():
+        print(f"\n== {name} (reference {reference})")
+        if not check_against_golden(reference, render_fast_path(name)):
+            failed.append(name)
+    return failed
+
+
+if __name__ == "__main__":
+    if "--update" in sys.argv:
+        update_golden()
+        sys.exit(0)
+
+    failed = check_all()
+    if failed:
+        print(f"\nOut of date: {', '.join(failed)}")
+        sys.exit(1)
@@ -0,0 +1,236 @@
+/* 39 glyphs, bit order: lsb */
+
+#define char_65_width 7
+#define char_65_height 13
+static unsigned char char_65_bits[] = {
+   0x7e, 0x7f, 0x43, 0x43, 0x7f, 0x7f, 0x43, 0x43, 0x43, 0x43, 0x43, 0x00, 0x00
+};
+
+#define char_66_width 7
+#define char_66_height 13
+static unsigned char char_66_bits[] = {
+   0x7f, 0x7f, 0x43, 0x43, 0x7f, 0x7f, 0x43, 0x43, 0x43, 0x7f, 0x7f, 0x00, 0x00
+};
+
+#define char_67_width 7
+#define char_67_height 13
+static unsigned char char_67_bits[] = {
+   0x7e, 0x7f, 0x43, 0x03, 0x03, 0x03, 0x03, 0x03, 0x43, 0x7f, 0x7e, 0x00, 0x00
+};
+
+#define char_68_width 7
+#define char_68_height 13
+static unsigned char char_68_bits[] = {
+   0x7f, 0x7f, 0x43, 0x43, 0x43, 0x43, 0x43, 0x43, 0x43, 0x7f, 0x7f, 0x00, 0x00
+};
+
+#define char_69_width 7
+#define char_69_height 13
+static unsigned char char_69_bits[] = {
+   0x7f, 0x7f, 0x03, 0x03, 0x7f, 0x7f, 0x03, 0x03, 0x03, 0x7f, 0x7f, 0x00, 0x00
+};
+
+#define char_70_width 7
+#define char_70_height 13
+static unsigned char char_70_bits[] = {
+   0x7f, 0x7f, 0x03, 0x03, 0x7f, 0x7f, 0x03, 0x03, 0x03, 0x03, 0x03, 0x00, 0x00
+};
+
+#define char_71_width 7
+#define char_71_height 13
+static unsigned char char_71_bits[] = {
+   0x7e, 0x7f, 0x43, 0x03, 0x7b, 0x7b, 0x43, 0x43, 0x43, 0x7f, 0x7e, 0x00, 0x00
+};
+
+#define char_72_width 7
+#define char_72_height 13
+static unsigned char char_72_bits[] = {
+   0x43, 0x43, 0x43, 0x43, 0x7f, 0x7f, 0x43, 0x43, 0x43, 0x43, 0x43, 0x00, 0x00
+};
+
+#define char_73_width 7
+#define char_73_height 13
+static unsigned char char_73_bits[] = {
+   0x3f, 0x3f, 0x0c, 0x0c, 0x0c, 0x0c, 0x0c, 0x0c, 0x0c, 0x3f, 0x3f, 0x00, 0x00
+};
+
+#define char_74_width 7
+#define char_74_height 13
+static unsigned char char_74_bits[] = {
+   0x78, 0x78, 0x60, 0x60, 0x60, 0x60, 0x60, 0x60, 0x63, 0x7f, 0x1c, 0x00, 0x00
+};
+
+#define char_75_width 7
+#define char_75_height 13
+static unsigned char char_75_bits[] = {
+   0x43, 0x63, 0x63, 0x1b, 0x1f, 0x07, 0x1b, 0x1b, 0x63, 0x63, 0x43, 0x00, 0x00
+};
+
+#define char_76_width 7
+#define char_76_height 13
+static unsigned char char_76_bits[] = {
+   0x03, 0x03, 0x03, 0x03, 0x03, 0x03, 0x03, 0x03, 0x03, 0x7f, 0x7f, 0x00, 0x00
+};
+
+#define char_77_width 7
+#define char_77_height 13
+static unsigned char char_77_bits[] = {
+   0x43, 0x67, 0x67, 0x5b, 0x5b, 0x5b, 0x43, 0x43, 0x43, 0x43, 0x43, 0x00, 0x00
+};
+
+#define char_78_width 7
+#define char_78_height 13
+static unsigned char char_78_bits[] = {
+   0x43, 0x43, 0x43, 0x47, 0x5f, 0x5b, 0x63, 0x63, 0x43, 0x43, 0x43, 0x00, 0x00
+};
+
+#define char_79_width 7
+#define char_79_height 13
+static unsigned char char_79_bits[] = {
+   0x7e, 0x7f, 0x43, 0x43, 0x43, 0x43, 0x43, 0x43, 0x43, 0x7f, 0x7e, 0x00, 0x00
+};
+
+#define char_80_width 7
+#define char_80_height 13
+static unsigned char char_80_bits[] = {
+   0x7f, 0x7f, 0x43, 0x43, 0x7f, 0x7f, 0x03, 0x03, 0x03, 0x03, 0x03, 0x00, 0x00
+};
+
+#define char_81_width 7
+#define char_81_height 13
+static unsigned char char_81_bits[] = {
+   0x7c, 0x7f, 0x43, 0x43, 0x43, 0x43, 0x5b, 0x5b, 0x63, 0x7f, 0x5c, 0x00, 0x00
+};
+
+#define char_82_width 7
+#define char_82_height 13
+static unsigned char char_82_bits[] = {
+   0x7f, 0x7f, 0x43, 0x43, 0x7f, 0x7f, 0x1b, 0x1b, 0x63, 0x63, 0x43, 0x00, 0x00
+};
+
+#define char_83_width 7
+#define char_83_height 13
+static unsigned char char_83_bits[] = {
+   0x7e, 0x7f, 0x03, 0x03, 0x7f, 0x7e, 0x40, 0x40, 0x40, 0x7f, 0x7f, 0x00, 0x00
+};
+
+#define char_84_width 7
+#define char_84_height 13
+static unsigned char char_84_bits[] = {
+   0x7f, 0x7f, 0x18, 0x18, 0x18, 0x18, 0x18, 0x18, 0x18, 0x18, 0x18, 0x00, 0x00
+};
+
+#define char_85_width 7
+#define char_85_height 13
+static unsigned char char_85_bits[] = {
+   0x43, 0x43, 0x43, 0x43, 0x43, 0x43, 0x43, 0x43, 0x43, 0x7f, 0x7e, 0x00, 0x00
+};
+
+#define char_86_width 7
+#define char_86_height 13
+static unsigned char char_86_bits[] = {
+   0x43, 0x43, 0x43, 0x43, 0x43, 0x43, 0x43, 0x43, 0x66, 0x7e, 0x18, 0x00, 0x00
+};
+
+#define char_87_width 7
+#define char_87_height 13
+static unsigned char char_87_bits[] = {
+   0x43, 0x43, 0x43, 0x43, 0x5b, 0x5b, 0x5b, 0x5b, 0x5b, 0x7f, 0x66, 0x00, 0x00
+};
+
+#define char_88_width 7
+#define char_88_height 13
+static unsigned char char_88_bits[] = {
+   0x43, 0x43, 0x43, 0x66, 0x7e, 0x18, 0x66, 0x66, 0x43, 0x43, 0x43, 0x00, 0x00
+};
+
+#define char_89_width 7
+#define char_89_height 13
+static unsigned char char_89_bits[] = {
+   0x43, 0x43, 0x43, 0x66, 0x7e, 0x18, 0x18, 0x18, 0x18, 0x18, 0x18, 0x00, 0x00
+};
+
+#define char_90_width 7
+#define char_90_height 13
+static unsigned char char_90_bits[] = {
+   0x7f, 0x7f, 0x40, 0x60, 0x78, 0x18, 0x06, 0x06, 0x03, 0x7f, 0x7f, 0x00, 0x00
+};
+
+#define char_48_width 7
+#define char_48_height 13
+static unsigned char char_48_bits[] = {
+   0x7e, 0x7f, 0x43, 0x63, 0x7b, 0x5b, 0x47, 0x47, 0x43, 0x7f, 0x7e, 0x00, 0x00
+};
+
+#define char_49_width 7
+#define char_49_height 13
+static unsigned char char_49_bits[] = {
+   0x06, 0x07, 0x07, 0x06, 0x06, 0x06, 0x06, 0x06, 0x06, 0x1f, 0x1f, 0x00, 0x00
+};
+
+#define char_50_width 7
+#define char_50_height 13
+static unsigned char char_50_bits[] = {
+   0x7e, 0x7f, 0x43, 0x40, 0x60, 0x60, 0x18, 0x18, 0x06, 0x7f, 0x7f, 0x00, 0x00
+};
+
+#define char_51_width 7
+#define char_51_height 13
+static unsigned char char_51_bits[] = {
+   0x7f, 0x7f, 0x60, 0x18, 0x78, 0x60, 0x40, 0x40, 0x43, 0x7f, 0x7e, 0x00, 0x00
+};
+
+#define char_52_width 7
+#define char_52_height 13
+static unsigned char char_52_bits[] = {
+   0x30, 0x38, 0x38, 0x36, 0x37, 0x33, 0x7f, 0x7f, 0x30, 0x30, 0x30, 0x00, 0x00
+};
+
+#define char_53_width 7
+#define char_53_height 13
+static unsigned char char_53_bits[] = {
+   0x7f, 0x7f, 0x03, 0x7f, 0x7f, 0x40, 0x40, 0x40, 0x43, 0x7f, 0x7e, 0x00, 0x00
+};
+
+#define char_54_width 7
+#define char_54_height 13
+static unsigned char char_54_bits[] = {
+   0x38, 0x3e, 0x06, 0x03, 0x3f, 0x3f, 0x43, 0x43, 0x43, 0x7f, 0x3e, 0x00, 0x00
+};
+
+#define char_55_width 7
+#define char_55_height 13
+static unsigned char char_55_bits[] = {
+   0x7f, 0x7f, 0x00, 0x60, 0x78, 0x18, 0x0c, 0x0c, 0x0c, 0x0c, 0x0c, 0x00, 0x00
+};
+
+#define char_56_width 7
+#define char_56_height 13
+static unsigned char char_56_bits[] = {
+   0x7e, 0x7f, 0x43, 0x43, 0x7f, 0x7e, 0x43, 0x43, 0x43, 0x7f, 0x7e, 0x00, 0x00
+};
+
+#define char_57_width 7
+#define char_57_height 13
+static unsigned char char_57_bits[] = {
+   0x7c, 0x7f, 0x43, 0x43, 0x7f, 0x7c, 0x40, 0x40, 0x60, 0x7c, 0x1c, 0x00, 0x00
+};
+
+#define char_46_width 7
+#define char_46_height 13
+static unsigned char char_46_bits[] = {
+   0x07, 0x07, 0x07, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00
+};
+
+#define char_45_width 7
+#define char_45_height 13
+static unsigned char char_45_bits[] = {
+   0x7f, 0x7f, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00
+};
+
+#define char_32_width 7
+#define char_32_height 13
+static unsigned char char_32_bits[] = {
+   0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00
+};
+
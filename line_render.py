@@ -0,0 +1,172 @@
+import os
+
+import freetype
+import numpy as np
+
+from glyph_render import pack_bitmap
+from metrics import KerningTable, extract_kerning
+
+# Pre-renders whole strings (static UI labels) into packed 1bpp line buffers on the host,
+# so the device can blit one XBM per label instead of composing it glyph by glyph.
+#
+# Each glyph is rendered and packed once, then cached. Kerning comes from
+# metrics.extract_kerning (GPOS first, then the 'kern' table), so labels are kerned exactly
+# like the exported kerning tables describe. Lines are built by shifting the
+# packed glyph rows by (x % 8) bits and OR-ing them into the line buffer, one numpy
+# operation per glyph for all of its rows. Output rows are LSB-first like every XBM here.
+#
+# height is the pixel size. Lines default to ascender + descender rows with the baseline
+# at the ascender, so descenders fit; line_height and baseline override that for a fixed
+# label height, and any ink that then falls outside the line is counted and reported.
+class LineRenderer:
+    def __init__(self, ttf_path, height=13, face=None, line_height=None, baseline=None):
+        self.face = face if face is not None else freetype.Face(ttf_path)
+        self.face.set_pixel_sizes(0, height)
+        self.height = height
+        ascender = (self.face.size.ascender + 63) >> 6
+        descender = -(self.face.size.descender >> 6)
+        self.baseline = ascender if baseline is None else baseline
+        self.line_height = ascender + descender if line_height is None else line_height
+        self.clipped = {}     # text -> ink pixels that fell outside the line
+        self.ttf_path = ttf_path
+        self._glyphs = {}     # char -> (index, rows array, width, bitmap_left, bitmap_top, advance)
+        self._chars = []      # cached chars in the order the kerning table indexes them
+        self._kerning = KerningTable()
+
+    # Renders and caches any characters that have not been seen yet.
+    def _ensure(self, chars):
+        new = [char for char in dict.fromkeys(chars) if char not in self._glyphs]
+        if not new:
+            return
+        for char in new:
+            self.face.load_char(char)
+            glyph = self.face.glyph
+            bitmap = glyph.bitmap
+            bytes_per_row = (bitmap.width + 7) // 8
+            packed = pack_bitmap(bitmap, bitmap.width, bitmap.rows)
+            rows = np.frombuffer(packed, dtype=np.uint8).reshape(bitmap.rows, bytes_per_row)
+            self._glyphs[char] = (len(self._chars), rows, bitmap.width, glyph.bitmap_left, glyph.bitmap_top,
+                                  (glyph.advance.x + 32) >> 6)
+            self._chars.append(char)
+        self._kerning = extract_kerning(self.face, self.ttf_path, self._chars)
+
+    def _kern(self, left, right):
+        return self._kerning.lookup(self._glyphs[left][0], self._glyphs[right][0])
+
+    # Works out where every glyph of text lands. Returns ([(char, x, y)], line width).
+    def layout(self, text, spacing=0):
+        self._ensure(set(text))
+        placements = []
+        pen = 0
+        right = 0
+        previous = None
+        for char in text:
+            _, _, width, left, top, advance = self._glyphs[char]
+            if previous is not None:
+                pen += self._kern(previous, char) + spacing
+            x = pen + left
+            placements.append((char, x, self.baseline - top))
+            right = max(right, x + width, pen + advance)
+            pen += advance
+            previous = char
+
+        # Never let a negative left bearing push ink off the start of the line
+        shift = -min([x for _, x, _ in placements] + [0])
+        placements = [(char, x + shift, y) for char, x, y in placements]
+        return placements, right + shift
+
+    # Renders one string. Returns (width, line height, packed LSB-first rows).
+    def render_line(self, text, spacing=0):
+        placements, width = self.layout(text, spacing)
+        bytes_per_row = (width + 7) // 8
+
+        # One spare byte on the right absorbs the carry of the last shifted byte
+        line = np.zeros((self.line_height, bytes_per_row + 1), dtype=np.uint8)
+        clipped = 0
+        for char, x, y in placements:
+            rows = self._glyphs[char][1]
+            if not rows.size:
+                continue
+            top = max(y, 0)
+            bottom = min(y + rows.shape[0], self.line_height)
+            inside = rows[top - y:bottom - y] if top < bottom else rows[:0]
+            clipped += int(np.unpackbits(rows).sum()) - int(np.unpackbits(inside).sum())
+            if top >= bottom:
+                continue
+            src = rows[top - y:bottom - y].astype(np.uint16) << (x & 7)
+            start = x >> 3
+            span = src.shape[1]
+            line[top:bottom, start:start + span] |= (src & 0xff).astype(np.uint8)
+            line[top:bottom, start + 1:start + span + 1] |= (src >> 8).astype(np.uint8)
+
+        # Drop ink that spilled into padding bits past the line width
+        line = line[:, :bytes_per_row]
+        if width & 7:
+            line[:, -1] &= (1 << (width & 7)) - 1
+        if clipped:
+            self.clipped[text] = clipped
+            print(f"{text!r} loses {clipped} ink pixels outside the {self.line_height}-row line "
+                  f"(baseline {self.baseline}).")
+        return width, self.line_height, line.tobytes()
+
+    # Renders many labels in one call, sharing the glyph cache. labels maps name -> text.
+    # Returns {name: (width, height, packed rows)}.
+    def render_labels(self, labels, spacing=0):
+        self._ensure(set("".join(labels.values())))
+        return {name: self.render_line(text, spacing) for name, text in labels.items()}
+
+
+# Writes one pre-rendered label as an XBM file.
+def write_label_xbm(name, line, output_dir="output"):
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+
+    width, height, bits = line
+    # An empty label still needs one byte to be valid C
+    bits = bits or b"\x00"
+    file_name = os.path.join(output_dir, f"{name}.xbm")
+    with open(file_name, "w") as f:
+        f.write(f"#define {name}_width {width}\n")
+        f.write(f"#define {name}_height {height}\n")
+        f.write(f"static char {name}_bits[] = {{\n")
+
+        # Write bytes in XBM format with max 12 bytes per line for readability
+        for i, byte in enumerate(bits):
+            f.write(f"0x{byte:02x}")
+            if i < len(bits) - 1:
+                f.write(", ")
+            if (i + 1) % 12 == 0:
+                f.write("\n")
+        f.write("\n};\n")
+
+    print(f"XBM file for label '{name}' saved as {file_name}.")
+
+
+# Writes a batch of pre-rendered labels as a single C header.
+def write_label_header(lines, output_file):
+    with open(output_file, "w") as header_file:
+        for name, (width, height, bits) in lines.items():
+            header_file.write(f"#define {name}_width {width}\n")
+            header_file.write(f"#define {name}_height {height}\n")
+            header_file.write(f"static unsigned char {name}_bits[] = {{\n")
+            hex_values = [f"0x{byte:02x}" for byte in bits] or ["0x00"]
+            for i in range(0, len(hex_values), 12):
+                header_file.write(f"   {', '.join(hex_values[i:i + 12])},\n")
+            header_file.write("};\n\n")
+
+    print(f"Header with {len(lines)} labels saved as {output_file}.")
+
+
+if __name__ == "__main__":
+    # Path to the TTF font file
+    ttf_path = r"C:\Users\theda\OneDrive\Desktop\ttf_testuing\Courier.ttf"
+
+    # Static UI labels to pre-render (C identifier -> text)
+    labels = {
+        "label_menu": "MENU",
+        "label_settings": "SETTINGS",
+        "label_battery": "BATTERY LOW",
+    }
+
+    renderer = LineRenderer(ttf_path, height=13)
+    write_label_header(renderer.render_labels(labels), "labels.h")
@@ -0,0 +1,313 @@
+import os
+import struct
+
+# Builds a tiny TrueType font out of a 5x7 pixel design so the converters can be
+# exercised without shipping a real typeface. Every lit pixel run becomes a
+# rectangular contour, so FreeType renders crisp, predictable glyphs at any size.
+
+UNITS_PER_EM = 1024
+PIXEL = 128                  # font units per design pixel
+ADVANCE = 6 * PIXEL          # 5 pixel wide glyph plus one pixel of spacing
+ASCENDER = 8 * PIXEL
+DESCENDER = -2 * PIXEL
+
+# 5x7 designs, top row first. "#" is ink.
+GLYPHS = {
+    "A": [".###.", "#...#", "#...#", "#####", "#...#", "#...#", "#...#"],
+    "B": ["####.", "#...#", "#...#", "####.", "#...#", "#...#", "####."],
+    "C": [".###.", "#...#", "#....", "#....", "#....", "#...#", ".###."],
+    "D": ["####.", "#...#", "#...#", "#...#", "#...#", "#...#", "####."],
+    "E": ["#####", "#....", "#....", "####.", "#....", "#....", "#####"],
+    "F": ["#####", "#....", "#....", "####.", "#....", "#....", "#...."],
+    "G": [".###.", "#...#", "#....", "#.###", "#...#", "#...#", ".####"],
+    "H": ["#...#", "#...#", "#...#", "#####", "#...#", "#...#", "#...#"],
+    "I": [".###.", "..#..", "..#..", "..#..", "..#..", "..#..", ".###."],
+    "J": ["..###", "...#.", "...#.", "...#.", "...#.", "#..#.", ".##.."],
+    "K": ["#...#", "#..#.", "#.#..", "##...", "#.#..", "#..#.", "#...#"],
+    "L": ["#....", "#....", "#....", "#....", "#....", "#....", "#####"],
+    "M": ["#...#", "##.##", "#.#.#", "#.#.#", "#...#", "#...#", "#...#"],
+    "N": ["#...#", "#...#", "##..#", "#.#.#", "#..##", "#...#", "#...#"],
+    "O": [".###.", "#...#", "#...#", "#...#", "#...#", "#...#", ".###."],
+    "P": ["####.", "#...#", "#...#", "####.", "#....", "#....", "#...."],
+    "Q": [".###.", "#...#", "#...#", "#...#", "#.#.#", "#..#.", ".##.#"],
+    "R": ["####.", "#...#", "#...#", "####.", "#.#..", "#..#.", "#...#"],
+    "S": [".####", "#....", "#....", ".###.", "....#", "....#", "####."],
+    "T": ["#####", "..#..", "..#..", "..#..", "..#..", "..#..", "..#.."],
+    "U": ["#...#", "#...#", "#...#", "#...#", "#...#", "#...#", ".###."],
+    "V": ["#...#", "#...#", "#...#", "#...#", "#...#", ".#.#.", "..#.."],
+    "W": ["#...#", "#...#", "#...#", "#.#.#", "#.#.#", "#.#.#", ".#.#."],
+    "X": ["#...#", "#...#", ".#.#.", "..#..", ".#.#.", "#...#", "#...#"],
+    "Y": ["#...#", "#...#", ".#.#.", "..#..", "..#..", "..#..", "..#.."],
+    "Z": ["#####", "....#", "...#.", "..#..", ".#...", "#....", "#####"],
+    "0": [".###.", "#...#", "#..##", "#.#.#", "##..#", "#...#", ".###."],
+    "1": ["..#..", ".##..", "..#..", "..#..", "..#..", "..#..", ".###."],
+    "2": [".###.", "#...#", "....#", "...#.", "..#..", ".#...", "#####"],
+    "3": ["#####", "...#.", "..#..", "...#.", "....#", "#...#", ".###."],
+    "4": ["...#.", "..##.", ".#.#.", "#..#.", "#####", "...#.", "...#."],
+    "5": ["#####", "#....", "####.", "....#", "....#", "#...#", ".###."],
+    "6": ["..##.", ".#...", "#....", "####.", "#...#", "#...#", ".###."],
+    "7": ["#####", "....#", "...#.", "..#..", ".#...", ".#...", ".#..."],
+    "8": [".###.", "#...#", "#...#", ".###.", "#...#", "#...#", ".###."],
+    "9": [".###.", "#...#", "#...#", ".####", "....#", "...#.", ".##.."],
+    ".": [".....", ".....", ".....", ".....", ".....", ".##..", ".##.."],
+    "-": [".....", ".....", ".....", "#####", ".....", ".....", "....."],
+    " ": ["....."] * 7,
+}
+
+NOTDEF = ["#####", "#...#", "#...#", "#...#", "#...#", "#...#", "#####"]
+
+# Kerning pairs in font units, written to a format 0 'kern' table.
+KERNING = {
+    ("A", "V"): -PIXEL,
+    ("V", "A"): -PIXEL,
+    ("A", "T"): -PIXEL,
+    ("T", "A"): -PIXEL,
+    ("L", "T"): -PIXEL,
+    ("L", "V"): -PIXEL,
+    ("F", "."): -PIXEL,
+}
+
+
+# Turns a pixel design into rectangle contours (one per horizontal run of ink),
+# wound clockwise as TrueType expects for outer contours.
+def design_to_contours(design):
+    contours = []
+    for row, line in enumerate(design):
+        y1 = (len(design) - row) * PIXEL
+        y0 = y1 - PIXEL
+        col = 0
+        while col < len(line):
+            if line[col] != "#":
+                col += 1
+                continue
+            start = col
+            while col < len(line) and line[col] == "#":
+                col += 1
+            x0, x1 = start * PIXEL, col * PIXEL
+            contours.append([(x0, y0), (x0, y1), (x1, y1), (x1, y0)])
+    return contours
+
+
+# Encodes one simple glyph for the 'glyf' table (uncompressed flags and 16-bit deltas).
+def encode_glyph(contours):
+    if not contours:
+        return b""
+
+    points = [point for contour in contours for point in contour]
+    xs = [x for x, _ in points]
+    ys = [y for _, y in points]
+
+    data = struct.pack(">hhhhh", len(contours), min(xs), min(ys), max(xs), max(ys))
+    end = -1
+    for contour in contours:
+        end += len(contour)
+        data += struct.pack(">H", end)
+    data += struct.pack(">H", 0)                  # no instructions
+    data += bytes([0x01] * len(points))           # every point on-curve
+
+    prev = 0
+    for x in xs:
+        data += struct.pack(">h", x - prev)
+        prev = x
+    prev = 0
+    for y in ys:
+        data += struct.pack(">h", y - prev)
+        prev = y
+
+    return data + b"\0" * (-len(data) % 4)
+
+
+def table_checksum(data):
+    data += b"\0" * (-len(data) % 4)
+    return sum(struct.unpack(f">{len(data) // 4}I", data)) & 0xFFFFFFFF
+
+
+def _search_params(count, unit):
+    power = 1
+    exponent = 0
+    while power * 2 <= count:
+        power *= 2
+        exponent += 1
+    return power * unit, exponent, count * unit - power * unit
+
+
+def build_cmap(char_to_gid):
+    codes = sorted(ord(char) for char in char_to_gid)
+    gids = [char_to_gid[chr(code)] for code in codes]
+
+    # One segment per code point, plus the mandatory 0xFFFF terminator.
+    end_codes = codes + [0xFFFF]
+    start_codes = codes + [0xFFFF]
+    deltas = [(gid - code) & 0xFFFF for code, gid in zip(codes, gids)] + [1]
+    seg_count = len(end_codes)
+    search_range, entry_selector, range_shift = _search_params(seg_count, 2)
+
+    body = struct.pack(">HHHH", seg_count * 2, search_range, entry_selector, range_shift)
+    body += struct.pack(f">{seg_count}H", *end_codes) + b"\0\0"
+    body += struct.pack(f">{seg_count}H", *start_codes)
+    body += struct.pack(f">{seg_count}H", *deltas)
+    body += struct.pack(f">{seg_count}H", *([0] * seg_count))
+    subtable = struct.pack(">HHH", 4, 6 + len(body), 0) + body
+
+    return struct.pack(">HHHHI", 0, 1, 3, 1, 12) + subtable
+
+
+def build_kern(char_to_gid, kerning):
+    pairs = sorted((char_to_gid[left], char_to_gid[right], value) for (left, right), value in kerning.items())
+    search_range, entry_selector, range_shift = _search_params(len(pairs), 6)
+    subtable = struct.pack(">HHHH", len(pairs), search_range, entry_selector, range_shift)
+    for left, right, value in pairs:
+        subtable += struct.pack(">HHh", left, right, value)
+    header = struct.pack(">HHH", 0, 6 + len(subtable), 0x0001)
+    return struct.pack(">HH", 0, 1) + header + subtable
+
+
+def build_name(family, style):
+    records = [(1, family), (2, style), (4, f"{family} {style}"), (6, f"{family}-{style}")]
+    strings = b""
+    entries = b""
+    for name_id, text in records:
+        encoded = text.encode("utf-16-be")
+        entries += struct.pack(">HHHHHH", 3, 1, 0x409, name_id, len(encoded), len(strings))
+        strings += encoded
+    return struct.pack(">HHH", 0, len(records), 6 + len(entries)) + entries + strings
+
+
+# Builds EBLC/EBDT tables with one 1bpp strike per ppem (a multiple of 8, so every design
+# pixel becomes a whole square of pixels). Only the glyph ids in strike_gids get bitmaps;
+# FreeType renders the others from their outlines.
+def build_bitmap_strikes(designs, strike_gids, ppems):
+    # IndexSubTable format 1 covers a contiguous glyph id range, so split the ids into runs
+    runs = []
+    for gid in sorted(strike_gids):
+        if runs and runs[-1][-1] == gid - 1:
+            runs[-1].append(gid)
+        else:
+            runs.append([gid])
+
+    ebdt = struct.pack(">I", 0x00020000)
+    strikes = []
+    for ppem in ppems:
+        scale = ppem // 8
+        width, height = 5 * scale, 7 * scale
+        bytes_per_row = (width + 7) // 8
+
+        # IndexSubTableArray (one entry per run) followed by the subtables themselves
+        array = b""
+        subtables = b""
+        for run in runs:
+            image_offset = len(ebdt)
+            offsets = []
+            for gid in run:
+                offsets.append(len(ebdt) - image_offset)
+                # Image format 1: small metrics, byte-aligned MSB-first rows
+                ebdt += struct.pack(">BBbbB", height, width, 0, height, 6 * scale)
+                for line in designs[gid]:
+                    bits = "".join(("1" if pixel == "#" else "0") * scale for pixel in line)
+                    ebdt += (int(bits, 2) << (bytes_per_row * 8 - width)).to_bytes(bytes_per_row, "big") * scale
+            offsets.append(len(ebdt) - image_offset)
+            array += struct.pack(">HHI", run[0], run[-1], 8 * len(runs) + len(subtables))
+            subtables += struct.pack(f">HHI{len(offsets)}I", 1, 1, image_offset, *offsets)
+
+        # SbitLineMetrics: ascender, descender, widthMax, caret slope/offset, side bearings, pads
+        metrics = struct.pack(">bbBbbbbbbbbb", height, -2 * scale, width, 1, 0, 0, 0, scale, height, 0, 0, 0)
+        strikes.append((ppem, metrics, array + subtables))
+
+    eblc = struct.pack(">II", 0x00020000, len(strikes))
+    offset = len(eblc) + 48 * len(strikes)
+    for ppem, metrics, index_table in strikes:
+        eblc += struct.pack(">IIII", offset, len(index_table), len(runs), 0) + metrics + metrics
+        eblc += struct.pack(">HHBBBb", runs[0][0], runs[-1][-1], ppem, ppem, 1, 1)
+        offset += len(index_table)
+    return eblc + b"".join(index_table for _, _, index_table in strikes), ebdt
+
+
+# Assembles the sfnt tables for a font and returns {tag: bytes}.
+# strikes adds embedded 1bpp bitmaps at those ppems for the characters in strike_chars.
+def build_tables(family="Synthetic", style="Regular", glyphs=GLYPHS, kerning=KERNING, strikes=(),
+                 strike_chars="ABCDEFGHIJKLMNOPQRSTUVWXYZ"):
+    order = [".notdef"] + sorted(glyphs)
+    designs = [NOTDEF] + [glyphs[char] for char in sorted(glyphs)]
+    char_to_gid = {char: gid for gid, char in enumerate(order) if gid}
+
+    glyf = b""
+    loca = [0]
+    max_points = max_contours = 0
+    all_contours = []
+    for design in designs:
+        contours = design_to_contours(design)
+        all_contours.append(contours)
+        glyf += encode_glyph(contours)
+        loca.append(len(glyf))
+        max_points = max(max_points, 4 * len(contours))
+        max_contours = max(max_contours, len(contours))
+
+    lsbs = [min((x for contour in contours for x, _ in contour), default=0) for contours in all_contours]
+    num_glyphs = len(order)
+
+    tables = {}
+    tables["head"] = struct.pack(
+        ">IIIIHHqqhhhhHHhhh", 0x00010000, 0x00010000, 0, 0x5F0F3CF5, 0x000B, UNITS_PER_EM,
+        0, 0, 0, 0, 5 * PIXEL, 7 * PIXEL, 0, 8, 2, 1, 0)
+    tables["hhea"] = struct.pack(
+        ">IhhhHhhhhhhhhhhhH", 0x00010000, ASCENDER, DESCENDER, 0, ADVANCE, 0, PIXEL, 5 * PIXEL,
+        1, 0, 0, 0, 0, 0, 0, 0, num_glyphs)
+    tables["maxp"] = struct.pack(
+        ">IHHHHHHHHHHHHHH", 0x00010000, num_glyphs, max_points, max_contours, 0, 0, 2,
+        0, 0, 0, 0, 0, 0, 0, 0)
+    tables["OS/2"] = struct.pack(
+        ">HhHHH11h10s4I4sHHHhhhHH2IhhHHH", 4, ADVANCE, 400, 5, 0,
+        *([0] * 11), b"\0" * 10, 0, 0, 0, 0, b"NONE", 0x40, 0x20, 0x5A,
+        ASCENDER, DESCENDER, 0, ASCENDER, -DESCENDER, 1, 0, 5 * PIXEL, 7 * PIXEL, 0, 0x20, 1)
+    tables["hmtx"] = b"".join(struct.pack(">Hh", ADVANCE, lsb) for lsb in lsbs)
+    tables["cmap"] = build_cmap(char_to_gid)
+    tables["loca"] = struct.pack(f">{len(loca)}I", *loca)
+    tables["glyf"] = glyf
+    tables["name"] = build_name(family, style)
+    tables["post"] = struct.pack(">IIhhIIIII", 0x00030000, 0, -PIXEL, PIXEL // 2, 1, 0, 0, 0, 0)
+    if kerning:
+        tables["kern"] = build_kern(char_to_gid, kerning)
+    if strikes:
+        strike_gids = [char_to_gid[char] for char in strike_chars if char in char_to_gid]
+        tables["EBLC"], tables["EBDT"] = build_bitmap_strikes(designs, strike_gids, strikes)
+    return tables
+
+
+# Lays out tables behind an sfnt header starting at base_offset and fixes up head.checkSumAdjustment.
+def build_sfnt(tables, base_offset=0):
+    tags = sorted(tables)
+    search_range, entry_selector, range_shift = _search_params(len(tags), 16)
+    header = struct.pack(">IHHHH", 0x00010000, len(tags), search_range, entry_selector, range_shift)
+
+    offset = base_offset + len(header) + 16 * len(tags)
+    directory = b""
+    body = b""
+    for tag in tags:
+        data = tables[tag]
+        directory += struct.pack(">4sIII", tag.encode("ascii"), table_checksum(data), offset + len(body), len(data))
+        body += data + b"\0" * (-len(data) % 4)
+
+    font = bytearray(header + directory + body)
+    adjustment = (0xB1B0AFBA - table_checksum(bytes(font))) & 0xFFFFFFFF
+    head_offset = font.index(b"head") + 8
+    head_start = struct.unpack(">I", font[head_offset:head_offset + 4])[0] - base_offset
+    font[head_start + 8:head_start + 12] = struct.pack(">I", adjustment)
+    return bytes(font)
+
+
+def write_font(output_file, **kwargs):
+    directory = os.path.dirname(output_file)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+
+    with open(output_file, "wb") as f:
+        f.write(build_sfnt(build_tables(**kwargs)))
+
+    print(f"Synthetic font saved as {output_file}.")
+
+
+if __name__ == "__main__":
+    fonts_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fonts")
+    write_font(os.path.join(fonts_dir, "synthetic.ttf"))
+    # Same outlines plus 1bpp strikes for the letters at 8 and 16 ppem
+    write_font(os.path.join(fonts_dir, "synthetic_strikes.ttf"), style="Strikes", strikes=(8, 16))
@@ -0,0 +1,157 @@
+import json
+import os
+import sys
+import time
+from multiprocessing import Pool
+
+import freetype
+
+from glyph_render import render_glyph
+from glyphset import GlyphSet, save_glyphset
+
+# Builds many font/size/charset combinations from one JSON manifest on a shared worker pool.
+#
+# Manifest format:
+#   {
+#     "jobs": [
+#       {"font": "fonts/Courier.ttf", "sizes": [13, 16], "width": 7,
+#        "charset": "ABCDEFGHIJKLMNOPQRSTUVWXYZ", "output": "out/courier_{size}.h"},
+#       {"font": "fonts/NotoSans.ttf", "size": 22, "charset_file": "charsets/ui.txt",
+#        "output": "out/noto_{size}"}
+#     ]
+#   }
+#
+# "sizes" (or "size") are pixel heights, "width" forces the cell width (omit for natural
+# widths). "output" may use {size} and {width}; it ends in .h for a header, .gpk for a
+# glyph pack, and anything else is a directory of .xbm files. Relative paths are
+# resolved against the manifest's directory.
+#
+# Every job is split into chunks of glyphs, and all chunks from all jobs are fed to one
+# Pool, largest estimated cost first, so a few big CJK jobs do not leave cores idle at
+# the end. Each worker keeps its FreeType faces open, so jobs sharing a font file share
+# the parsed face.
+
+CHUNK_GLYPHS = 32
+
+_faces = {}
+
+
+# Worker side: returns an open face for font_path, loading it at most once per process.
+def _get_face(font_path):
+    face = _faces.get(font_path)
+    if face is None:
+        face = freetype.Face(font_path)
+        _faces[font_path] = face
+    return face
+
+
+# Worker side: renders one chunk of glyphs. Returns (job index, chunk index, [(char, width, bits)]).
+def render_chunk(unit):
+    job_index, chunk_index, font_path, width, height, chars = unit
+    face = _get_face(font_path)
+    face.set_pixel_sizes(0, height)
+
+    rendered = []
+    for char in chars:
+        actual_width, bits = render_glyph(face, char, width, height)
+        rendered.append((char, actual_width, bits))
+    return job_index, chunk_index, rendered
+
+
+def _resolve(base_dir, path):
+    return path if os.path.isabs(path) else os.path.join(base_dir, path)
+
+
+# Expands a manifest into one job per (font, size): dicts with font, width, height, chars,
+# charset_file (None for inline charsets) and output.
+def load_manifest(manifest_path):
+    with open(manifest_path, encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+    jobs = []
+    for entry in manifest["jobs"]:
+        charset_file = None
+        if "charset_file" in entry:
+            charset_file = _resolve(base_dir, entry["charset_file"])
+            with open(charset_file, encoding="utf-8") as f:
+                chars = "".join(f.read().split())
+        else:
+            chars = entry["charset"]
+        # Keep the first occurrence of every character, in order
+        chars = "".join(dict.fromkeys(chars))
+
+        sizes = entry.get("sizes") or [entry.get("size", 13)]
+        width = entry.get("width")
+        for height in sizes:
+            output = entry["output"].format(size=height, width=width or "")
+            jobs.append({
+                "font": _resolve(base_dir, entry["font"]),
+                "width": width,
+                "height": height,
+                "chars": chars,
+                "charset_file": charset_file,
+                "output": _resolve(base_dir, output),
+            })
+    return jobs
+
+
+# Splits jobs into glyph chunks ordered by estimated cost (glyph count x cell area), largest first.
+def plan_units(jobs, chunk_glyphs=CHUNK_GLYPHS):
+    units = []
+    for job_index, job in enumerate(jobs):
+        chars = job["chars"]
+        for chunk_index, start in enumerate(range(0, len(chars), chunk_glyphs)):
+            units.append((job_index, chunk_index, job["font"], job["width"], job["height"],
+                          chars[start:start + chunk_glyphs]))
+
+    def cost(unit):
+        height = unit[4]
+        width = unit[3] or height
+        return len(unit[5]) * width * height
+
+    units.sort(key=cost, reverse=True)
+    return units
+
+
+# Runs every job of a manifest on one shared pool and writes each job's output.
+# Returns {output path: GlyphSet}.
+def run_jobs(jobs, processes=None, chunk_glyphs=CHUNK_GLYPHS):
+    start = time.perf_counter()
+    units = plan_units(jobs, chunk_glyphs)
+    chunks = [{} for _ in jobs]
+
+    print(f"Rendering {len(jobs)} jobs as {len(units)} chunks "
+          f"({sum(len(job['chars']) for job in jobs)} glyphs) on {processes or os.cpu_count()} processes.")
+
+    if processes == 1:
+        results = map(render_chunk, units)
+        for job_index, chunk_index, rendered in results:
+            chunks[job_index][chunk_index] = rendered
+    else:
+        with Pool(processes) as pool:
+            for job_index, chunk_index, rendered in pool.imap_unordered(render_chunk, units):
+                chunks[job_index][chunk_index] = rendered
+
+    outputs = {}
+    for job, job_chunks in zip(jobs, chunks):
+        glyphs = GlyphSet(bit_order="lsb")
+        for chunk_index in sorted(job_chunks):
+            for char, width, bits in job_chunks[chunk_index]:
+                glyphs.add(char, width, job["height"], bits)
+        save_glyphset(glyphs, job["output"])
+        outputs[job["output"]] = glyphs
+
+    print(f"Finished {len(jobs)} jobs in {time.perf_counter() - start:.2f} s.")
+    return outputs
+
+
+def run_manifest(manifest_path, processes=None, chunk_glyphs=CHUNK_GLYPHS):
+    return run_jobs(load_manifest(manifest_path), processes, chunk_glyphs)
+
+
+if __name__ == "__main__":
+    # Path to the job manifest
+    manifest_path = sys.argv[1] if len(sys.argv) > 1 else "fonts.json"
+
+    run_manifest(manifest_path)
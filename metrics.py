@@ -0,0 +1,259 @@
+import os
+import struct
+from array import array
+from bisect import bisect_left
+
+import freetype
+
+from glyph_render import render_glyphset
+from glyphset import pack_array, unpack_array, write_glyph_pack
+
+# Per-glyph metrics in pixels, in the same order as the exported glyphs.
+# advance is the pen advance, bearing_x/bearing_y are the offsets from the pen
+# position (on the baseline) to the top-left corner of the glyph's ink box.
+class GlyphMetrics:
+    def __init__(self):
+        self.chars = []
+        self.advances = array("h")
+        self.bearings_x = array("h")
+        self.bearings_y = array("h")
+        self.widths = array("H")
+        self.heights = array("H")
+
+    def __len__(self):
+        return len(self.chars)
+
+    def add(self, char, advance, bearing_x, bearing_y, width, height):
+        self.chars.append(char)
+        self.advances.append(advance)
+        self.bearings_x.append(bearing_x)
+        self.bearings_y.append(bearing_y)
+        self.widths.append(width)
+        self.heights.append(height)
+
+    def to_section(self):
+        payload = struct.pack("<I", len(self.chars))
+        payload += pack_array(array("I", (ord(char) for char in self.chars)))
+        for values in (self.advances, self.bearings_x, self.bearings_y, self.widths, self.heights):
+            payload += pack_array(values)
+        return payload
+
+    @classmethod
+    def from_section(cls, payload):
+        (count,) = struct.unpack_from("<I", payload)
+        metrics = cls()
+        pos = 4
+        codepoints = unpack_array("I", payload[pos:pos + 4 * count])
+        pos += 4 * count
+        metrics.chars = [chr(code) for code in codepoints]
+        for name, typecode in (("advances", "h"), ("bearings_x", "h"), ("bearings_y", "h"),
+                               ("widths", "H"), ("heights", "H")):
+            setattr(metrics, name, unpack_array(typecode, payload[pos:pos + 2 * count]))
+            pos += 2 * count
+        return metrics
+
+
+# Kerning pairs as a sorted array of 32-bit keys, (left_index << 16) | right_index,
+# with a parallel array of pixel adjustments. Indices refer to the exported glyph order,
+# so firmware can binary-search the same two arrays directly.
+class KerningTable:
+    def __init__(self, pairs=None):
+        pairs = sorted((pairs or {}).items())
+        self.keys = array("I", (key for key, _ in pairs))
+        self.values = array("h", (value for _, value in pairs))
+
+    def __len__(self):
+        return len(self.keys)
+
+    def lookup(self, left_index, right_index):
+        key = (left_index << 16) | right_index
+        i = bisect_left(self.keys, key)
+        if i < len(self.keys) and self.keys[i] == key:
+            return self.values[i]
+        return 0
+
+    def to_section(self):
+        return struct.pack("<I", len(self.keys)) + pack_array(self.keys) + pack_array(self.values)
+
+    @classmethod
+    def from_section(cls, payload):
+        (count,) = struct.unpack_from("<I", payload)
+        table = cls()
+        table.keys = unpack_array("I", payload[4:4 + 4 * count])
+        table.values = unpack_array("h", payload[4 + 4 * count:4 + 6 * count])
+        return table
+
+
+# Reads advances and bearings for every character at the face's current pixel size.
+# Only the outline metrics are loaded; nothing is rendered.
+def extract_metrics(face, char_list):
+    metrics = GlyphMetrics()
+    for char in char_list:
+        face.load_char(char, freetype.FT_LOAD_DEFAULT)
+        m = face.glyph.metrics
+        metrics.add(char,
+                    (face.glyph.advance.x + 32) >> 6,
+                    m.horiBearingX >> 6,
+                    (m.horiBearingY + 63) >> 6,
+                    (m.width + 63) >> 6,
+                    (m.height + 63) >> 6)
+    return metrics
+
+
+# Kerning from the legacy 'kern' table through FreeType, trying every pair in the charset.
+# Fine for Latin-sized charsets; large sets should go through the GPOS/fontTools path.
+def _freetype_kerning(face, char_list):
+    pairs = {}
+    if not face.has_kerning:
+        return pairs
+    for left_index, left in enumerate(char_list):
+        for right_index, right in enumerate(char_list):
+            value = face.get_kerning(left, right).x >> 6
+            if value:
+                pairs[(left_index << 16) | right_index] = value
+    return pairs
+
+
+# Pair adjustments from the GPOS 'kern' feature (PairPos formats 1 and 2), read with fontTools.
+# Returns None when fontTools is not installed or the font has no GPOS table.
+def _gpos_kerning(ttf_path, char_list, ppem):
+    try:
+        from fontTools.ttLib import TTFont
+    except ImportError:
+        print("fontTools is not installed, GPOS kerning is skipped.")
+        return None
+
+    font = TTFont(ttf_path, lazy=True)
+    if "GPOS" not in font:
+        return None
+
+    scale = ppem / font["head"].unitsPerEm
+    cmap = font.getBestCmap()
+    index_of = {}
+    for index, char in enumerate(char_list):
+        name = cmap.get(ord(char))
+        if name is not None:
+            index_of.setdefault(name, []).append(index)
+
+    gpos = font["GPOS"].table
+    lookup_indices = set()
+    for record in gpos.FeatureList.FeatureRecord if gpos.FeatureList else []:
+        if record.FeatureTag == "kern":
+            lookup_indices.update(record.Feature.LookupListIndex)
+
+    units = {}
+    for lookup_index in sorted(lookup_indices):
+        lookup = gpos.LookupList.Lookup[lookup_index]
+        seen = set()
+        for subtable in lookup.SubTable:
+            if lookup.LookupType == 9:
+                subtable = subtable.ExtSubTable
+            if subtable.LookupType != 2:
+                continue
+
+            coverage = subtable.Coverage.glyphs
+            if subtable.Format == 1:
+                for first, pair_set in zip(coverage, subtable.PairSet):
+                    if first not in index_of:
+                        continue
+                    for record in pair_set.PairValueRecord:
+                        if record.SecondGlyph in index_of and record.Value1 is not None:
+                            pair = (first, record.SecondGlyph)
+                            if pair not in seen:
+                                seen.add(pair)
+                                units[pair] = units.get(pair, 0) + getattr(record.Value1, "XAdvance", 0)
+            elif subtable.Format == 2:
+                class1 = subtable.ClassDef1.classDefs
+                class2 = subtable.ClassDef2.classDefs
+                for first in coverage:
+                    if first not in index_of:
+                        continue
+                    row = subtable.Class1Record[class1.get(first, 0)].Class2Record
+                    for second in index_of:
+                        value = row[class2.get(second, 0)].Value1
+                        pair = (first, second)
+                        if value is not None and pair not in seen:
+                            seen.add(pair)
+                            units[pair] = units.get(pair, 0) + getattr(value, "XAdvance", 0)
+
+    pairs = {}
+    for (first, second), value in units.items():
+        value = round(value * scale)
+        if not value:
+            continue
+        for left_index in index_of[first]:
+            for right_index in index_of[second]:
+                pairs[(left_index << 16) | right_index] = value
+    return pairs
+
+
+# Builds the kerning table for char_list, preferring GPOS and falling back to the 'kern' table.
+def extract_kerning(face, ttf_path, char_list):
+    pairs = _gpos_kerning(ttf_path, char_list, face.size.x_ppem)
+    if not pairs:
+        pairs = _freetype_kerning(face, char_list)
+    return KerningTable(pairs)
+
+
+# Writes metrics and kerning as C arrays, plus a binary-search lookup for the kerning pairs.
+def write_metrics_header(metrics, kerning, output_file, prefix="font"):
+    with open(output_file, "w") as header_file:
+        header_file.write(f"#define {prefix}_glyph_count {len(metrics)}\n")
+        header_file.write(f"#define {prefix}_kern_count {len(kerning)}\n\n")
+
+        header_file.write("/* codepoint, advance, bearing_x, bearing_y, width, height */\n")
+        header_file.write(f"static const long {prefix}_metrics[][6] = {{\n")
+        for i, char in enumerate(metrics.chars):
+            header_file.write(f"   {{ {ord(char)}, {metrics.advances[i]}, {metrics.bearings_x[i]}, "
+                              f"{metrics.bearings_y[i]}, {metrics.widths[i]}, {metrics.heights[i]} }},\n")
+        header_file.write("};\n\n")
+
+        # Keep the arrays valid C even when the font has no kerning
+        keys = [f"0x{key:08x}" for key in kerning.keys] or ["0xffffffff"]
+        values = [str(value) for value in kerning.values] or ["0"]
+        header_file.write("/* sorted (left_index << 16) | right_index keys */\n")
+        header_file.write(f"static const unsigned long {prefix}_kern_keys[] = {{\n   {', '.join(keys)}\n}};\n")
+        header_file.write(f"static const short {prefix}_kern_values[] = {{\n   {', '.join(values)}\n}};\n\n")
+
+        header_file.write(f"static int {prefix}_kern_lookup(unsigned left, unsigned right) {{\n")
+        header_file.write("    unsigned long key = ((unsigned long)left << 16) | right;\n")
+        header_file.write(f"    int lo = 0, hi = {prefix}_kern_count - 1;\n")
+        header_file.write("    while (lo <= hi) {\n")
+        header_file.write("        int mid = (lo + hi) / 2;\n")
+        header_file.write(f"        if ({prefix}_kern_keys[mid] == key) return {prefix}_kern_values[mid];\n")
+        header_file.write(f"        if ({prefix}_kern_keys[mid] < key) lo = mid + 1; else hi = mid - 1;\n")
+        header_file.write("    }\n")
+        header_file.write("    return 0;\n")
+        header_file.write("}\n")
+
+    print(f"Metrics for {len(metrics)} glyphs and {len(kerning)} kerning pairs saved as {output_file}.")
+
+
+# Renders char_list at its natural glyph widths and exports the proportional layout data:
+# a C header with metrics/kerning and a binary glyph pack carrying the same tables.
+def export_proportional_font(ttf_path, char_list, height=13, output_dir="output", prefix="font"):
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+
+    print(f"Loading font from: {ttf_path}")
+    face = freetype.Face(ttf_path)
+    face.set_pixel_sizes(0, height)
+
+    metrics = extract_metrics(face, char_list)
+    kerning = extract_kerning(face, ttf_path, char_list)
+    glyphs = render_glyphset(ttf_path, char_list, height=height, face=face)
+
+    write_metrics_header(metrics, kerning, os.path.join(output_dir, f"{prefix}_metrics.h"), prefix)
+    write_glyph_pack(glyphs, os.path.join(output_dir, f"{prefix}.gpk"),
+                     sections={b"MTRX": metrics.to_section(), b"KERN": kerning.to_section()})
+    return glyphs, metrics, kerning
+
+
+if __name__ == "__main__":
+    # Path to the TTF font file
+    ttf_path = r"C:\Users\theda\OneDrive\Desktop\ttf_testuing\Courier.ttf"
+
+    # Characters to export
+    char_list = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+    export_proportional_font(ttf_path, char_list, height=13)
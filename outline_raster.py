@@ -0,0 +1,264 @@
+import math
+import sys
+import time
+
+import freetype
+import numpy as np
+
+from glyph_render import render_glyphset
+from glyphset import GlyphSet
+
+# Alternative engine that rasterizes glyph outlines directly with numpy instead of
+# calling FreeType's rasterizer once per glyph and then resizing/thresholding again.
+#
+# Outlines are loaded once, unscaled (FT_LOAD_NO_SCALE), and flattened to line segments,
+# so the same outlines can be rendered at any pixel size. A batch of glyphs is then
+# rasterized in one vectorized pass: every segment's crossings with every sub-scanline
+# are computed at once, their winding deltas are accumulated into an (N, rows, cols)
+# array and a cumulative sum along x gives the winding number of every sample.
+# The fill rule ("nonzero" or "evenodd") and the coverage threshold are plain parameters.
+
+CURVE_STEPS = 8       # line segments per flattened Bezier
+SUPERSAMPLE = 4       # sub-samples per pixel in each direction
+BATCH_SAMPLES = 20_000_000
+
+FT_CURVE_TAG_ON = 1
+FT_CURVE_TAG_CUBIC = 2
+
+
+# Splits one contour into lines, quadratic and cubic Beziers, following the same rules
+# as FT_Outline_Decompose (implied on-curve midpoints between consecutive conic points).
+def _contour_segments(points, tags, lines, quads, cubics):
+    on = [bool(tag & FT_CURVE_TAG_ON) for tag in tags]
+    cubic = [not (tag & FT_CURVE_TAG_ON) and bool(tag & FT_CURVE_TAG_CUBIC) for tag in tags]
+
+    if any(on):
+        start = on.index(True)
+        points = points[start:] + points[:start]
+        on = on[start:] + on[:start]
+        cubic = cubic[start:] + cubic[:start]
+    else:
+        # All-conic contour: start at the implied point between the last and first controls
+        mid = ((points[-1][0] + points[0][0]) / 2, (points[-1][1] + points[0][1]) / 2)
+        points = [mid] + points
+        on = [True] + on
+        cubic = [False] + cubic
+
+    # Walk the contour and close it by coming back to the start point
+    seq = list(zip(points[1:], on[1:], cubic[1:])) + [(points[0], True, False)]
+    current = points[0]
+    i = 0
+    while i < len(seq):
+        point, is_on, is_cubic = seq[i]
+        if is_on:
+            lines.append((current, point))
+            current = point
+            i += 1
+        elif is_cubic:
+            end = seq[i + 2][0] if i + 2 < len(seq) else points[0]
+            cubics.append((current, point, seq[i + 1][0], end))
+            current = end
+            i += 3
+        else:
+            following, following_on, _ = seq[i + 1]
+            if following_on:
+                quads.append((current, point, following))
+                current = following
+                i += 2
+            else:
+                mid = ((point[0] + following[0]) / 2, (point[1] + following[1]) / 2)
+                quads.append((current, point, mid))
+                current = mid
+                i += 1
+
+
+# Flattens a FreeType outline into an (M, 2, 2) array of line segments in font units.
+def flatten_outline(outline, steps=CURVE_STEPS):
+    points = [tuple(point) for point in outline.points]
+    tags = list(outline.tags)
+    lines, quads, cubics = [], [], []
+
+    start = 0
+    for end in outline.contours:
+        _contour_segments(points[start:end + 1], tags[start:end + 1], lines, quads, cubics)
+        start = end + 1
+
+    segments = [np.array(lines, dtype=np.float64).reshape(-1, 2, 2)]
+    t = np.linspace(0.0, 1.0, steps + 1)[None, :, None]
+    if quads:
+        p0, p1, p2 = np.array(quads, dtype=np.float64).transpose(1, 0, 2)[:, :, None, :]
+        curve = (1 - t) ** 2 * p0 + 2 * (1 - t) * t * p1 + t ** 2 * p2
+        segments.append(np.stack([curve[:, :-1], curve[:, 1:]], axis=2).reshape(-1, 2, 2))
+    if cubics:
+        p0, p1, p2, p3 = np.array(cubics, dtype=np.float64).transpose(1, 0, 2)[:, :, None, :]
+        curve = (1 - t) ** 3 * p0 + 3 * (1 - t) ** 2 * t * p1 + 3 * (1 - t) * t ** 2 * p2 + t ** 3 * p3
+        segments.append(np.stack([curve[:, :-1], curve[:, 1:]], axis=2).reshape(-1, 2, 2))
+    return np.concatenate(segments)
+
+
+# Loaded, flattened outlines for a charset, reusable at any pixel size.
+class OutlineSet:
+    def __init__(self, face, char_list, steps=CURVE_STEPS):
+        self.units_per_em = face.units_per_EM
+        self.chars = []
+        self.segments = []     # (M, 2, 2) float arrays in font units
+        self.cboxes = []       # (x_min, y_min, x_max, y_max) of all outline points
+        for char in char_list:
+            face.load_char(char, freetype.FT_LOAD_NO_SCALE | freetype.FT_LOAD_NO_BITMAP)
+            outline = face.glyph.outline
+            self.chars.append(char)
+            self.segments.append(flatten_outline(outline, steps))
+            if outline.points:
+                xs = [x for x, _ in outline.points]
+                ys = [y for _, y in outline.points]
+                self.cboxes.append((min(xs), min(ys), max(xs), max(ys)))
+            else:
+                self.cboxes.append((0, 0, 0, 0))
+
+
+def _to_26_6(values):
+    return np.round(values * 64) / 64
+
+
+# Rasterizes one batch of glyphs. Returns an (N, height, width) bool array.
+def _rasterize_batch(segments, origins, width, height, fill_rule, threshold, supersample):
+    count = len(segments)
+    rows = height * supersample
+    cols = width * supersample
+    size = count * rows * (cols + 1)
+    winding = np.zeros(size, dtype=np.int32)
+
+    glyph_ids = np.repeat(np.arange(count), [len(s) for s in segments])
+    if len(glyph_ids):
+        seg = np.concatenate(segments)
+        # Pixel space with y growing downwards from the top of each glyph's cell
+        u0 = seg[:, 0, 0] - origins[glyph_ids, 0]
+        u1 = seg[:, 1, 0] - origins[glyph_ids, 0]
+        v0 = origins[glyph_ids, 1] - seg[:, 0, 1]
+        v1 = origins[glyph_ids, 1] - seg[:, 1, 1]
+
+        # Sub-scanline k samples at v = (k + 0.5) / supersample; find the ones each edge crosses
+        first = np.clip(np.ceil(np.minimum(v0, v1) * supersample - 0.5), 0, rows).astype(np.int64)
+        last = np.clip(np.ceil(np.maximum(v0, v1) * supersample - 0.5), 0, rows).astype(np.int64)
+        counts = last - first
+        keep = counts > 0
+        if keep.any():
+            edge = np.repeat(np.nonzero(keep)[0], counts[keep])
+            starts = np.repeat(np.cumsum(counts[keep]) - counts[keep], counts[keep])
+            k = first[edge] + np.arange(len(edge)) - starts
+            v = (k + 0.5) / supersample
+            x = u0[edge] + (v - v0[edge]) * (u1[edge] - u0[edge]) / (v1[edge] - v0[edge])
+            column = np.clip(np.ceil(x * supersample - 0.5), 0, cols).astype(np.int64)
+            direction = np.where(v1[edge] > v0[edge], 1, -1)
+            # bincount over flat indices is the fast equivalent of np.add.at here
+            flat = (glyph_ids[edge] * rows + k) * (cols + 1) + column
+            winding = np.bincount(flat, weights=direction, minlength=size).astype(np.int32)
+
+    winding = winding.reshape(count, rows, cols + 1)
+    np.cumsum(winding, axis=2, out=winding)
+    samples = winding[:, :, :cols]
+    inside = (samples & 1) if fill_rule == "evenodd" else (samples != 0)
+
+    # Same rule as the FreeType side of benchmark(): 8-bit coverage above int(threshold * 255)
+    coverage = inside.reshape(count, height, supersample, width, supersample).mean(axis=(2, 4))
+    return coverage * 255 > int(threshold * 255)
+
+
+# Rasterizes an OutlineSet at a pixel height into a GlyphSet of LSB-first XBM rows.
+# Cells are laid out like glyph_render.render_glyphset: the glyph's pixel bounding box
+# starts at the top-left of the cell, clipped or padded to forced_width x height.
+# threshold is the fraction of a pixel's samples that must be inside (0.0 = any ink),
+# compared on the 0-255 scale like glyph_render's threshold, so 0.5 means coverage > 127.
+def rasterize(outlines, height=13, forced_width=None, fill_rule="nonzero", threshold=0.5,
+              supersample=SUPERSAMPLE):
+    if fill_rule not in ("nonzero", "evenodd"):
+        raise ValueError(f"Unknown fill rule {fill_rule!r}, expected 'nonzero' or 'evenodd'")
+
+    # Scaled coordinates are rounded to 1/64 pixel, as FreeType does, so cell origins match
+    scale = height / outlines.units_per_em
+    boxes = _to_26_6(np.array(outlines.cboxes, dtype=np.float64).reshape(-1, 4) * scale)
+    left = np.floor(boxes[:, 0])
+    top = np.ceil(boxes[:, 3])
+    natural = (np.ceil(boxes[:, 2]) - left).astype(np.int64)
+    widths = np.full(len(natural), forced_width) if forced_width else natural
+    origins = np.stack([left, top], axis=1)
+
+    glyphs = GlyphSet(bit_order="lsb")
+    packed = {}
+    # Glyphs with the same cell width share a batch so they fit one array
+    for width in np.unique(widths):
+        indices = np.nonzero(widths == width)[0]
+        bytes_per_row = (int(width) + 7) // 8
+        batch = max(1, BATCH_SAMPLES // max(1, height * width * supersample * supersample))
+        for start in range(0, len(indices), batch):
+            chunk = indices[start:start + batch]
+            pixels = _rasterize_batch([_to_26_6(outlines.segments[i] * scale) for i in chunk], origins[chunk],
+                                      int(width), height, fill_rule, threshold, supersample)
+            padded = np.zeros((len(chunk), height, bytes_per_row * 8), dtype=np.uint8)
+            padded[:, :, :int(width)] = pixels
+            bits = np.packbits(padded, axis=2, bitorder="little").reshape(len(chunk), -1)
+            for i, row_bits in zip(chunk, bits):
+                packed[int(i)] = row_bits.tobytes()
+
+    for i, char in enumerate(outlines.chars):
+        glyphs.add(char, int(widths[i]), height, packed[i])
+    return glyphs
+
+
+# Per-glyph count of differing pixels between two row-layout GlyphSets with matching cells.
+def pixel_diff(expected, actual):
+    counts = {}
+    for char in expected:
+        e = np.array(expected.pixel_rows(char), dtype=np.uint8)
+        a = np.array(actual.pixel_rows(char), dtype=np.uint8)
+        counts[char] = int((e != a).sum()) if e.shape == a.shape else e.size
+    return counts
+
+
+# Times the FreeType path against the outline engine and reports how far their pixels differ.
+# Hinting is disabled on the FreeType side so both engines start from the same outline, and
+# the same coverage threshold is applied to both (coverage on a 0-255 scale > int(threshold * 255)).
+def benchmark(ttf_path, char_list, height=13, forced_width=None, threshold=0.5, supersample=SUPERSAMPLE,
+              repeat=3):
+    face = freetype.Face(ttf_path)
+    flags = freetype.FT_LOAD_RENDER | freetype.FT_LOAD_NO_HINTING
+
+    def best_of(func):
+        best = math.inf
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = func()
+            best = min(best, time.perf_counter() - start)
+        return best, result
+
+    ft_time, reference = best_of(lambda: render_glyphset(ttf_path, char_list, forced_width, height, face, flags,
+                                                          int(threshold * 255)))
+    load_time, outlines = best_of(lambda: OutlineSet(face, char_list))
+    raster_time, glyphs = best_of(lambda: rasterize(outlines, height, forced_width, threshold=threshold,
+                                                    supersample=supersample))
+
+    print(f"{len(char_list)} glyphs at {height}px, threshold {threshold}, {supersample}x{supersample} samples")
+    print(f"  FreeType load_char + pack: {ft_time * 1000:8.1f} ms")
+    print(f"  outline load + flatten:    {load_time * 1000:8.1f} ms (once per font)")
+    print(f"  numpy rasterize:           {raster_time * 1000:8.1f} ms")
+
+    diffs = pixel_diff(reference, glyphs)
+    changed = {char: count for char, count in diffs.items() if count}
+    total = sum(width * height for width in glyphs.widths)
+    print(f"  pixel diff vs FreeType: {sum(changed.values())} of {total} pixels in {len(changed)} glyphs")
+    return reference, glyphs, changed
+
+
+if __name__ == "__main__":
+    from golden import SYNTHETIC_FONT, visual_diff
+
+    # Path to the TTF font file (defaults to the bundled synthetic font)
+    ttf_path = sys.argv[1] if len(sys.argv) > 1 else SYNTHETIC_FONT
+
+    char_list = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+    reference, glyphs, changed = benchmark(ttf_path, char_list, height=13, forced_width=None)
+
+    # Show the worst offenders side by side
+    for char in sorted(changed, key=changed.get, reverse=True)[:3]:
+        print(f"\n{char!r}: {changed[char]} pixels differ")
+        print(visual_diff(reference, glyphs, char))
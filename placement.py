@@ -0,0 +1,121 @@
+import sys
+
+import freetype
+import numpy as np
+
+from glyph_render import bitmap_pixels
+from glyphset import GlyphSet, write_xbm_dir
+from transcode import PACKERS
+
+# Places rendered glyphs in their cells from FreeType metrics instead of copying
+# bitmap.rows from the top-left corner (which lets the baseline drift with every glyph's
+# height) or cropping/pasting per glyph image.
+#
+# Every glyph's top-left corner in the cell is
+#   y = baseline - bitmap_top       (baseline defaults to the ascender's share of the cell)
+#   x = max(bitmap_left, 0)         ("bearing") or centred in the cell ("center")
+# A negative left bearing (the tail of 'j') is clamped to the cell's left edge instead of
+# clipping that glyph's ink at every size.
+# All bitmaps are flattened into one buffer, each pixel gets its (glyph, y, x) target
+# computed with array arithmetic, and one scatter writes them into a preallocated
+# (N, height, width) array. Ink that falls outside the cell is counted per glyph so
+# clipping is reported instead of silently dropped.
+
+ALIGNMENTS = ("bearing", "center")
+
+
+# Renders char_list with the face's current pixel size.
+# Returns ([coverage arrays], bitmap_left array, bitmap_top array, advance array).
+def collect_bitmaps(face, char_list, load_flags=freetype.FT_LOAD_RENDER):
+    bitmaps, lefts, tops, advances = [], [], [], []
+    for char in char_list:
+        face.load_char(char, load_flags)
+        glyph = face.glyph
+        bitmaps.append(bitmap_pixels(glyph.bitmap))
+        lefts.append(glyph.bitmap_left)
+        tops.append(glyph.bitmap_top)
+        advances.append((glyph.advance.x + 32) >> 6)
+    return bitmaps, np.array(lefts, dtype=np.int64), np.array(tops, dtype=np.int64), np.array(advances, dtype=np.int64)
+
+
+# Writes every bitmap into one (N, height, width) 0/1 array.
+# Returns (cells, per-glyph count of ink pixels clipped by the cell).
+def place_glyphs(bitmaps, lefts, tops, height, width, baseline, align="bearing", threshold=0):
+    if align not in ALIGNMENTS:
+        raise ValueError(f"Unknown alignment {align!r}, expected one of {', '.join(ALIGNMENTS)}")
+    count = len(bitmaps)
+    cells = np.zeros((count, height, width), dtype=np.uint8)
+    if not count:
+        return cells, np.zeros(0, dtype=np.int64)
+
+    rows = np.array([bitmap.shape[0] for bitmap in bitmaps], dtype=np.int64)
+    cols = np.array([bitmap.shape[1] for bitmap in bitmaps], dtype=np.int64)
+    sizes = rows * cols
+    starts = np.cumsum(sizes) - sizes
+    flat = np.concatenate([bitmap.ravel() for bitmap in bitmaps])
+
+    if align == "center":
+        origin_x = (width - cols) // 2
+    else:
+        origin_x = np.maximum(lefts, 0)
+    origin_y = baseline - tops
+
+    # Per pixel: owning glyph, position inside its bitmap, target position in the cell
+    glyph = np.repeat(np.arange(count), sizes)
+    local = np.arange(len(flat)) - np.repeat(starts, sizes)
+    glyph_cols = np.repeat(cols, sizes)
+    y = local // glyph_cols + np.repeat(origin_y, sizes)
+    x = local % glyph_cols + np.repeat(origin_x, sizes)
+
+    ink = flat > threshold
+    inside = (y >= 0) & (y < height) & (x >= 0) & (x < width)
+    keep = ink & inside
+    cells[glyph[keep], y[keep], x[keep]] = 1
+    clipped = np.bincount(glyph[ink & ~inside], minlength=count)
+    return cells, clipped
+
+
+# The row that splits a cell of this height in the face's ascender:descender ratio.
+def default_baseline(face, height):
+    return round(height * face.ascender / (face.ascender - face.descender))
+
+
+# Renders char_list into baseline-aligned width x height cells.
+# width defaults to the widest advance; baseline defaults to default_baseline.
+# pixel_size renders at a different size than the cell height (default: the same).
+# Returns (GlyphSet, {char: clipped ink pixels} for glyphs that did not fit).
+def render_aligned(ttf_path, char_list, width=None, height=13, baseline=None, align="bearing",
+                   face=None, threshold=0, pixel_size=None):
+    if face is None:
+        face = freetype.Face(ttf_path)
+    face.set_pixel_sizes(0, pixel_size or height)
+    chars = list(dict.fromkeys(char_list))
+
+    bitmaps, lefts, tops, advances = collect_bitmaps(face, chars)
+    if width is None:
+        width = int(advances.max(initial=1))
+    if baseline is None:
+        baseline = default_baseline(face, height)
+
+    cells, clipped = place_glyphs(bitmaps, lefts, tops, height, width, baseline, align, threshold)
+    packed = PACKERS["row"](cells, "lsb")
+
+    glyphs = GlyphSet(bit_order="lsb")
+    for char, bits in zip(chars, packed):
+        glyphs.add(char, width, height, bits.tobytes())
+    overflow = {char: int(pixels) for char, pixels in zip(chars, clipped) if pixels}
+    if overflow:
+        print(f"{len(overflow)} glyphs do not fit the {width}x{height} cell with baseline {baseline}: "
+              f"{''.join(overflow)!r}")
+    return glyphs, overflow
+
+
+if __name__ == "__main__":
+    # Path to the TTF font file
+    ttf_path = r"C:\Users\theda\OneDrive\Desktop\ttf_testuing\Courier.ttf"
+
+    # Characters to convert (descenders show the baseline fix)
+    char_list = sys.argv[1] if len(sys.argv) > 1 else "AgjpqyQ|"
+
+    glyphs, overflow = render_aligned(ttf_path, char_list, width=7, height=13)
+    write_xbm_dir(glyphs, "output")
@@ -0,0 +1,154 @@
+import sys
+import time
+
+import numpy as np
+
+from transcode import unpack_groups
+from xbm_reader import load_outputs
+
+# Renders a whole GlyphSet into one contact-sheet PNG, so a run can be checked at a glance
+# instead of opening {char}.xbm files one by one.
+#
+# Glyphs are unpacked per size batch (transcode.unpack_groups) into one (N, H, W) stack,
+# labels are built from a built-in 3x5 hex digit font, and the sheet is composed with a
+# single reshape/transpose of the tile array. PIL is only used to write the palette PNG,
+# so there are no per-glyph image objects or pastes (testing.py's render_character_to_bitmap
+# creates several per glyph).
+#
+# With a previous run the sheet becomes a diff overlay: unchanged ink is black, pixels
+# only in the new run are green, pixels only in the previous run are red, and cells of
+# glyphs that changed get a yellow background. Glyphs that disappeared are appended at
+# the end so their red pixels are still visible.
+
+COLUMNS = 64
+GAP = 1
+
+# Palette indices. Glyph pixels are encoded as new + 2 * previous, which lands on
+# BACKGROUND / ADDED / REMOVED / INK directly.
+BACKGROUND, ADDED, REMOVED, INK, GRID, LABEL, CHANGED = range(7)
+PALETTE = [
+    255, 255, 255,  # BACKGROUND
+    0, 170, 0,      # ADDED
+    220, 0, 0,      # REMOVED
+    0, 0, 0,        # INK
+    200, 200, 200,  # GRID
+    70, 90, 200,    # LABEL
+    255, 240, 160,  # CHANGED
+]
+
+_HEX_FONT = [
+    "111 101 101 101 111", "010 110 010 010 111", "111 001 111 100 111", "111 001 111 001 111",
+    "101 101 111 001 001", "111 100 111 001 111", "111 100 111 101 111", "111 001 001 001 001",
+    "111 101 111 101 111", "111 101 111 001 111", "010 101 111 101 101", "110 101 110 101 110",
+    "011 100 100 100 011", "110 101 101 101 110", "111 100 111 100 111", "111 100 111 100 100",
+]
+# (16, 5, 3) pixels for the hex digits 0-F
+_DIGITS = np.array([[[bit == "1" for bit in row] for row in digit.split()] for digit in _HEX_FONT],
+                   dtype=np.uint8)
+LABEL_HEIGHT = 5
+
+
+# Unpacks glyphs into a (len(chars), height, width) stack in chars order, top-left aligned.
+# chars missing from glyphs stay blank.
+def stack_glyphs(glyphs, chars, height, width):
+    stack = np.zeros((len(chars), height, width), dtype=np.uint8)
+    position = {char: i for i, char in enumerate(chars)}
+    target = np.array([position.get(char, -1) for char in glyphs.chars], dtype=np.int64)
+    for indices, pixels in unpack_groups(glyphs):
+        rows = target[indices]
+        keep = rows >= 0
+        stack[rows[keep], :pixels.shape[1], :pixels.shape[2]] = pixels[keep]
+    return stack
+
+
+# Renders every codepoint as hex digits in one gather. Returns (N, 5, digits * 4 - 1).
+def render_codepoint_labels(codepoints, digits):
+    shifts = 4 * np.arange(digits - 1, -1, -1)
+    nibbles = (np.asarray(codepoints, dtype=np.int64)[:, None] >> shifts) & 0xF
+    cells = np.pad(_DIGITS[nibbles], ((0, 0), (0, 0), (0, 0), (0, 1)))
+    return cells.transpose(0, 2, 1, 3).reshape(len(nibbles), LABEL_HEIGHT, digits * 4)[:, :, :-1]
+
+
+# Composes the contact sheet as a 2D array of palette indices.
+# Returns (sheet, stats) where stats has the added/removed/changed characters when a
+# previous GlyphSet is given.
+def contact_sheet(glyphs, previous=None, columns=COLUMNS, labels=False, scale=1):
+    chars = list(glyphs.chars)
+    if previous is not None:
+        current = set(chars)
+        chars += [char for char in previous.chars if char not in current]
+    count = len(chars)
+
+    sets = [glyphs] if previous is None else [glyphs, previous]
+    glyph_h = max((max(s.heights, default=0) for s in sets), default=0)
+    glyph_w = max((max(s.widths, default=0) for s in sets), default=0)
+
+    pixels = stack_glyphs(glyphs, chars, glyph_h, glyph_w)
+    stats = {}
+    if previous is None:
+        cells = pixels * INK
+    else:
+        before = stack_glyphs(previous, chars, glyph_h, glyph_w)
+        cells = pixels + 2 * before
+        changed = (pixels != before).any(axis=(1, 2))
+        # Changed glyphs get a tinted background so single pixel edits stand out
+        cells[changed[:, None, None] & (cells == BACKGROUND)] = CHANGED
+        stats = {
+            "added": [char for char in glyphs.chars if char not in previous],
+            "removed": [char for char in previous.chars if char not in glyphs],
+            "changed": [char for char, flag in zip(chars, changed) if flag
+                        and char in glyphs and char in previous],
+        }
+
+    cell_h, cell_w = glyph_h, glyph_w
+    if labels and count:
+        codepoints = [ord(char) for char in chars]
+        digits = max(4, len(f"{max(codepoints):X}"))
+        label_pixels = render_codepoint_labels(codepoints, digits)
+        cell_h += 1 + LABEL_HEIGHT
+        # One blank column keeps neighbouring labels apart
+        cell_w = max(cell_w, label_pixels.shape[2] + 1)
+
+    rows = -(-count // columns)
+    tiles = np.full((rows * columns, cell_h + GAP, cell_w + GAP), GRID, dtype=np.uint8)
+    tiles[:count, :cell_h, :cell_w] = BACKGROUND
+    tiles[:count, :glyph_h, :glyph_w] = cells
+    if labels and count:
+        tiles[:count, glyph_h + 1:cell_h, :label_pixels.shape[2]] = np.where(label_pixels, LABEL, BACKGROUND)
+
+    sheet = tiles.reshape(rows, columns, cell_h + GAP, cell_w + GAP).transpose(0, 2, 1, 3)
+    sheet = sheet.reshape(rows * (cell_h + GAP), columns * (cell_w + GAP))
+    # Close the grid on the top and left edges
+    sheet = np.pad(sheet, ((GAP, 0), (GAP, 0)), constant_values=GRID)
+    if scale > 1:
+        sheet = sheet.repeat(scale, axis=0).repeat(scale, axis=1)
+    return sheet, stats
+
+
+# Writes the contact sheet of glyphs (and optionally its diff against previous) to a PNG.
+def save_contact_sheet(glyphs, output_file, previous=None, columns=COLUMNS, labels=False, scale=1):
+    from PIL import Image
+
+    start = time.perf_counter()
+    sheet, stats = contact_sheet(glyphs, previous, columns, labels, scale)
+    composed = time.perf_counter()
+
+    image = Image.fromarray(sheet, mode="P")
+    image.putpalette(PALETTE)
+    image.save(output_file, optimize=False)
+
+    print(f"Composed {len(glyphs)} glyphs into a {sheet.shape[1]}x{sheet.shape[0]} sheet in "
+          f"{(composed - start) * 1000:.0f} ms, saved {output_file} in {(time.perf_counter() - composed) * 1000:.0f} ms.")
+    if stats:
+        print(f"{len(stats['changed'])} changed, {len(stats['added'])} added, {len(stats['removed'])} removed.")
+    return stats
+
+
+if __name__ == "__main__":
+    # Directory of .xbm files, a .h header or a .gpk glyph pack
+    path = sys.argv[1] if len(sys.argv) > 1 else "output"
+
+    # Optional previous run to diff against
+    previous = load_outputs(sys.argv[2]) if len(sys.argv) > 2 else None
+
+    save_contact_sheet(load_outputs(path), "contact_sheet.png", previous, labels=True, scale=2)
@@ -0,0 +1,281 @@
+import json
+import os
+import socketserver
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.request import Request, urlopen
+
+import freetype
+
+from glyph_render import render_glyph
+
+# Local glyph render server for asset tooling and test rigs, so asking for a glyph costs
+# a request instead of a Python process running convert_ttf_to_xbm.
+#
+#   POST /render  {"font": "Courier.ttf", "size": 13, "width": 7, "chars": "ABC"}
+#     -> {"glyphs": [{"char": "A", "codepoint": 65, "width": 7, "height": 13,
+#                     "bits": "00081414...", "advance": 8, "bitmap_left": 0, "bitmap_top": 10}, ...]}
+#   GET /stats    -> request/glyph counts, cache hits, coalesced waits, latency percentiles
+#
+# "bits" are the packed XBM rows (LSB first, (width + 7) // 8 bytes per row) as hex;
+# "width" is optional (natural width when omitted). Malformed bodies get a 400. Fonts
+# are resolved against the server's font directory and may not leave it.
+#
+# Faces are pooled per (font, size) with LRU eviction; each pool entry has its own lock
+# (FreeType faces are not thread safe) and keeps the glyphs it already rendered. A batch
+# is rendered under one lock acquisition. Concurrent requests for a glyph that is being
+# rendered wait on the first request's result instead of rendering it again.
+#
+# Serves HTTP on 127.0.0.1 by default, or on a Unix socket:
+#   curl --unix-socket /tmp/glyphs.sock -d '{"font": "a.ttf", "size": 13, "chars": "A"}' http://localhost/render
+
+MAX_FACES = 16
+LATENCY_SAMPLES = 10_000
+
+
+class _PoolEntry:
+    def __init__(self, face):
+        self.face = face
+        self.lock = threading.Lock()
+        self.glyphs = {}
+
+
+class FacePool:
+    def __init__(self, font_dir=".", max_faces=MAX_FACES):
+        self.font_dir = os.path.realpath(font_dir)
+        self.max_faces = max_faces
+        self.entries = OrderedDict()
+        self.inflight = {}
+        self.lock = threading.Lock()
+        self.counts = {"faces_loaded": 0, "faces_evicted": 0, "rendered": 0, "cache_hits": 0, "coalesced": 0}
+
+    def resolve(self, font):
+        path = os.path.realpath(os.path.join(self.font_dir, font))
+        if os.path.commonpath([path, self.font_dir]) != self.font_dir:
+            raise ValueError(f"Font {font!r} is outside the font directory")
+        if not os.path.isfile(path):
+            raise ValueError(f"Font {font!r} not found")
+        return path
+
+    # Returns the pool entry for (font path, size), loading the face and evicting the least recently used.
+    def _entry(self, path, size):
+        key = (path, size)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                return entry
+
+        face = freetype.Face(path)
+        face.set_pixel_sizes(0, size)
+        with self.lock:
+            # Another thread may have loaded the same face meanwhile
+            entry = self.entries.get(key)
+            if entry is None:
+                entry = self.entries[key] = _PoolEntry(face)
+                self.counts["faces_loaded"] += 1
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_faces:
+                self.entries.popitem(last=False)
+                self.counts["faces_evicted"] += 1
+        return entry
+
+    # Renders a batch of chars. Returns one dict per char in order.
+    def render(self, font, size, chars, width=None):
+        path = self.resolve(font)
+        entry = self._entry(path, size)
+
+        # Claim every glyph nobody has yet; wait on the others
+        results, owned, waiting = {}, {}, {}
+        with self.lock:
+            for char in dict.fromkeys(chars):
+                key = (path, size, width, char)
+                if (width, char) in entry.glyphs:
+                    results[char] = entry.glyphs[(width, char)]
+                    self.counts["cache_hits"] += 1
+                elif key in self.inflight:
+                    waiting[char] = self.inflight[key]
+                    self.counts["coalesced"] += 1
+                else:
+                    owned[char] = self.inflight[key] = Future()
+
+        if owned:
+            try:
+                with entry.lock:
+                    for char, future in owned.items():
+                        glyph_width, bits = render_glyph(entry.face, char, width, size)
+                        glyph = entry.face.glyph
+                        result = {
+                            "char": char,
+                            "codepoint": ord(char),
+                            "width": glyph_width,
+                            "height": size,
+                            "bits": bits.hex(),
+                            "advance": (glyph.advance.x + 32) >> 6,
+                            "bitmap_left": glyph.bitmap_left,
+                            "bitmap_top": glyph.bitmap_top,
+                        }
+                        entry.glyphs[(width, char)] = results[char] = result
+                        future.set_result(result)
+            except Exception as error:
+                for future in owned.values():
+                    if not future.done():
+                        future.set_exception(error)
+                raise
+            finally:
+                with self.lock:
+                    for char in owned:
+                        self.inflight.pop((path, size, width, char), None)
+                    self.counts["rendered"] += sum(future.done() and not future.exception() for future in owned.values())
+
+        for char, future in waiting.items():
+            results[char] = future.result()
+        return [results[char] for char in chars]
+
+
+class RenderStats:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.glyphs = 0
+        self.latencies = deque(maxlen=LATENCY_SAMPLES)
+
+    def record(self, seconds, glyphs, failed=False):
+        with self.lock:
+            self.requests += 1
+            self.errors += failed
+            self.glyphs += glyphs
+            self.latencies.append(seconds)
+
+    def snapshot(self, pool):
+        with self.lock:
+            latencies = sorted(self.latencies)
+            uptime = time.perf_counter() - self.started
+            stats = {
+                "uptime_s": round(uptime, 3),
+                "requests": self.requests,
+                "errors": self.errors,
+                "glyphs": self.glyphs,
+                "requests_per_s": round(self.requests / uptime, 2),
+                "glyphs_per_s": round(self.glyphs / uptime, 2),
+            }
+        for name, fraction in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99)):
+            if latencies:
+                stats[f"latency_{name}_ms"] = round(latencies[min(len(latencies) - 1, int(len(latencies) * fraction))] * 1000, 3)
+        with pool.lock:
+            stats.update(pool.counts, faces_open=len(pool.entries))
+        return stats
+
+
+# Checks a decoded /render body. Returns (font, size, chars, width) or raises ValueError.
+def parse_render_request(request):
+    if not isinstance(request, dict):
+        raise ValueError("Request body must be a JSON object")
+    font, size, chars, width = request.get("font"), request.get("size", 13), request.get("chars"), request.get("width")
+    if not isinstance(font, str):
+        raise ValueError("'font' must be a string")
+    if not isinstance(chars, str):
+        raise ValueError("'chars' must be a string")
+    # bool is an int subclass, but {"size": true} is not a size
+    if not isinstance(size, int) or isinstance(size, bool) or size <= 0:
+        raise ValueError("'size' must be a positive integer")
+    if width is not None and (not isinstance(width, int) or isinstance(width, bool) or width <= 0):
+        raise ValueError("'width' must be a positive integer or null")
+    return font, size, chars, width
+
+
+class RenderHandler(BaseHTTPRequestHandler):
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/stats":
+            self._send_json(200, self.server.stats.snapshot(self.server.pool))
+        else:
+            self._send_json(404, {"error": "unknown path"})
+
+    def do_POST(self):
+        if self.path != "/render":
+            self._send_json(404, {"error": "unknown path"})
+            return
+
+        start = time.perf_counter()
+        try:
+            request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            glyphs = self.server.pool.render(*parse_render_request(request))
+        except (ValueError, freetype.FT_Exception) as error:
+            self.server.stats.record(time.perf_counter() - start, 0, failed=True)
+            self._send_json(400, {"error": str(error)})
+            return
+
+        self.server.stats.record(time.perf_counter() - start, len(glyphs))
+        self._send_json(200, {"glyphs": glyphs})
+
+    def address_string(self):
+        # Unix socket clients have no (host, port) address
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def get_request(self):
+        request, _ = super().get_request()
+        return request, ("unix", 0)
+
+
+def make_server(host="127.0.0.1", port=8765, socket_path=None, font_dir=".", max_faces=MAX_FACES, verbose=False):
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        server = _UnixHTTPServer(socket_path, RenderHandler)
+    else:
+        server = ThreadingHTTPServer((host, port), RenderHandler)
+    server.pool = FacePool(font_dir, max_faces)
+    server.stats = RenderStats()
+    server.verbose = verbose
+    return server
+
+
+def serve(host="127.0.0.1", port=8765, socket_path=None, font_dir=".", max_faces=MAX_FACES, verbose=False):
+    server = make_server(host, port, socket_path, font_dir, max_faces, verbose)
+    where = socket_path or f"http://{host}:{server.server_address[1]}"
+    print(f"Serving glyphs from {os.path.abspath(font_dir)} on {where}, press Ctrl+C to stop.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("Stopped serving.")
+    finally:
+        server.server_close()
+        if socket_path and os.path.exists(socket_path):
+            os.remove(socket_path)
+
+
+# Client helper for scripts and test rigs. Returns the list of glyph dicts.
+def request_glyphs(url, font, size, chars, width=None):
+    payload = json.dumps({"font": font, "size": size, "chars": chars, "width": width}).encode("utf-8")
+    request = Request(url.rstrip("/") + "/render", data=payload, headers={"Content-Type": "application/json"})
+    with urlopen(request) as response:
+        return json.load(response)["glyphs"]
+
+
+if __name__ == "__main__":
+    # Directory the requested font paths are resolved against
+    font_dir = sys.argv[1] if len(sys.argv) > 1 else "."
+
+    serve(font_dir=font_dir)
@@ -0,0 +1,170 @@
+import glob
+import os
+import struct
+import sys
+import time
+import zlib
+from array import array
+from multiprocessing import Process
+
+import freetype
+
+from glyph_render import render_glyphset
+from glyphset import GlyphSet, pack_array, read_glyph_pack, save_glyphset, unpack_array, write_glyph_pack
+
+# Splits one big conversion (e.g. all of Noto CJK at one size) into N shards that can run
+# as independent processes or on separate hosts, then merges their partial glyph packs.
+#
+# A codepoint belongs to shard (codepoint % N), so every node can work out its share from
+# the charset alone and no coordinator is needed; consecutive codepoints land on
+# different shards, which keeps the shards similar in cost. Each shard writes
+#   {name}.shard-{index}-of-{count}.gpk
+# with two extra sections:
+#   SHRD  shard index (u16), shard count (u16), charset size (u32), charset CRC-32 (u32),
+#         width (u16, 0 = natural), height (u16)
+#   CRCS  one CRC-32 (u32) per glyph over its width, height and packed bits
+# The merge checks that every shard of the same job is present exactly once, that each
+# glyph is on the right shard and intact, and that together they cover the whole charset,
+# before writing the final header, pack or .xbm directory in codepoint order.
+
+SHARD_SECTION = b"SHRD"
+CRC_SECTION = b"CRCS"
+_SHARD_FORMAT = "<HHIIHH"
+
+
+# The CRC-32 that identifies a charset: over its sorted, distinct codepoints as little-endian
+# u32s, so a charset with repeated characters matches the deduplicated merge.
+def charset_checksum(chars):
+    return zlib.crc32(pack_array(array("I", sorted({ord(char) for char in chars}))))
+
+
+def glyph_checksum(width, height, bits):
+    return zlib.crc32(struct.pack("<HH", width, height) + bits)
+
+
+# Returns the sorted characters of chars that belong to shard_index out of shard_count.
+def shard_chars(chars, shard_index, shard_count):
+    return [char for char in sorted(set(chars)) if ord(char) % shard_count == shard_index]
+
+
+# Every codepoint the font's cmap maps to a real glyph.
+def font_charset(ttf_path):
+    face = freetype.Face(ttf_path)
+    return [chr(codepoint) for codepoint, glyph_index in face.get_chars() if glyph_index]
+
+
+def shard_path(shard_dir, name, shard_index, shard_count):
+    return os.path.join(shard_dir, f"{name}.shard-{shard_index:03d}-of-{shard_count:03d}.gpk")
+
+
+# Renders one shard and writes its partial glyph pack. Returns the pack's path.
+def render_shard(ttf_path, chars, shard_index, shard_count, forced_width=None, height=13,
+                 shard_dir="shards", name=None):
+    if not 0 <= shard_index < shard_count:
+        raise ValueError(f"Shard index {shard_index} out of range for {shard_count} shards")
+    name = name or os.path.splitext(os.path.basename(ttf_path))[0]
+    start = time.perf_counter()
+
+    share = shard_chars(chars, shard_index, shard_count)
+    glyphs = render_glyphset(ttf_path, share, forced_width, height)
+
+    info = struct.pack(_SHARD_FORMAT, shard_index, shard_count, len(set(chars)), charset_checksum(chars),
+                       forced_width or 0, height)
+    checksums = array("I", (glyph_checksum(*glyphs.get(char)) for char in glyphs.chars))
+    if not os.path.exists(shard_dir):
+        os.makedirs(shard_dir)
+    output_file = shard_path(shard_dir, name, shard_index, shard_count)
+    write_glyph_pack(glyphs, output_file, {SHARD_SECTION: info, CRC_SECTION: pack_array(checksums)})
+
+    print(f"Shard {shard_index + 1}/{shard_count}: {len(glyphs)} glyphs in {time.perf_counter() - start:.2f} s.")
+    return output_file
+
+
+# Combines shard packs into one GlyphSet in codepoint order, raising ValueError unless the
+# shards are complete, consistent and intact.
+def merge_shards(shard_files):
+    if not shard_files:
+        raise ValueError("No shard files to merge")
+
+    shards = {}
+    job = None
+    for shard_file in shard_files:
+        glyphs, sections = read_glyph_pack(shard_file)
+        if SHARD_SECTION not in sections or CRC_SECTION not in sections:
+            raise ValueError(f"{shard_file} is not a shard pack")
+        info = struct.unpack(_SHARD_FORMAT, sections[SHARD_SECTION])
+        shard_index, shard_count = info[:2]
+        if job is None:
+            job = info[1:]
+        elif info[1:] != job:
+            raise ValueError(f"{shard_file} belongs to a different job (shard count, charset or size differ)")
+        if shard_index in shards:
+            raise ValueError(f"Shard {shard_index} given twice ({shards[shard_index][0]} and {shard_file})")
+
+        checksums = unpack_array("I", sections[CRC_SECTION])
+        if len(checksums) != len(glyphs):
+            raise ValueError(f"{shard_file}: {len(checksums)} checksums for {len(glyphs)} glyphs")
+        for char, checksum in zip(glyphs.chars, checksums):
+            if ord(char) % shard_count != shard_index:
+                raise ValueError(f"{shard_file}: U+{ord(char):04X} does not belong to shard {shard_index}")
+            if glyph_checksum(*glyphs.get(char)) != checksum:
+                raise ValueError(f"{shard_file}: U+{ord(char):04X} fails its checksum")
+        shards[shard_index] = (shard_file, glyphs)
+
+    shard_count, charset_size, charset_crc = job[:3]
+    missing = sorted(set(range(shard_count)) - set(shards))
+    if missing:
+        raise ValueError(f"Missing shards: {', '.join(str(index) for index in missing)} of {shard_count}")
+
+    chars = sorted((char for _, glyphs in shards.values() for char in glyphs.chars), key=ord)
+    if len(chars) != charset_size or charset_checksum(chars) != charset_crc:
+        raise ValueError(f"Shards hold {len(chars)} glyphs but the charset has {charset_size}, "
+                         f"or the glyphs do not match the charset")
+
+    merged = GlyphSet(bit_order="lsb")
+    for char in chars:
+        merged.add(char, *shards[ord(char) % shard_count][1].get(char))
+    print(f"Merged {shard_count} shards into {len(merged)} glyphs.")
+    return merged
+
+
+def merge_shard_files(shard_files, output):
+    glyphs = merge_shards(shard_files)
+    save_glyphset(glyphs, output)
+    return glyphs
+
+
+# Runs every shard as its own process, standing in for separate hosts, then merges them.
+def run_local(ttf_path, shard_count, output, chars=None, forced_width=None, height=13, shard_dir="shards"):
+    # Open the font once here so a bad path fails before any shard process starts
+    freetype.Face(ttf_path)
+    chars = chars or font_charset(ttf_path)
+    name = os.path.splitext(os.path.basename(ttf_path))[0]
+    start = time.perf_counter()
+
+    workers = [Process(target=render_shard,
+                       args=(ttf_path, chars, index, shard_count, forced_width, height, shard_dir, name))
+               for index in range(shard_count)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    failed = [index for index, worker in enumerate(workers) if worker.exitcode]
+    if failed:
+        raise RuntimeError(f"Shards failed: {', '.join(str(index) for index in failed)}")
+
+    shard_files = [shard_path(shard_dir, name, index, shard_count) for index in range(shard_count)]
+    glyphs = merge_shard_files(shard_files, output)
+    print(f"{shard_count} shards rendered and merged in {time.perf_counter() - start:.2f} s.")
+    return glyphs
+
+
+if __name__ == "__main__":
+    # Path to the TTF font file
+    ttf_path = r"C:\Users\theda\OneDrive\Desktop\ttf_testuing\NotoSansCJK.ttf"
+
+    # "merge <dir>" merges the shard packs in a directory, otherwise all shards run locally
+    if len(sys.argv) > 2 and sys.argv[1] == "merge":
+        merge_shard_files(sorted(glob.glob(os.path.join(sys.argv[2], "*.gpk"))), "output/merged.h")
+    else:
+        run_local(ttf_path, shard_count=4, output="output/merged.h", height=13)
@@ -0,0 +1,83 @@
+import sys
+
+import freetype
+
+from glyph_render import pack_bitmap
+from glyphset import GlyphSet, save_glyphset
+
+# Uses the hand-tuned 1bpp bitmaps (EBDT/EBLC strikes) that many CJK and pixel fonts ship
+# at exactly the sizes we need, instead of rasterizing outlines and thresholding them.
+#
+# When the requested pixel height matches one of face.available_sizes, that strike is
+# selected and glyphs are loaded without rendering: a glyph the strike contains comes
+# back as a 1bpp bitmap and is packed as is, with no rasterization, resampling or
+# cleanup. Glyphs the strike lacks come back as outlines and are rendered by FreeType
+# at the strike's size. Every glyph is reported as "strike" or "outline".
+
+
+# Returns [(pixel height, strike width, strike height)] for every embedded strike.
+def list_strikes(face):
+    return [((size.y_ppem + 32) >> 6, size.width, size.height) for size in face.available_sizes]
+
+
+# Index into face.available_sizes of the strike drawn for this pixel height, or None.
+def find_strike(face, height):
+    for index, (ppem, _, _) in enumerate(list_strikes(face)):
+        if ppem == height:
+            return index
+    return None
+
+
+# Renders char_list, taking glyphs from an embedded strike when one matches height.
+# Returns (GlyphSet, {char: "strike" or "outline"}).
+def render_with_strikes(ttf_path, char_list, forced_width=None, height=13, face=None):
+    if face is None:
+        face = freetype.Face(ttf_path)
+    strike = find_strike(face, height)
+    if strike is not None:
+        face.select_size(strike)
+    else:
+        face.set_pixel_sizes(0, height)
+
+    glyphs = GlyphSet(bit_order="lsb")
+    sources = {}
+    for char in char_list:
+        face.load_char(char, freetype.FT_LOAD_DEFAULT)
+        if face.glyph.format == freetype.FT_GLYPH_FORMAT_BITMAP:
+            sources[char] = "strike"
+        else:
+            face.glyph.render(freetype.FT_RENDER_MODE_NORMAL)
+            sources[char] = "outline"
+        bitmap = face.glyph.bitmap
+        width = forced_width if forced_width else bitmap.width
+        glyphs.add(char, width, height, pack_bitmap(bitmap, width, height))
+    return glyphs, sources
+
+
+# Converts char_list, preferring embedded strikes, and reports where every glyph came from.
+def convert_with_strikes(ttf_path, char_list, output, forced_width=None, height=13):
+    face = freetype.Face(ttf_path)
+    strikes = list_strikes(face)
+    print(f"Embedded strikes: {', '.join(f'{ppem}px' for ppem, _, _ in strikes) or 'none'}")
+
+    glyphs, sources = render_with_strikes(ttf_path, char_list, forced_width, height, face)
+    save_glyphset(glyphs, output, comments={char: f"source: {source}" for char, source in sources.items()})
+
+    from_strike = "".join(char for char, source in sources.items() if source == "strike")
+    from_outline = "".join(char for char, source in sources.items() if source == "outline")
+    if find_strike(face, height) is None:
+        print(f"No {height}px strike, all {len(from_outline)} glyphs rendered from outlines.")
+    else:
+        print(f"{len(from_strike)} glyphs from the {height}px strike, {len(from_outline)} rendered from outlines"
+              + (f": {from_outline!r}" if from_outline else "."))
+    return glyphs, sources
+
+
+if __name__ == "__main__":
+    # Path to a font with embedded bitmap strikes
+    ttf_path = r"C:\Users\theda\OneDrive\Desktop\ttf_testuing\NotoSansCJK.ttf"
+
+    # Characters to convert
+    char_list = sys.argv[1] if len(sys.argv) > 1 else "ABC中文"
+
+    convert_with_strikes(ttf_path, char_list, "output/strikes.h", height=12)
@@ -0,0 +1,161 @@
+import os
+import sys
+import time
+from multiprocessing import Pool
+
+import freetype
+import numpy as np
+
+from glyph_render import render_glyphset
+from glyphset import save_glyphset
+
+# Picks char_list from real text instead of by hand: count how often every codepoint
+# occurs in a corpus, keep the most frequent ones the font's cmap supports until they
+# cover the target share of the text, and hand the result to the converter.
+#
+# Counting streams the files in CHUNK_BYTES pieces split on line boundaries, so memory
+# does not grow with the corpus: each piece is decoded, viewed as UTF-32 and added to one
+# fixed 0x110000-entry count array with np.bincount. With processes > 1 every file is cut
+# into line-aligned byte ranges that are counted in parallel and summed.
+
+CHUNK_BYTES = 4 * 1024 * 1024
+CODEPOINTS = 0x110000
+
+# C0/C1 control characters (newlines, tabs, ...) are never part of a charset
+_CONTROL = np.r_[0:0x20, 0x7F:0xA0]
+
+
+def _count_text(counts, text):
+    if text:
+        codepoints = np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype="<u4")
+        counts += np.bincount(codepoints, minlength=CODEPOINTS)
+
+
+# Counts codepoints in bytes [start, end) of a UTF-8 file. start and end must be line starts.
+def count_range(task):
+    path, start, end = task
+    counts = np.zeros(CODEPOINTS, dtype=np.int64)
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            chunk = f.read(min(CHUNK_BYTES, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            # Finish the current line so no UTF-8 sequence is split between chunks
+            if remaining > 0:
+                tail = f.readline()
+                if len(tail) > remaining:
+                    tail = tail[:remaining]
+                    f.seek(end)
+                remaining -= len(tail)
+                chunk += tail
+            _count_text(counts, chunk.decode("utf-8", "replace"))
+    return counts
+
+
+# Splits a file into about `parts` byte ranges that start and end on line boundaries.
+def split_file(path, parts):
+    size = os.path.getsize(path)
+    bounds = [0]
+    with open(path, "rb") as f:
+        for part in range(1, parts):
+            f.seek(max(bounds[-1], size * part // parts))
+            f.readline()
+            position = min(f.tell(), size)
+            if position > bounds[-1]:
+                bounds.append(position)
+    bounds.append(size)
+    return [(path, start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+
+# Counts every codepoint in the corpus files. Returns a (0x110000,) int64 array.
+def count_codepoints(paths, processes=1):
+    start = time.perf_counter()
+    if processes == 1:
+        tasks = [(path, 0, os.path.getsize(path)) for path in paths]
+        results = map(count_range, tasks)
+        counts = sum(results, np.zeros(CODEPOINTS, dtype=np.int64))
+    else:
+        tasks = [task for path in paths for task in split_file(path, processes)]
+        with Pool(processes) as pool:
+            counts = sum(pool.imap_unordered(count_range, tasks), np.zeros(CODEPOINTS, dtype=np.int64))
+    counts[_CONTROL] = 0
+
+    size = sum(os.path.getsize(path) for path in paths)
+    print(f"Counted {int(counts.sum())} characters ({size / 1e6:.1f} MB, {np.count_nonzero(counts)} distinct) "
+          f"in {time.perf_counter() - start:.2f} s.")
+    return counts
+
+
+# Returns the smallest set of codepoints whose occurrences cover `coverage` (0-1) of the corpus,
+# most frequent first. total is the corpus size to measure against (default: counts.sum());
+# when counts cannot reach the target, every codepoint with a count is returned.
+def smallest_covering(counts, coverage, total=None):
+    order = np.argsort(counts, kind="stable")[::-1]
+    order = order[counts[order] > 0]
+    if total is None:
+        total = counts.sum()
+    if not total:
+        return order
+    cumulative = np.cumsum(counts[order])
+    needed = int(np.searchsorted(cumulative, coverage * total)) + 1
+    return order[:needed]
+
+
+# Marks every codepoint the font's cmap maps to a glyph. Returns a (0x110000,) bool array.
+def cmap_mask(face):
+    supported = np.zeros(CODEPOINTS, dtype=bool)
+    supported[[code for code, _ in face.get_chars() if code < CODEPOINTS]] = True
+    return supported
+
+
+# Picks the charset for ttf_path from corpus counts. Only codepoints the font can render
+# compete for the coverage budget, and coverage is measured against the whole corpus, so a
+# font that lacks frequent characters falls short of the target instead of wasting slots.
+# Returns (chars sorted by codepoint, chars the font cannot render, coverage of the corpus by chars).
+def select_charset(counts, ttf_path, coverage=0.99):
+    face = freetype.Face(ttf_path)
+    supported = cmap_mask(face)
+    total = counts.sum()
+
+    wanted = smallest_covering(np.where(supported, counts, 0), coverage, total)
+    chars = "".join(chr(codepoint) for codepoint in sorted(wanted))
+    # What the corpus would need at this coverage that the font does not have
+    needed = smallest_covering(counts, coverage)
+    missing = "".join(chr(codepoint) for codepoint in needed[~supported[needed]])
+
+    achieved = counts[wanted].sum() / total if total else 0.0
+    print(f"{len(chars)} codepoints in the font cover {achieved:.2%} of the corpus (target {coverage:.2%}); "
+          f"{len(missing)} needed codepoints are missing from the font.")
+    if achieved < coverage:
+        print(f"Short of the target by {coverage - achieved:.2%}: the font cannot reach {coverage:.2%} of this corpus.")
+    return chars, missing, achieved
+
+
+# Counts the corpus, picks the charset and converts it in one go.
+def subset_and_convert(ttf_path, corpus_paths, output, coverage=0.99, forced_width=None, height=13,
+                       processes=1, charset_file=None):
+    counts = count_codepoints(corpus_paths, processes)
+    chars, missing, achieved = select_charset(counts, ttf_path, coverage)
+    if charset_file:
+        with open(charset_file, "w", encoding="utf-8") as f:
+            f.write(chars)
+    if missing:
+        print(f"Not in the font: {missing[:80]!r}{'...' if len(missing) > 80 else ''}")
+
+    glyphs = render_glyphset(ttf_path, chars, forced_width, height)
+    save_glyphset(glyphs, output)
+    return glyphs
+
+
+if __name__ == "__main__":
+    # Path to the TTF font file
+    ttf_path = r"C:\Users\theda\OneDrive\Desktop\ttf_testuing\NotoSansCJK.ttf"
+
+    # Text files the charset should cover
+    corpus_paths = sys.argv[1:] or ["corpus.txt"]
+
+    subset_and_convert(ttf_path, corpus_paths, "output/subset.h", coverage=0.995, forced_width=14, height=13,
+                       processes=os.cpu_count(), charset_file="output/subset_charset.txt")
@@ -0,0 +1,32 @@
+import os
+
+import numpy as np
+import pytest
+
+from autofit import autofit, overflow
+from golden import SYNTHETIC_FONT
+
+DEJAVU = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+
+
+def _metrics(*boxes):
+    return tuple(np.array(column, dtype=np.int64) for column in zip(*boxes))
+
+
+# (left, bottom, right, top, advance): a 'j'-like glyph starting 1 px left of the origin
+def test_negative_bearing_fits_when_its_ink_does():
+    metrics = _metrics((-1, -3, 3, 9, 4), (0, 0, 5, 9, 6))
+    assert overflow(metrics, 6, 13, "baseline", baseline=10).tolist() == [0, 0]
+    assert overflow(metrics, 3, 13, "baseline", baseline=10).tolist() == [1, 2]
+
+
+def test_autofit_synthetic_font():
+    report = autofit(SYNTHETIC_FONT, "ABC", 8, 13)
+    assert report["size"] == 13
+    assert report["limiting"]
+
+
+@pytest.mark.skipif(not os.path.exists(DEJAVU), reason="DejaVu Sans not installed")
+def test_lowercase_with_j_fits_baseline_cell():
+    report = autofit(DEJAVU, "abcdefghijklmnopqrstuvwxyz", 10, 16, align="baseline")
+    assert report["size"] is not None
@@ -0,0 +1,43 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import ttf_xbm_cli
+from glyph_render import render_glyphset
+from golden import SYNTHETIC_FONT
+from xbm_reader import load_outputs
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# Runs the CLI in a fresh interpreter and prints which heavy modules it ended up importing
+def _run_cli(*argv):
+    script = ("import sys, ttf_xbm_cli\n"
+              "try:\n"
+              f"    ttf_xbm_cli.main({list(argv)!r})\n"
+              "except SystemExit:\n"
+              "    pass\n"
+              "print(sorted(name for name in ('freetype', 'numpy', 'PIL') if name in sys.modules))\n")
+    result = subprocess.run([sys.executable, "-c", script], cwd=REPO, capture_output=True, text=True, check=True)
+    return result.stdout.splitlines()[-1]
+
+
+def test_help_imports_nothing_heavy():
+    assert _run_cli("--help") == "[]"
+
+
+def test_small_job_skips_numpy(tmp_path):
+    assert _run_cli("convert", SYNTHETIC_FONT, "AB", "--width", "7", "--height", "13",
+                    "--output-dir", str(tmp_path)) == "['freetype']"
+    glyphs = load_outputs(str(tmp_path))
+    whole = render_glyphset(SYNTHETIC_FONT, "AB", 7, 13)
+    assert sorted(glyphs.chars) == ["A", "B"]
+    for char in whole:
+        assert glyphs.pixel_rows(char) == whole.pixel_rows(char)
+
+
+def test_unknown_variant_is_reported(tmp_path):
+    with pytest.raises(SystemExit, match="Unknown variant 'nope'"):
+        ttf_xbm_cli.main(["convert", SYNTHETIC_FONT, "A", "--variant", "nope", "--output-dir", str(tmp_path)])
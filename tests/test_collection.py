@@ -0,0 +1,45 @@
+import pytest
+
+import collection
+from glyph_render import render_glyphset
+from golden import SYNTHETIC_FONT
+
+
+# Two faces of the synthetic font in one .ttc, sharing every table but 'name'
+@pytest.fixture
+def synthetic_ttc(tmp_path):
+    ttLib = pytest.importorskip("fontTools.ttLib")
+    fonts = [ttLib.TTFont(SYNTHETIC_FONT), ttLib.TTFont(SYNTHETIC_FONT)]
+    fonts[1]["name"].setName("Oblique", 2, 3, 1, 0x409)
+    fonts[1]["name"].setName("Oblique", 2, 1, 0, 0)
+    ttc = ttLib.TTCollection()
+    ttc.fonts = fonts
+    path = tmp_path / "synthetic.ttc"
+    ttc.save(str(path), shareTables=True)
+    return str(path)
+
+
+def test_table_directories_of_a_collection(synthetic_ttc):
+    with open(synthetic_ttc, "rb") as f:
+        directories = collection.read_table_directories(f.read())
+    assert len(directories) == 2
+    assert directories[0][b"glyf"] == directories[1][b"glyf"]
+    assert directories[0][b"name"] != directories[1][b"name"]
+
+
+def test_table_directory_of_a_single_font():
+    with open(SYNTHETIC_FONT, "rb") as f:
+        (directory,) = collection.read_table_directories(f.read())
+    assert b"glyf" in directory and b"cmap" in directory
+
+
+def test_faces_share_rendered_glyphs(synthetic_ttc, tmp_path, capsys):
+    outputs = collection.render_collection(synthetic_ttc, "ABCA", 7, 13,
+                                           output=str(tmp_path / "{index}_{face}_{instance}.gpk"))
+    assert "3 glyphs rendered, 3 reused" in capsys.readouterr().out
+    whole = render_glyphset(SYNTHETIC_FONT, "ABC", 7, 13)
+    assert len(outputs) == 2
+    for glyphs in outputs.values():
+        assert glyphs.chars == ["A", "B", "C"]
+        for char in whole:
+            assert glyphs.get(char) == whole.get(char)
@@ -0,0 +1,36 @@
+import os
+
+import pytest
+
+import fallback
+from glyph_render import render_glyphset
+from glyphset import read_glyph_pack
+from golden import SYNTHETIC_FONT
+
+DEJAVU = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+
+
+@pytest.mark.skipif(not os.path.exists(DEJAVU), reason="DejaVu Sans not installed")
+def test_chain_routes_each_char_to_first_font_that_has_it():
+    glyphs, sources = fallback.render_fallback_chain([SYNTHETIC_FONT, DEJAVU], "Ab1b\ue000", 7, 13)
+    assert glyphs.chars == ["A", "b", "1", "\ue000"]
+    assert sources == [0, 1, 0, fallback.MISSING]
+    assert glyphs.get("A") == render_glyphset(SYNTHETIC_FONT, "A", 7, 13).get("A")
+    assert glyphs.get("b") == render_glyphset(DEJAVU, "b", 7, 13).get("b")
+    # Missing everywhere: the primary font's .notdef box
+    assert glyphs.get("\ue000") == render_glyphset(SYNTHETIC_FONT, "\ue000", 7, 13).get("\ue000")
+
+
+def test_sources_section_round_trip():
+    payload = fallback.sources_section(["fonts/a.ttf", "/usr/share/b.ttf"], [0, 1, fallback.MISSING, 0])
+    assert fallback.read_sources_section(payload) == (["a.ttf", "b.ttf"], [0, 1, fallback.MISSING, 0])
+
+
+def test_convert_with_fallback_writes_sources(tmp_path):
+    output = str(tmp_path / "chain.gpk")
+    fallback.convert_with_fallback([SYNTHETIC_FONT], "AB\ue000", output, 7, 13)
+    glyphs, sections = read_glyph_pack(output)
+    assert glyphs.chars == ["A", "B", "\ue000"]
+    names, sources = fallback.read_sources_section(sections[b"SRCS"])
+    assert names == [os.path.basename(SYNTHETIC_FONT)]
+    assert sources == [0, 0, fallback.MISSING]
@@ -0,0 +1,30 @@
+from glyph_diff import diff_glyphsets
+from glyphset import GlyphSet
+from transcode import transcode
+
+
+def _set(glyphs):
+    result = GlyphSet(bit_order="lsb")
+    for char, width, height, bits in glyphs:
+        result.add(char, width, height, bits)
+    return result
+
+
+def test_counts_changed_added_removed_and_resized():
+    old = _set([("A", 8, 2, b"\xff\x00"), ("B", 8, 2, b"\x0f\x0f"), ("C", 8, 1, b"\x01"), ("D", 8, 1, b"\x01")])
+    new = _set([("A", 8, 2, b"\xff\x00"), ("B", 8, 2, b"\x0f\xf0"), ("C", 16, 1, b"\x01\x00"), ("E", 8, 1, b"\x01")])
+
+    report = diff_glyphsets(old, new)
+    assert report["added"] == ["E"]
+    assert report["removed"] == ["D"]
+    assert report["unchanged"] == 1
+    # B: 8 pixels moved within row 1; C: same ink in a wider cell
+    assert report["changed"] == [("B", 8, (8, 2), (8, 2)), ("C", 0, (8, 1), (16, 1))]
+
+
+# Bit order and layout are unpacked before comparing, so only real pixel changes count.
+def test_same_pixels_in_another_layout_are_unchanged():
+    old = _set([("A", 12, 9, bytes(range(18))), ("B", 5, 3, b"\x1f\x00\x11")])
+    report = diff_glyphsets(old, transcode(old, "page", "msb"))
+    assert report["changed"] == []
+    assert report["unchanged"] == 2
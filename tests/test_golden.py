@@ -0,0 +1,15 @@
+import pytest
+
+import golden
+
+
+@pytest.mark.parametrize("name", list(golden.VARIANTS))
+def test_variant_matches_golden(name):
+    glyphs, _ = golden.render_variant(name)
+    assert golden.compare_glyphsets(golden.load_golden(name), glyphs) == []
+
+
+@pytest.mark.parametrize("name", list(golden.FAST_PATHS))
+def test_fast_path_matches_reference(name):
+    reference = golden.FAST_PATHS[name][0]
+    assert golden.compare_glyphsets(golden.load_golden(reference), golden.render_fast_path(name)) == []
@@ -0,0 +1,63 @@
+import os
+
+import freetype
+import numpy as np
+import pytest
+
+from glyph_render import bitmap_pixels
+from golden import SYNTHETIC_FONT
+from line_render import LineRenderer
+from metrics import extract_kerning
+
+DEJAVU = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+
+
+def _unpack(line):
+    width, height, bits = line
+    rows = np.frombuffer(bits, dtype=np.uint8).reshape(height, -1)
+    return np.unpackbits(rows, axis=1, bitorder="little")[:, :width]
+
+
+# The shifted-byte composition must put every glyph pixel exactly where its metrics say.
+def test_line_bits_match_glyph_placement():
+    renderer = LineRenderer(SYNTHETIC_FONT, height=13)
+    text = "HI0"
+    pixels = _unpack(renderer.render_line(text))
+
+    face = freetype.Face(SYNTHETIC_FONT)
+    face.set_pixel_sizes(0, 13)
+    expected = np.zeros_like(pixels)
+    for char, x, y in renderer.layout(text)[0]:
+        face.load_char(char)
+        ink = bitmap_pixels(face.glyph.bitmap) > 0
+        expected[y:y + ink.shape[0], x:x + ink.shape[1]] |= ink
+    assert np.array_equal(pixels, expected)
+    assert renderer.clipped == {}
+
+
+def test_short_line_reports_clipped_ink():
+    renderer = LineRenderer(SYNTHETIC_FONT, height=13, line_height=8)
+    width, height, _ = renderer.render_line("A")
+    assert height == 8
+    assert renderer.clipped["A"] > 0
+
+
+@pytest.mark.skipif(not os.path.exists(DEJAVU), reason="DejaVu Sans not installed")
+def test_default_line_keeps_descenders():
+    renderer = LineRenderer(DEJAVU, height=13)
+    pixels = _unpack(renderer.render_line("gjpqy"))
+    assert renderer.clipped == {}
+    assert pixels[renderer.baseline:].any()
+
+
+# Labels are kerned with the same table metrics.py exports.
+def test_label_kerning_matches_exported_table():
+    renderer = LineRenderer(SYNTHETIC_FONT, height=13)
+    face = freetype.Face(SYNTHETIC_FONT)
+    face.set_pixel_sizes(0, 13)
+    kerning = extract_kerning(face, SYNTHETIC_FONT, "AVB")
+    assert kerning.lookup(0, 1) < 0
+
+    (_, a, _), (_, v, _) = renderer.layout("AV")[0]
+    (_, _, _), (_, b, _) = renderer.layout("AB")[0]
+    assert (v - a) - (b - a) == kerning.lookup(0, 1)
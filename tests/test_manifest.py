@@ -0,0 +1,46 @@
+import json
+
+import manifest
+from glyph_render import render_glyphset
+from glyphset import read_glyph_pack
+from golden import SYNTHETIC_FONT
+
+
+def _write_manifest(tmp_path, jobs):
+    path = tmp_path / "fonts.json"
+    path.write_text(json.dumps({"jobs": jobs}), encoding="utf-8")
+    return str(path)
+
+
+def test_load_manifest_expands_sizes_and_charset_file(tmp_path):
+    (tmp_path / "digits.txt").write_text("0 1 2\n2 3\n", encoding="utf-8")
+    path = _write_manifest(tmp_path, [
+        {"font": SYNTHETIC_FONT, "sizes": [13, 16], "width": 7, "charset": "ABCA",
+         "output": "out/a_{size}_{width}.h"},
+        {"font": SYNTHETIC_FONT, "charset_file": "digits.txt", "output": "out/digits.gpk"},
+    ])
+    jobs = manifest.load_manifest(path)
+    assert [(job["height"], job["width"], job["chars"]) for job in jobs] == [
+        (13, 7, "ABC"), (16, 7, "ABC"), (13, None, "0123")]
+    assert jobs[0]["output"] == str(tmp_path / "out" / "a_13_7.h")
+    assert jobs[2]["charset_file"] == str(tmp_path / "digits.txt")
+
+
+def test_plan_units_orders_chunks_by_cost():
+    jobs = [{"font": "a.ttf", "width": 7, "height": 13, "chars": "ABCDE"},
+            {"font": "b.ttf", "width": None, "height": 32, "chars": "XY"}]
+    units = manifest.plan_units(jobs, chunk_glyphs=2)
+    assert [(unit[0], unit[1], unit[5]) for unit in units] == [
+        (1, 0, "XY"), (0, 0, "AB"), (0, 1, "CD"), (0, 2, "E")]
+
+
+def test_run_jobs_matches_direct_render(tmp_path):
+    path = _write_manifest(tmp_path, [
+        {"font": SYNTHETIC_FONT, "size": 13, "width": 7, "charset": "ABCDEFGH0123", "output": "out.gpk"}])
+    outputs = manifest.run_jobs(manifest.load_manifest(path), processes=1, chunk_glyphs=5)
+    glyphs, _ = read_glyph_pack(str(tmp_path / "out.gpk"))
+    whole = render_glyphset(SYNTHETIC_FONT, "ABCDEFGH0123", 7, 13)
+    assert list(outputs) == [str(tmp_path / "out.gpk")]
+    assert glyphs.chars == whole.chars
+    for char in whole:
+        assert glyphs.get(char) == whole.get(char)
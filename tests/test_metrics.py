@@ -0,0 +1,50 @@
+import re
+import shutil
+import subprocess
+
+import pytest
+
+from glyphset import read_glyph_pack
+from golden import SYNTHETIC_FONT
+from metrics import GlyphMetrics, KerningTable, export_proportional_font, write_metrics_header
+
+CHARS = "AVTLF."
+
+
+def _header_array(text, name):
+    body = re.search(rf"{name}\[\]\s*=\s*\{{([^}}]*)\}}", text).group(1)
+    return [int(value, 0) for value in body.replace(",", " ").split()]
+
+
+def test_metrics_and_kerning_round_trip(tmp_path):
+    glyphs, metrics, kerning = export_proportional_font(SYNTHETIC_FONT, CHARS, 13, str(tmp_path), "syn")
+    assert kerning.lookup(CHARS.index("A"), CHARS.index("V")) < 0
+
+    packed, sections = read_glyph_pack(str(tmp_path / "syn.gpk"))
+    assert packed.chars == list(CHARS)
+    read_metrics = GlyphMetrics.from_section(sections[b"MTRX"])
+    read_kerning = KerningTable.from_section(sections[b"KERN"])
+    assert read_metrics.chars == metrics.chars
+    assert read_metrics.advances == metrics.advances
+    assert read_metrics.bearings_x == metrics.bearings_x
+    assert read_kerning.keys == kerning.keys
+    assert read_kerning.values == kerning.values
+
+    header = (tmp_path / "syn_metrics.h").read_text()
+    assert _header_array(header, "syn_kern_keys") == list(kerning.keys)
+    assert _header_array(header, "syn_kern_values") == list(kerning.values)
+
+
+# Kerning is stored as int16; the header must not narrow it.
+@pytest.mark.skipif(shutil.which("gcc") is None, reason="gcc not installed")
+def test_large_kerning_survives_the_header(tmp_path):
+    metrics = GlyphMetrics()
+    metrics.add("A", 40, 0, 30, 38, 30)
+    metrics.add("V", 40, 0, 30, 38, 30)
+    header = tmp_path / "big.h"
+    write_metrics_header(metrics, KerningTable({1: -300}), str(header), "big")
+
+    source = tmp_path / "main.c"
+    source.write_text('#include "big.h"\nint main(void) { return big_kern_lookup(0, 1) == -300 ? 0 : 1; }\n')
+    subprocess.run(["gcc", "-std=c99", "-o", str(tmp_path / "main"), str(source)], check=True, cwd=tmp_path)
+    assert subprocess.run([str(tmp_path / "main")]).returncode == 0
@@ -0,0 +1,47 @@
+import freetype
+import pytest
+
+import outline_raster
+from glyph_render import render_glyphset
+from golden import SYNTHETIC_FONT
+
+CHARS = " -.0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def _reference(forced_width, threshold=0.5):
+    face = freetype.Face(SYNTHETIC_FONT)
+    return render_glyphset(SYNTHETIC_FONT, CHARS, forced_width, 13, face,
+                           freetype.FT_LOAD_RENDER | freetype.FT_LOAD_NO_HINTING, int(threshold * 255))
+
+
+@pytest.mark.parametrize("forced_width", [None, 7])
+def test_matches_unhinted_freetype(forced_width):
+    outlines = outline_raster.OutlineSet(freetype.Face(SYNTHETIC_FONT), CHARS)
+    glyphs = outline_raster.rasterize(outlines, 13, forced_width, supersample=8)
+    reference = _reference(forced_width)
+    assert glyphs.chars == reference.chars
+    assert list(glyphs.widths) == list(reference.widths)
+    assert not any(outline_raster.pixel_diff(reference, glyphs).values())
+
+
+def test_fill_rules_agree_on_simple_outlines():
+    outlines = outline_raster.OutlineSet(freetype.Face(SYNTHETIC_FONT), "AO08")
+    nonzero = outline_raster.rasterize(outlines, 13, 7)
+    evenodd = outline_raster.rasterize(outlines, 13, 7, fill_rule="evenodd")
+    assert not any(outline_raster.pixel_diff(nonzero, evenodd).values())
+
+
+def test_lower_threshold_adds_ink():
+    outlines = outline_raster.OutlineSet(freetype.Face(SYNTHETIC_FONT), "AO")
+    strict = outline_raster.rasterize(outlines, 13, 7, threshold=0.9)
+    loose = outline_raster.rasterize(outlines, 13, 7, threshold=0.1)
+    for char in strict:
+        strict_ink = sum(map(sum, strict.pixel_rows(char)))
+        loose_ink = sum(map(sum, loose.pixel_rows(char)))
+        assert loose_ink > strict_ink
+
+
+def test_unknown_fill_rule_is_rejected():
+    outlines = outline_raster.OutlineSet(freetype.Face(SYNTHETIC_FONT), "A")
+    with pytest.raises(ValueError, match="Unknown fill rule"):
+        outline_raster.rasterize(outlines, fill_rule="winding")
@@ -0,0 +1,17 @@
+import numpy as np
+
+from placement import place_glyphs
+
+
+def test_negative_bearing_is_not_clipped():
+    bitmap = np.full((3, 4), 255, dtype=np.uint8)
+    cells, clipped = place_glyphs([bitmap], np.array([-2]), np.array([3]), 6, 5, baseline=4)
+    assert clipped.tolist() == [0]
+    assert cells[0, 1:4, 0:4].all()
+    assert cells[0].sum() == 12
+
+
+def test_ink_past_the_cell_is_counted():
+    bitmap = np.full((3, 4), 255, dtype=np.uint8)
+    cells, clipped = place_glyphs([bitmap], np.array([3]), np.array([3]), 6, 5, baseline=4)
+    assert clipped.tolist() == [6]
@@ -0,0 +1,61 @@
+import numpy as np
+
+import preview
+from glyph_render import render_glyphset
+from glyphset import GlyphSet
+from golden import SYNTHETIC_FONT
+
+
+def _render(chars):
+    return render_glyphset(SYNTHETIC_FONT, chars, 7, 13)
+
+
+def test_stack_glyphs_matches_pixel_rows():
+    glyphs = _render("ABC")
+    stack = preview.stack_glyphs(glyphs, ["C", "X", "A"], 13, 7)
+    assert (stack[0] == np.array(glyphs.pixel_rows("C"))).all()
+    assert not stack[1].any()
+    assert (stack[2] == np.array(glyphs.pixel_rows("A"))).all()
+
+
+def test_sheet_layout():
+    glyphs = _render("ABCDEF")
+    sheet, stats = preview.contact_sheet(glyphs, columns=4)
+    assert stats == {}
+    assert sheet.shape == (1 + 2 * (13 + preview.GAP), 1 + 4 * (7 + preview.GAP))
+    # Second row, first column holds "E"
+    cell = sheet[1 + 14:1 + 14 + 13, 1:1 + 7]
+    assert (cell == np.array(glyphs.pixel_rows("E")) * preview.INK).all()
+    # Unused cells stay grid coloured
+    assert (sheet[1 + 14:, 1 + 2 * 8:] == preview.GRID).all()
+
+
+def test_diff_overlay_marks_changes():
+    previous = _render("ABD")
+    fresh = _render("ABC")
+    width, height, bits = fresh.get("A")
+    edited = bytearray(bits)
+    # Toggle the top-left pixel of "A"
+    edited[0] ^= 0x01
+    glyphs = GlyphSet(bit_order="lsb")
+    glyphs.add("A", width, height, bytes(edited))
+    for char in "BC":
+        glyphs.add(char, *fresh.get(char))
+
+    sheet, stats = preview.contact_sheet(glyphs, previous, columns=8)
+    assert stats == {"added": ["C"], "removed": ["D"], "changed": ["A"]}
+    was_ink = previous.pixel_rows("A")[0][0]
+    assert sheet[1, 1] == (preview.REMOVED if was_ink else preview.ADDED)
+    assert preview.CHANGED in sheet[1:14, 1:8]
+    assert preview.CHANGED not in sheet[1:14, 9:16]
+    # The removed glyph is appended after the current ones, in red on a tinted cell
+    removed = sheet[1:14, 1 + 3 * 8:1 + 3 * 8 + 7]
+    expected = np.where(np.array(previous.pixel_rows("D")), preview.REMOVED, preview.CHANGED)
+    assert (removed == expected).all()
+
+
+def test_labels_spell_the_codepoint():
+    labels = preview.render_codepoint_labels([0x41], 4)
+    digits = [labels[0, :, 4 * i:4 * i + 3] for i in range(4)]
+    for pixels, nibble in zip(digits, (0, 0, 4, 1)):
+        assert (pixels == preview._DIGITS[nibble]).all()
@@ -0,0 +1,86 @@
+import json
+import os
+import threading
+import time
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+import pytest
+
+import server
+from golden import SYNTHETIC_FONT
+
+FONT_DIR = os.path.dirname(SYNTHETIC_FONT)
+FONT = os.path.basename(SYNTHETIC_FONT)
+
+
+def _wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+# A second request for a glyph that is still being rendered waits for that render.
+def test_concurrent_requests_are_coalesced(monkeypatch):
+    pool = server.FacePool(FONT_DIR)
+    release = threading.Event()
+    render_glyph = server.render_glyph
+
+    def slow_render(*args):
+        release.wait(5)
+        return render_glyph(*args)
+
+    monkeypatch.setattr(server, "render_glyph", slow_render)
+    results = {}
+    first = threading.Thread(target=lambda: results.update(first=pool.render(FONT, 13, "A")))
+    second = threading.Thread(target=lambda: results.update(second=pool.render(FONT, 13, "A")))
+    first.start()
+    _wait_for(lambda: pool.inflight)
+    second.start()
+    _wait_for(lambda: pool.counts["coalesced"] == 1)
+    release.set()
+    first.join()
+    second.join()
+
+    assert results["first"] == results["second"]
+    assert pool.counts["rendered"] == 1
+    assert pool.render(FONT, 13, "A") == results["first"]
+    assert pool.counts["cache_hits"] == 1
+
+
+@pytest.fixture
+def url():
+    httpd = server.make_server(port=0, font_dir=FONT_DIR)
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _post(url, body):
+    request = Request(url + "/render", data=json.dumps(body).encode("utf-8"))
+    with urlopen(request) as response:
+        return json.load(response)
+
+
+@pytest.mark.parametrize("body", [
+    {"font": FONT, "chars": ["AB"]},
+    {"font": FONT, "chars": "AB", "width": "7"},
+    {"font": FONT, "chars": "AB", "size": 0},
+    {"chars": "AB"},
+    ["not", "an", "object"],
+])
+def test_malformed_request_is_a_400(url, body):
+    with pytest.raises(HTTPError) as error:
+        _post(url, body)
+    assert error.value.code == 400
+    with urlopen(url + "/stats") as response:
+        assert json.load(response)["errors"] == 1
+
+
+def test_render_request(url):
+    glyphs = server.request_glyphs(url, FONT, 13, "AB", width=7)
+    assert [glyph["char"] for glyph in glyphs] == ["A", "B"]
+    assert all(len(bytes.fromhex(glyph["bits"])) == 13 for glyph in glyphs)
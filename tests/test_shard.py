@@ -0,0 +1,30 @@
+import pytest
+
+import shard
+from glyph_render import render_glyphset
+from golden import SYNTHETIC_FONT
+
+
+def _render_all(tmp_path, chars, count):
+    return [shard.render_shard(SYNTHETIC_FONT, chars, index, count, 7, 13, str(tmp_path))
+            for index in range(count)]
+
+
+def test_split_and_merge_matches_single_run(tmp_path):
+    files = _render_all(tmp_path, "ABCDEF0123", 3)
+    merged = shard.merge_shards(files)
+    whole = render_glyphset(SYNTHETIC_FONT, "0123ABCDEF", 7, 13)
+    assert merged.chars == whole.chars
+    for char in whole:
+        assert merged.get(char) == whole.get(char)
+
+
+def test_charset_with_duplicates_merges(tmp_path):
+    merged = shard.merge_shards(_render_all(tmp_path, "ABCA", 2))
+    assert merged.chars == ["A", "B", "C"]
+
+
+def test_missing_shard_is_rejected(tmp_path):
+    files = _render_all(tmp_path, "ABCDEF", 3)
+    with pytest.raises(ValueError, match="Missing shards: 1"):
+        shard.merge_shards([files[0], files[2]])
@@ -0,0 +1,36 @@
+import os
+
+import freetype
+import numpy as np
+
+import strikes
+from glyph_render import render_glyphset
+from golden import SYNTHETIC_FONT
+
+STRIKES_FONT = os.path.join(os.path.dirname(SYNTHETIC_FONT), "synthetic_strikes.ttf")
+
+
+def test_lists_and_finds_strikes():
+    face = freetype.Face(STRIKES_FONT)
+    assert [ppem for ppem, _, _ in strikes.list_strikes(face)] == [8, 16]
+    assert strikes.find_strike(face, 16) == 1
+    assert strikes.find_strike(face, 13) is None
+
+
+def test_letters_come_from_the_strike():
+    glyphs, sources = strikes.render_with_strikes(STRIKES_FONT, "AB0.", None, 16)
+    assert sources == {"A": "strike", "B": "strike", "0": "outline", ".": "outline"}
+    # Design pixels are whole 2x2 squares at 16 ppem, which no outline render produces
+    for char in "AB":
+        pixels = np.array(glyphs.pixel_rows(char))
+        assert pixels.any()
+        assert (pixels[::2] == pixels[1::2]).all()
+        assert (pixels[:, ::2] == pixels[:, 1::2]).all()
+
+
+def test_without_a_matching_strike_everything_is_outlines():
+    glyphs, sources = strikes.render_with_strikes(STRIKES_FONT, "AB0", 7, 13)
+    assert set(sources.values()) == {"outline"}
+    plain = render_glyphset(SYNTHETIC_FONT, "AB0", 7, 13)
+    for char in plain:
+        assert glyphs.get(char) == plain.get(char)
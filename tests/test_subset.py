@@ -0,0 +1,50 @@
+import numpy as np
+
+import subset
+from golden import SYNTHETIC_FONT
+
+TEXT = "HELLO WORLD\nhello, world! 2024\nété 中文\n" * 50
+
+
+def _expected_counts(text):
+    counts = np.zeros(subset.CODEPOINTS, dtype=np.int64)
+    for char in text:
+        counts[ord(char)] += 1
+    counts[subset._CONTROL] = 0
+    return counts
+
+
+def test_chunked_and_parallel_counts_match(tmp_path, monkeypatch):
+    path = tmp_path / "corpus.txt"
+    path.write_text(TEXT, encoding="utf-8")
+    expected = _expected_counts(TEXT)
+
+    # Tiny chunks put chunk boundaries inside multi-byte characters
+    monkeypatch.setattr(subset, "CHUNK_BYTES", 7)
+    assert (subset.count_codepoints([str(path)]) == expected).all()
+    assert (subset.count_codepoints([str(path)], processes=3) == expected).all()
+
+
+def test_split_file_covers_every_byte_on_line_starts(tmp_path):
+    path = tmp_path / "corpus.txt"
+    path.write_text(TEXT, encoding="utf-8")
+    data = path.read_bytes()
+    ranges = subset.split_file(str(path), 4)
+    assert ranges[0][1] == 0 and ranges[-1][2] == len(data)
+    for (_, _, end), (_, start, _) in zip(ranges, ranges[1:]):
+        assert end == start and data[start - 1:start] == b"\n"
+
+
+def test_select_charset_only_spends_budget_on_supported_codepoints():
+    counts = _expected_counts("aaaaaa" + "AAAA" + "BB" + "D" + "zz")
+    chars, missing, achieved = subset.select_charset(counts, SYNTHETIC_FONT, coverage=0.4)
+    # The font has no lowercase, so "a" is reported and "A", "B" cover what they can
+    assert chars == "AB"
+    assert missing == "a"
+    assert achieved == 6 / 15
+
+    # Out of reach for this font: everything it has, and it falls short of the target
+    chars, missing, achieved = subset.select_charset(counts, SYNTHETIC_FONT, coverage=0.9)
+    assert chars == "ABD"
+    assert missing == "az"
+    assert achieved == 7 / 15
@@ -0,0 +1,33 @@
+import glyph_render
+from golden import GOLDEN_CHARS, SYNTHETIC_FONT
+from glyphset import write_glyphset_header
+from transcode import transcode
+from xbm_reader import load_outputs
+
+
+def _header(tmp_path, glyphs, name):
+    path = str(tmp_path / name)
+    write_glyphset_header(glyphs, path)
+    return path
+
+
+# Headers written by write_glyphset_header declare an LSB bit order; reading them as
+# testing.py MSB rows used to turn 0x7e into 0x07 on every transcode.
+def test_lsb_header_round_trip(tmp_path):
+    glyphs = glyph_render.render_glyphset(SYNTHETIC_FONT, GOLDEN_CHARS, forced_width=12, height=13)
+    loaded = load_outputs(_header(tmp_path, glyphs, "row.h"))
+    assert loaded.bit_order == "lsb"
+
+    same = transcode(loaded, "row", "lsb")
+    for char in glyphs:
+        assert same.get(char) == glyphs.get(char)
+
+
+def test_page_header_round_trip(tmp_path):
+    glyphs = glyph_render.render_glyphset(SYNTHETIC_FONT, GOLDEN_CHARS, forced_width=12, height=13)
+    page = load_outputs(_header(tmp_path, transcode(glyphs, "page", "msb"), "page.h"))
+    assert (page.layout, page.bit_order) == ("page", "msb")
+
+    back = transcode(page, "row", "lsb")
+    for char in glyphs:
+        assert back.get(char) == glyphs.get(char)
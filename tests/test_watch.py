@@ -0,0 +1,14 @@
+import os
+
+from glyphset import GlyphSet
+from watch import Watcher
+
+
+# An emptied charset on the first build has nothing to diff against and must still
+# write its (empty) output instead of killing the watch loop.
+def test_first_build_with_empty_charset(tmp_path):
+    output = str(tmp_path / "empty.h")
+    watcher = Watcher(str(tmp_path / "fonts.json"))
+    assert watcher._write_output(output, GlyphSet()) is True
+    assert os.path.exists(output)
+    assert watcher._write_output(output, GlyphSet()) is False
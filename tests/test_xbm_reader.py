@@ -0,0 +1,71 @@
+import shutil
+import subprocess
+
+import pytest
+
+import testing
+from glyphset import GlyphSet, write_glyphset_header, write_xbm_dir
+from xbm_reader import load_c_header, parse_xbm_bytes
+
+
+# testing.py writes one int per row; a 12 px row whose value is below 0x100 must still
+# come back as two bytes, not be read as a single byte.
+def test_wide_testing_header_rows(tmp_path):
+    header = tmp_path / "wide.h"
+    testing.write_c_header(str(header), ord("A"), [0x0f0, 0x0ff, 0x00f], 12, 3)
+
+    glyphs = load_c_header(str(header))
+    assert glyphs.get("A") == (12, 3, b"\x00\xf0\x00\xff\x00\x0f")
+    assert glyphs.pixel_rows("A")[0] == [0] * 4 + [1] * 4 + [0] * 4
+
+
+def test_wide_blank_testing_header(tmp_path):
+    header = tmp_path / "blank.h"
+    testing.write_c_header(str(header), ord(" "), [0, 0, 0, 0], 16, 4)
+
+    glyphs = load_c_header(str(header))
+    assert glyphs.get(" ") == (16, 4, bytes(8))
+
+
+def test_byte_per_value_header():
+    source = (b"#define char_66_width 12\n#define char_66_height 2\n"
+              b"static unsigned char char_66_bits[] = {\n   0x01, 0x08, 0xff, 0x0f\n};\n")
+    glyphs = GlyphSet(bit_order="lsb")
+    assert parse_xbm_bytes(source, glyphs) == 1
+    assert glyphs.get("B") == (12, 2, b"\x01\x08\xff\x0f")
+
+
+def test_zero_width_glyph():
+    source = b"#define x_width 0\nstatic char x_bits[] = { };\n"
+    glyphs = GlyphSet(bit_order="lsb")
+    assert parse_xbm_bytes(source, glyphs) == 1
+    assert glyphs.get("x") == (0, 0, b"")
+
+
+# get() must not hand out a view that blocks later add() calls from growing the buffer
+def test_add_after_get():
+    glyphs = GlyphSet()
+    glyphs.add("a", 8, 1, b"\x01")
+    width, height, bits = glyphs.get("a")
+    glyphs.add("b", 8, 1, b"\x02")
+    assert bits == b"\x01"
+    assert glyphs.get("b") == (8, 1, b"\x02")
+
+
+# A natural-width space has no bytes; the header must still be strict ISO C and read back empty.
+@pytest.mark.skipif(shutil.which("gcc") is None, reason="gcc not installed")
+def test_empty_glyph_header_is_valid_c(tmp_path):
+    glyphs = GlyphSet(bit_order="lsb")
+    glyphs.add(" ", 0, 13, b"")
+    glyphs.add("A", 8, 1, b"\x18")
+    header = tmp_path / "font.h"
+    write_glyphset_header(glyphs, str(header))
+    write_xbm_dir(glyphs, str(tmp_path / "xbm"))
+
+    source = tmp_path / "font.c"
+    source.write_text('#include "font.h"\n#include "xbm/ .xbm"\nint main(void) { return char_32_bits[0] + _bits[0]; }\n')
+    subprocess.run(["gcc", "-std=c99", "-pedantic-errors", "-fsyntax-only", str(source)], check=True, cwd=tmp_path)
+
+    loaded = load_c_header(str(header))
+    assert loaded.get(" ") == (0, 13, b"")
+    assert loaded.get("A") == (8, 1, b"\x18")
@@ -0,0 +1,131 @@
+import sys
+
+import numpy as np
+
+from glyphset import GlyphSet, write_glyphset_header
+from xbm_reader import load_outputs
+
+# Converts packed glyph buffers between the byte layouts our display controllers want,
+# so firmware never has to rotate or bit-reverse glyphs at runtime.
+#
+# Every conversion goes through a (N, height, width) 0/1 pixel array. Glyphs of the same
+# size are handled as one batch, so a whole GlyphSet costs one unpack and one pack per
+# distinct glyph size. The per-layout work is looked up in the UNPACKERS/PACKERS tables.
+
+
+def _packed_size(layout, width, height):
+    if layout == "row":
+        return height * ((width + 7) // 8)
+    return width * ((height + 7) // 8)
+
+
+def _unpack_row(packed, width, height, bit_order):
+    bytes_per_row = (width + 7) // 8
+    rows = packed.reshape(len(packed), height, bytes_per_row)
+    if bit_order == "lsb":
+        return np.unpackbits(rows, axis=2, bitorder="little")[:, :, :width]
+    # testing.py rows are right-aligned big-endian integers
+    return np.unpackbits(rows, axis=2, bitorder="big")[:, :, bytes_per_row * 8 - width:]
+
+
+def _unpack_page(packed, width, height, bit_order):
+    pages = (height + 7) // 8
+    bands = packed.reshape(len(packed), pages, width, 1)
+    bits = np.unpackbits(bands, axis=3, bitorder="little" if bit_order == "lsb" else "big")
+    return bits.transpose(0, 1, 3, 2).reshape(len(packed), pages * 8, width)[:, :height]
+
+
+def _unpack_column(packed, width, height, bit_order):
+    pages = (height + 7) // 8
+    columns = packed.reshape(len(packed), width, pages, 1)
+    bits = np.unpackbits(columns, axis=3, bitorder="little" if bit_order == "lsb" else "big")
+    return bits.reshape(len(packed), width, pages * 8)[:, :, :height].transpose(0, 2, 1)
+
+
+def _pack_row(pixels, bit_order):
+    count, height, width = pixels.shape
+    pad = (width + 7) // 8 * 8 - width
+    if bit_order == "lsb":
+        padded = np.pad(pixels, ((0, 0), (0, 0), (0, pad)))
+        return np.packbits(padded, axis=2, bitorder="little").reshape(count, -1)
+    padded = np.pad(pixels, ((0, 0), (0, 0), (pad, 0)))
+    return np.packbits(padded, axis=2, bitorder="big").reshape(count, -1)
+
+
+def _pack_page(pixels, bit_order):
+    count, height, width = pixels.shape
+    pages = (height + 7) // 8
+    padded = np.pad(pixels, ((0, 0), (0, pages * 8 - height), (0, 0)))
+    bands = padded.reshape(count, pages, 8, width).transpose(0, 1, 3, 2)
+    bits = np.packbits(bands, axis=3, bitorder="little" if bit_order == "lsb" else "big")
+    return bits.reshape(count, -1)
+
+
+def _pack_column(pixels, bit_order):
+    count, height, width = pixels.shape
+    pages = (height + 7) // 8
+    padded = np.pad(pixels, ((0, 0), (0, pages * 8 - height), (0, 0)))
+    columns = padded.transpose(0, 2, 1).reshape(count, width, pages, 8)
+    bits = np.packbits(columns, axis=3, bitorder="little" if bit_order == "lsb" else "big")
+    return bits.reshape(count, -1)
+
+
+UNPACKERS = {"row": _unpack_row, "page": _unpack_page, "column": _unpack_column}
+PACKERS = {"row": _pack_row, "page": _pack_page, "column": _pack_column}
+
+
+# Unpacks a whole GlyphSet into pixel arrays, one batch per glyph size.
+# Yields (glyph indices, (N, height, width) uint8 array of 0/1 pixels).
+# Glyphs whose stored data is shorter than their size implies are padded with blank rows.
+def unpack_groups(glyphs):
+    groups = {}
+    for i in range(len(glyphs)):
+        groups.setdefault((glyphs.widths[i], glyphs.heights[i]), []).append(i)
+
+    # Zero padding past the end lets short glyphs be gathered without bounds checks
+    sizes = {key: _packed_size(glyphs.layout, *key) for key in groups}
+    data = np.frombuffer(bytes(glyphs.data) + bytes(max(sizes.values(), default=0)), dtype=np.uint8)
+    unpack = UNPACKERS[glyphs.layout]
+    for (width, height), indices in groups.items():
+        size = sizes[(width, height)]
+        offsets = np.array([glyphs.offsets[i] for i in indices], dtype=np.int64)
+        stored = np.array([glyphs.sizes[i] for i in indices], dtype=np.int64)
+
+        columns = np.arange(size)
+        packed = data[offsets[:, None] + columns] * (columns < stored[:, None])
+        yield np.array(indices), unpack(packed.astype(np.uint8), width, height, glyphs.bit_order)
+
+
+# Builds a GlyphSet in the requested layout from (indices, pixel array) batches.
+def pack_groups(glyphs, groups, layout="row", bit_order="lsb"):
+    pack = PACKERS[layout]
+    packed_by_index = {}
+    for indices, pixels in groups:
+        packed = pack(pixels, bit_order)
+        for i, bits in zip(indices, packed):
+            packed_by_index[int(i)] = bits.tobytes()
+
+    result = GlyphSet(bit_order=bit_order, layout=layout)
+    for i, char in enumerate(glyphs.chars):
+        result.add(char, glyphs.widths[i], glyphs.heights[i], packed_by_index[i])
+    return result
+
+
+# Converts a GlyphSet to another layout and bit order.
+#   transcode(glyphs, "page", "lsb")  -> SSD1306/ST7565 vertical page bytes
+#   transcode(glyphs, "row", "msb")   -> testing.py style rows
+def transcode(glyphs, layout="page", bit_order="lsb"):
+    if layout not in PACKERS:
+        raise ValueError(f"Unknown layout {layout!r}, expected one of {', '.join(PACKERS)}")
+    if bit_order not in ("lsb", "msb"):
+        raise ValueError(f"Unknown bit order {bit_order!r}, expected 'lsb' or 'msb'")
+    return pack_groups(glyphs, unpack_groups(glyphs), layout, bit_order)
+
+
+if __name__ == "__main__":
+    # Directory of .xbm files or a generated .h header to convert
+    path = sys.argv[1] if len(sys.argv) > 1 else "output"
+
+    # Target layout for an SSD1306 panel
+    glyphs = transcode(load_outputs(path), layout="page", bit_order="lsb")
+    write_glyphset_header(glyphs, "glyphs_page.h")
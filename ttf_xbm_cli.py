@@ -0,0 +1,469 @@
+import time
+
+_START = time.perf_counter()
+
+import argparse
+import os
+import sys
+
+# Single command line entry point for the converters in this repo.
+#
+# Only argparse and the standard library are imported up front. freetype, numpy and PIL
+# are pulled in by the command that actually needs them, so a one glyph CI check does
+# not pay for numpy and "--help" costs no more than a bare interpreter.
+#
+#   ttf-xbm convert font.ttf ABC --width 7 --height 13 --output-dir out
+#   ttf-xbm convert font.ttf J --variant WORKING --width 22 --height 39
+#   ttf-xbm convert font.ttf Agjpy --width 7 --height 13 --align baseline
+#   ttf-xbm metrics font.ttf ABC --height 13
+#   ttf-xbm autofit font.ttf ABCabc123 --cell 7x13 --align baseline --output out/font.h
+#   ttf-xbm labels font.ttf --label label_menu=MENU --output labels.h
+#   ttf-xbm transcode out --layout page --output glyphs_page.h
+#   ttf-xbm build fonts.json --processes 8
+#   ttf-xbm shard NotoSansCJK.ttf --shards 8 --index 3 --shard-dir shards   (one node)
+#   ttf-xbm shard NotoSansCJK.ttf --shards 8 --output out/cjk.h            (all shards as local processes)
+#   ttf-xbm merge shards/*.gpk --output out/cjk.h
+#   ttf-xbm watch fonts.json
+#   ttf-xbm serve --font-dir fonts --port 8765   (or --socket /tmp/glyphs.sock)
+#   ttf-xbm collection NotoSansCJK.ttc "ABC中文" --output "out/{face}_{instance}.h"
+#   ttf-xbm collection Inter.ttf ABC --instance named --instance "wght=650,opsz=14"
+#   ttf-xbm subset NotoSansCJK.ttf corpus/*.txt --coverage 99.5 --processes 8 --output out/cjk.h
+#   ttf-xbm strikes NotoSansCJK.ttf "ABC中文" --height 12 --output out/cjk12.h
+#   ttf-xbm fallback "ABC中文" Courier.ttf NotoSansCJK.ttf --output out/merged.h
+#   ttf-xbm preview out --previous old.gpk --labels --output sheet.png
+#   ttf-xbm diff old_output new.gpk --limit 20 --sheet changes.png
+#   ttf-xbm raster-bench font.ttf ABCabc --height 16 --supersample 8
+#   ttf-xbm golden [--update]
+
+# Jobs up to this many glyphs use the pure-Python packer and skip importing numpy.
+SMALL_JOB_GLYPHS = 16
+
+_import_seconds = 0.0
+
+
+# Imports a module on first use and keeps track of how long the imports took.
+def lazy_import(name):
+    global _import_seconds
+    if name in sys.modules:
+        return sys.modules[name]
+    start = time.perf_counter()
+    module = __import__(name)
+    _import_seconds += time.perf_counter() - start
+    return module
+
+
+# golden.py and the original scripts are not installed; they only exist in a checkout.
+def _load_golden():
+    try:
+        return lazy_import("golden")
+    except ModuleNotFoundError as e:
+        if e.name != "golden":
+            raise
+        raise SystemExit("--variant and golden need a source checkout: run python ttf_xbm_cli.py from the repo.")
+
+
+def _variant_kwargs(template, width, height):
+    kwargs = {}
+    for key in template:
+        if key == "grid_size":
+            kwargs[key] = (width, height)
+        elif "width" in key:
+            kwargs[key] = width
+        else:
+            kwargs[key] = height
+    return kwargs
+
+
+# Runs one of the original scripts' convert functions with the output redirected to output_dir.
+def _convert_with_variant(args, chars):
+    golden = _load_golden()
+    if args.variant not in golden.VARIANTS:
+        raise SystemExit(f"Unknown variant {args.variant!r}, expected one of: fast, {', '.join(golden.VARIANTS)}")
+
+    start = time.perf_counter()
+    module = golden.load_variant(args.variant)
+    global _import_seconds
+    _import_seconds += time.perf_counter() - start
+
+    # The original scripts all expect a cell width; 7 is their common default
+    width = args.width or 7
+    template = golden.VARIANTS[args.variant][1]
+    if args.variant == "testing":
+        output_file = args.header or os.path.join(args.output_dir, "font.h")
+        module.generate_c_header(args.font, output_file, chars, (width, args.height))
+        return
+
+    if not os.path.exists(args.output_dir):
+        os.makedirs(args.output_dir)
+    write_xbm_file = module.write_xbm_file
+
+    def write_to_output_dir(char, xbm_data, width, height, output_dir=None):
+        write_xbm_file(char, xbm_data, width, height, args.output_dir)
+
+    module.write_xbm_file = write_to_output_dir
+    module.convert_ttf_to_xbm(args.font, chars, **_variant_kwargs(template, width, args.height))
+
+
+# Renders a handful of glyphs with glyphset.pack_rows instead of numpy.
+# golden.FAST_PATHS checks this against Idk2.py.
+def render_small_job(face, chars, forced_width, height):
+    freetype = lazy_import("freetype")
+    glyphset = lazy_import("glyphset")
+    face.set_pixel_sizes(0, height)
+    glyphs = glyphset.GlyphSet()
+    for char in chars:
+        face.load_char(char)
+        bitmap = face.glyph.bitmap
+        width = forced_width or bitmap.width
+        mono = bitmap.pixel_mode == freetype.FT_PIXEL_MODE_MONO
+        glyphs.add(char, width, height,
+                   glyphset.pack_rows(bitmap.buffer, bitmap.pitch, bitmap.rows, bitmap.width, width, height, mono))
+    return glyphs
+
+
+def cmd_convert(args):
+    chars = args.chars
+    if args.variant != "fast":
+        _convert_with_variant(args, chars)
+        return
+
+    freetype = lazy_import("freetype")
+    glyphset = lazy_import("glyphset")
+    face = freetype.Face(args.font)
+
+    if args.align != "top":
+        placement = lazy_import("placement")
+        glyphs, _ = placement.render_aligned(args.font, chars, args.width, args.height, args.baseline,
+                                             "center" if args.align == "center" else "bearing", face=face)
+    elif len(chars) <= SMALL_JOB_GLYPHS:
+        glyphs = render_small_job(face, chars, args.width, args.height)
+    else:
+        glyph_render = lazy_import("glyph_render")
+        glyphs = glyph_render.render_glyphset(args.font, chars, args.width, args.height, face=face)
+
+    if args.header:
+        glyphset.write_glyphset_header(glyphs, args.header)
+    else:
+        glyphset.write_xbm_dir(glyphs, args.output_dir)
+
+
+def cmd_metrics(args):
+    metrics = lazy_import("metrics")
+    metrics.export_proportional_font(args.font, args.chars, args.height, args.output_dir, args.prefix)
+
+
+def cmd_autofit(args):
+    autofit = lazy_import("autofit")
+    try:
+        width, height = (int(value) for value in args.cell.lower().split("x"))
+    except ValueError:
+        raise SystemExit(f"--cell must look like 7x13, got {args.cell!r}")
+    autofit.fit_and_render(args.font, args.chars, width, height, args.output, args.align, args.allow,
+                           args.check_advance, args.max_size)
+
+
+def cmd_labels(args):
+    line_render = lazy_import("line_render")
+    labels = dict(label.split("=", 1) for label in args.label)
+    renderer = line_render.LineRenderer(args.font, height=args.height, line_height=args.line_height,
+                                        baseline=args.baseline)
+    line_render.write_label_header(renderer.render_labels(labels), args.output)
+
+
+def cmd_transcode(args):
+    transcode = lazy_import("transcode")
+    xbm_reader = lazy_import("xbm_reader")
+    glyphset = lazy_import("glyphset")
+    glyphs = transcode.transcode(xbm_reader.load_outputs(args.path, args.input_bit_order),
+                                 args.layout, args.bit_order)
+    glyphset.write_glyphset_header(glyphs, args.output)
+
+
+def cmd_build(args):
+    manifest = lazy_import("manifest")
+    manifest.run_manifest(args.manifest, args.processes, args.chunk_glyphs)
+
+
+def _read_charset(args):
+    if args.charset_file:
+        with open(args.charset_file, encoding="utf-8") as f:
+            return "".join(f.read().split())
+    return args.charset
+
+
+def cmd_shard(args):
+    shard = lazy_import("shard")
+    freetype = lazy_import("freetype")
+    chars = _read_charset(args)
+    if args.index is None and not args.output:
+        raise SystemExit("Running every shard locally needs --output for the merged result")
+    try:
+        if args.index is None:
+            shard.run_local(args.font, args.shards, args.output, chars, args.width, args.height, args.shard_dir)
+        else:
+            shard.render_shard(args.font, chars or shard.font_charset(args.font), args.index, args.shards,
+                               args.width, args.height, args.shard_dir)
+    except (ValueError, RuntimeError, freetype.FT_Exception) as error:
+        raise SystemExit(f"Shard failed: {error}")
+
+
+def cmd_merge(args):
+    shard = lazy_import("shard")
+    try:
+        shard.merge_shard_files(args.shards, args.output)
+    except ValueError as error:
+        raise SystemExit(f"Merge failed: {error}")
+
+
+def cmd_watch(args):
+    watch = lazy_import("watch")
+    watch.watch_manifest(args.manifest, args.interval)
+
+
+def cmd_serve(args):
+    server = lazy_import("server")
+    server.serve(args.host, args.port, args.socket, args.font_dir, args.max_faces, args.verbose)
+
+
+def cmd_collection(args):
+    collection = lazy_import("collection")
+    try:
+        collection.render_collection(args.font, args.chars, args.width, args.height, args.instance, args.output)
+    except ValueError as error:
+        raise SystemExit(str(error))
+
+
+def cmd_subset(args):
+    subset = lazy_import("subset")
+    subset.subset_and_convert(args.font, args.corpus, args.output, args.coverage / 100, args.width, args.height,
+                              args.processes, args.charset_out)
+
+
+def cmd_strikes(args):
+    strikes = lazy_import("strikes")
+    if args.list:
+        freetype = lazy_import("freetype")
+        for ppem, width, height in strikes.list_strikes(freetype.Face(args.font)):
+            print(f"{ppem}px strike ({width}x{height} cell)")
+        return
+    strikes.convert_with_strikes(args.font, args.chars, args.output, args.width, args.height)
+
+
+def cmd_fallback(args):
+    fallback = lazy_import("fallback")
+    fallback.convert_with_fallback(args.fonts, args.chars, args.output, args.width, args.height)
+
+
+def cmd_preview(args):
+    preview = lazy_import("preview")
+    xbm_reader = lazy_import("xbm_reader")
+    previous = xbm_reader.load_outputs(args.previous) if args.previous else None
+    preview.save_contact_sheet(xbm_reader.load_outputs(args.path), args.output, previous,
+                               args.columns, args.labels, args.scale)
+
+
+def cmd_diff(args):
+    glyph_diff = lazy_import("glyph_diff")
+    glyph_diff.diff_outputs(args.old, args.new, args.limit, args.sheet)
+
+
+def cmd_raster_bench(args):
+    outline_raster = lazy_import("outline_raster")
+    outline_raster.benchmark(args.font, args.chars, args.height, args.width, args.threshold, args.supersample)
+
+
+def cmd_golden(args):
+    golden = _load_golden()
+    if args.update:
+        golden.update_golden()
+        return
+    failed = golden.check_all()
+    if failed:
+        raise SystemExit(f"Out of date: {', '.join(failed)}")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="ttf-xbm", description="Convert TTF glyphs to XBM bitmaps.")
+    parser.add_argument("--timings", action="store_true", help="report startup, import and run times")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    convert = commands.add_parser("convert", help="render characters to .xbm files or a C header")
+    convert.add_argument("font")
+    convert.add_argument("chars")
+    convert.add_argument("--variant", default="fast",
+                         help="'fast' (default) or one of the original scripts, e.g. WORKING, Idk2, testing")
+    convert.add_argument("--width", type=int, default=None, help="forced cell width (default: natural width)")
+    convert.add_argument("--height", type=int, default=13)
+    convert.add_argument("--output-dir", default="output")
+    convert.add_argument("--header", help="write one C header instead of .xbm files")
+    convert.add_argument("--align", choices=("top", "baseline", "center"), default="top",
+                         help="'top' copies bitmaps from the top-left like the original scripts; 'baseline' "
+                              "places them by bearing on a shared baseline, 'center' also centres them")
+    convert.add_argument("--baseline", type=int, default=None, help="baseline row for --align (default: from the font)")
+    convert.set_defaults(func=cmd_convert)
+
+    metrics = commands.add_parser("metrics", help="export advances, bearings and kerning")
+    metrics.add_argument("font")
+    metrics.add_argument("chars")
+    metrics.add_argument("--height", type=int, default=13)
+    metrics.add_argument("--output-dir", default="output")
+    metrics.add_argument("--prefix", default="font")
+    metrics.set_defaults(func=cmd_metrics)
+
+    autofit = commands.add_parser("autofit", help="find the largest pixel size that fits a cell from metrics alone")
+    autofit.add_argument("font")
+    autofit.add_argument("chars")
+    autofit.add_argument("--cell", default="7x13", help="target cell as WIDTHxHEIGHT")
+    autofit.add_argument("--align", choices=("top", "baseline", "center"), default="top",
+                         help="placement the cell is checked for (see convert --align)")
+    autofit.add_argument("--allow", type=int, default=0, help="glyphs allowed to overflow")
+    autofit.add_argument("--check-advance", action="store_true", help="also require advances to fit the cell width")
+    autofit.add_argument("--max-size", type=int, default=None, help="largest pixel size to try (default: 4x height)")
+    autofit.add_argument("--output", help="render once at the fitted size to this .h, .gpk or directory")
+    autofit.set_defaults(func=cmd_autofit)
+
+    labels = commands.add_parser("labels", help="pre-render strings into one C header")
+    labels.add_argument("font")
+    labels.add_argument("--label", action="append", default=[], metavar="NAME=TEXT")
+    labels.add_argument("--height", type=int, default=13, help="pixel size")
+    labels.add_argument("--line-height", type=int, default=None, help="rows per label (default: ascender + descender)")
+    labels.add_argument("--baseline", type=int, default=None, help="baseline row (default: the ascender)")
+    labels.add_argument("--output", default="labels.h")
+    labels.set_defaults(func=cmd_labels)
+
+    transcode = commands.add_parser("transcode", help="convert existing outputs to another byte layout")
+    transcode.add_argument("path", help="directory of .xbm files or a .h header")
+    transcode.add_argument("--layout", choices=("row", "column", "page"), default="page")
+    transcode.add_argument("--bit-order", choices=("lsb", "msb"), default="lsb")
+    transcode.add_argument("--input-bit-order", choices=("lsb", "msb"), default="msb",
+                           help="bit order of a .h input that does not declare one (testing.py headers are msb)")
+    transcode.add_argument("--output", default="glyphs.h")
+    transcode.set_defaults(func=cmd_transcode)
+
+    build = commands.add_parser("build", help="run every job of a JSON manifest on one worker pool")
+    build.add_argument("manifest")
+    build.add_argument("--processes", type=int, default=None, help="worker processes (default: all cores)")
+    build.add_argument("--chunk-glyphs", type=int, default=32, help="glyphs per work unit")
+    build.set_defaults(func=cmd_build)
+
+    shard = commands.add_parser("shard", help="render one codepoint shard, or all shards as local processes")
+    shard.add_argument("font")
+    shard.add_argument("--shards", type=int, required=True, help="total number of shards")
+    shard.add_argument("--index", type=int, help="render only this shard (0-based); omit to run all and merge")
+    shard.add_argument("--charset", help="characters to convert (default: every codepoint in the font)")
+    shard.add_argument("--charset-file")
+    shard.add_argument("--width", type=int, default=None)
+    shard.add_argument("--height", type=int, default=13)
+    shard.add_argument("--shard-dir", default="shards")
+    shard.add_argument("--output", help=".h, .gpk or directory for the merged result")
+    shard.set_defaults(func=cmd_shard)
+
+    merge = commands.add_parser("merge", help="verify shard packs and merge them into one output")
+    merge.add_argument("shards", nargs="+", help="every .gpk shard of the job")
+    merge.add_argument("--output", required=True, help=".h, .gpk or a directory")
+    merge.set_defaults(func=cmd_merge)
+
+    watch = commands.add_parser("watch", help="keep fonts loaded and rebuild a manifest's outputs on every edit")
+    watch.add_argument("manifest")
+    watch.add_argument("--interval", type=float, default=0.2, help="seconds between checks for edits")
+    watch.set_defaults(func=cmd_watch)
+
+    serve = commands.add_parser("serve", help="answer glyph requests over localhost HTTP or a Unix socket")
+    serve.add_argument("--font-dir", default=".", help="directory request font paths are resolved against")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--socket", help="serve on this Unix socket instead of TCP")
+    serve.add_argument("--max-faces", type=int, default=16, help="open (font, size) faces kept in the pool")
+    serve.add_argument("--verbose", action="store_true", help="log every request")
+    serve.set_defaults(func=cmd_serve)
+
+    collection = commands.add_parser("collection",
+                                      help="render every face of a .ttc/.otc and variable-font instances in one run")
+    collection.add_argument("font")
+    collection.add_argument("chars")
+    collection.add_argument("--instance", action="append", default=None,
+                            help="named instance, 'named' for all of them, 'default', or axis values "
+                                 "like 'wght=650,wdth=90' (repeatable; default: named)")
+    collection.add_argument("--width", type=int, default=None)
+    collection.add_argument("--height", type=int, default=13)
+    collection.add_argument("--output", default="output/{face}_{instance}.h",
+                            help="output template with {face}, {instance} and {index}")
+    collection.set_defaults(func=cmd_collection)
+
+    subset = commands.add_parser("subset", help="pick the charset from corpus frequencies and convert it")
+    subset.add_argument("font")
+    subset.add_argument("corpus", nargs="+", help="UTF-8 text files")
+    subset.add_argument("--coverage", type=float, default=99.0, help="percent of corpus characters to cover")
+    subset.add_argument("--processes", type=int, default=1, help="processes counting the corpus")
+    subset.add_argument("--charset-out", help="also write the chosen charset to this file")
+    subset.add_argument("--width", type=int, default=None)
+    subset.add_argument("--height", type=int, default=13)
+    subset.add_argument("--output", default="output/subset.h", help=".h, .gpk or a directory")
+    subset.set_defaults(func=cmd_subset)
+
+    strikes = commands.add_parser("strikes", help="use embedded bitmap strikes where the size matches")
+    strikes.add_argument("font")
+    strikes.add_argument("chars", nargs="?", default="")
+    strikes.add_argument("--list", action="store_true", help="only list the font's strikes")
+    strikes.add_argument("--width", type=int, default=None)
+    strikes.add_argument("--height", type=int, default=13)
+    strikes.add_argument("--output", default="output/strikes.h", help=".h, .gpk or a directory")
+    strikes.set_defaults(func=cmd_strikes)
+
+    fallback = commands.add_parser("fallback", help="render one charset from an ordered chain of fonts")
+    fallback.add_argument("chars")
+    fallback.add_argument("fonts", nargs="+", help="fonts in priority order")
+    fallback.add_argument("--width", type=int, default=None)
+    fallback.add_argument("--height", type=int, default=13)
+    fallback.add_argument("--output", default="output/fallback.h", help=".h, .gpk or a directory")
+    fallback.set_defaults(func=cmd_fallback)
+
+    preview = commands.add_parser("preview", help="tile a whole glyph set into one PNG contact sheet")
+    preview.add_argument("path", help="directory of .xbm files, a .h header or a .gpk glyph pack")
+    preview.add_argument("--previous", help="earlier output to overlay as a diff")
+    preview.add_argument("--labels", action="store_true", help="print each codepoint under its glyph")
+    preview.add_argument("--columns", type=int, default=64)
+    preview.add_argument("--scale", type=int, default=1, help="pixels per glyph pixel")
+    preview.add_argument("--output", default="contact_sheet.png")
+    preview.set_defaults(func=cmd_preview)
+
+    diff = commands.add_parser("diff", help="list glyphs added, removed or changed between two outputs")
+    diff.add_argument("old", help="directory of .xbm files, a .h header or a .gpk glyph pack")
+    diff.add_argument("new")
+    diff.add_argument("--limit", type=int, default=50, help="changed glyphs to list")
+    diff.add_argument("--sheet", help="also write a contact sheet with the changes overlaid")
+    diff.set_defaults(func=cmd_diff)
+
+    raster = commands.add_parser("raster-bench", help="compare the numpy outline rasterizer with FreeType")
+    raster.add_argument("font")
+    raster.add_argument("chars")
+    raster.add_argument("--width", type=int, default=None)
+    raster.add_argument("--height", type=int, default=13)
+    raster.add_argument("--threshold", type=float, default=0.5, help="coverage needed for ink (0-1)")
+    raster.add_argument("--supersample", type=int, default=4, help="samples per pixel along each axis")
+    raster.set_defaults(func=cmd_raster_bench)
+
+    golden = commands.add_parser("golden", help="check every variant and fast path against the golden outputs")
+    golden.add_argument("--update", action="store_true")
+    golden.set_defaults(func=cmd_golden)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    ready = time.perf_counter()
+    # CPU time since the process started covers the interpreter's own startup as well
+    startup_cpu = time.process_time()
+
+    args.func(args)
+
+    if args.timings:
+        done = time.perf_counter()
+        print(f"startup: {startup_cpu * 1000:.1f} ms CPU (CLI ready {(ready - _START) * 1000:.1f} ms after import), "
+              f"stage imports: {_import_seconds * 1000:.1f} ms, "
+              f"run: {(done - ready - _import_seconds) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+import os
+import sys
+import time
+
+import freetype
+
+from glyph_render import bitmap_pixels, pack_pixels
+from glyphset import GlyphSet, save_glyphset, write_xbm_dir
+from manifest import load_manifest
+
+# Long-running rebuild loop for font tuning: edit the TTF, a charset file or the manifest
+# and the outputs follow without paying interpreter startup, imports and face loading
+# again.
+#
+# The manifest (see manifest.py), every font it uses and every charset_file it points to
+# are polled by mtime/size. Between rebuilds the watcher keeps:
+#   - one open freetype.Face per font file,
+#   - the coverage bitmap of every glyph per (font, height),
+#   - the packed bits per (font, height, width) and the last GlyphSet written per output.
+# A charset edit only renders the new characters, a width change only repacks cached
+# bitmaps, and a font edit reparses that one font and re-renders its glyphs. Each output
+# is then diffed against what was last written: .xbm directories get only the changed
+# files rewritten (and stale ones removed), headers and packs are rewritten only if a
+# glyph actually changed.
+
+POLL_SECONDS = 0.2
+
+
+def _stamp(path):
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+# Returns (changed chars, removed chars) between the last written GlyphSet and a new one.
+def diff_glyphsets(previous, glyphs):
+    if previous is None:
+        return list(glyphs.chars), []
+    changed = [char for char in glyphs.chars if char not in previous or previous.get(char) != glyphs.get(char)]
+    removed = [char for char in previous.chars if char not in glyphs]
+    return changed, removed
+
+
+class Watcher:
+    def __init__(self, manifest_path):
+        self.manifest_path = manifest_path
+        self.jobs = []
+        self.stamps = {}
+        self.faces = {}
+        self.bitmaps = {}
+        self.packed = {}
+        self.outputs = {}
+
+    def watched_paths(self):
+        paths = {self.manifest_path}
+        for job in self.jobs:
+            paths.add(job["font"])
+            if job["charset_file"]:
+                paths.add(job["charset_file"])
+        return paths
+
+    # Returns the watched paths whose stamp moved since the last call.
+    def _take_changes(self):
+        changed = set()
+        for path in self.watched_paths():
+            stamp = _stamp(path)
+            if stamp != self.stamps.get(path):
+                self.stamps[path] = stamp
+                changed.add(path)
+        return changed
+
+    # Drops everything cached for a font file so the next build reparses it.
+    def _forget_font(self, font_path):
+        self.faces.pop(font_path, None)
+        for cache in (self.bitmaps, self.packed):
+            for key in [key for key in cache if key[0] == font_path]:
+                del cache[key]
+
+    def _render_job(self, job):
+        font, width, height = job["font"], job["width"], job["height"]
+        face = self.faces.get(font)
+        if face is None:
+            face = freetype.Face(font)
+            self.faces[font] = face
+
+        bitmaps = self.bitmaps.setdefault((font, height), {})
+        missing = [char for char in job["chars"] if char not in bitmaps]
+        if missing:
+            face.set_pixel_sizes(0, height)
+            for char in missing:
+                face.load_char(char)
+                bitmaps[char] = bitmap_pixels(face.glyph.bitmap)
+
+        packed = self.packed.setdefault((font, height, width), {})
+        glyphs = GlyphSet(bit_order="lsb")
+        for char in job["chars"]:
+            if char not in packed:
+                pixels = bitmaps[char]
+                glyph_width = width or pixels.shape[1]
+                packed[char] = (glyph_width, pack_pixels(pixels, glyph_width, height))
+            glyph_width, bits = packed[char]
+            glyphs.add(char, glyph_width, height, bits)
+        return glyphs, len(missing)
+
+    # Writes the parts of an output that differ from the last build. Returns True if anything was written.
+    def _write_output(self, output, glyphs):
+        previous = self.outputs.get(output)
+        changed, removed = diff_glyphsets(previous, glyphs)
+        self.outputs[output] = glyphs
+
+        if output.endswith((".h", ".gpk")):
+            if not changed and not removed and previous is not None and previous.chars == glyphs.chars:
+                return False
+            save_glyphset(glyphs, output)
+            return True
+
+        for char in removed:
+            stale = os.path.join(output, f"{char}.xbm")
+            if os.path.exists(stale):
+                os.remove(stale)
+        if changed:
+            subset = GlyphSet(bit_order=glyphs.bit_order)
+            for char in changed:
+                subset.add(char, *glyphs.get(char))
+            write_xbm_dir(subset, output)
+        return bool(changed or removed)
+
+    # Rebuilds whatever the latest edits affect. Returns False when nothing changed.
+    def update(self):
+        start = time.perf_counter()
+        changed = self._take_changes()
+        if not changed:
+            return False
+
+        charset_files = {job["charset_file"] for job in self.jobs}
+        if self.manifest_path in changed or changed & charset_files:
+            self.jobs = load_manifest(self.manifest_path)
+            # Newly referenced fonts and charset files start being watched here
+            changed |= self._take_changes()
+        for path in changed:
+            if path in self.faces:
+                self._forget_font(path)
+
+        first_build = not self.outputs
+        rendered = written = 0
+        for job in self.jobs:
+            glyphs, count = self._render_job(job)
+            rendered += count
+            written += self._write_output(job["output"], glyphs)
+
+        # Edit-to-output latency, measured from the newest modification time we saw
+        edited = max((stamp[0] for path, stamp in self.stamps.items() if path in changed and stamp), default=None)
+        latency = f", {time.time() - edited / 1e9:.2f} s after the edit" if edited and not first_build else ""
+        print(f"Rebuilt in {(time.perf_counter() - start) * 1000:.0f} ms{latency}: "
+              f"{rendered} glyphs rendered, {written} of {len(self.jobs)} outputs rewritten.")
+        return True
+
+    def run(self, interval=POLL_SECONDS):
+        print(f"Watching {self.manifest_path}, press Ctrl+C to stop.")
+        try:
+            while True:
+                try:
+                    self.update()
+                except (OSError, ValueError, KeyError, freetype.FT_Exception) as error:
+                    # A file caught mid-save or a broken manifest; wait for the next edit
+                    print(f"Rebuild failed: {error}")
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            print("Stopped watching.")
+
+
+def watch_manifest(manifest_path, interval=POLL_SECONDS):
+    Watcher(manifest_path).run(interval)
+
+
+if __name__ == "__main__":
+    # Path to the job manifest to keep rebuilding
+    manifest_path = sys.argv[1] if len(sys.argv) > 1 else "fonts.json"
+
+    watch_manifest(manifest_path)
@@ -0,0 +1,146 @@
+import binascii
+import os
+import re
+import sys
+
+from glyphset import GlyphSet, read_glyph_pack
+
+# Patterns for the exact formats our converters write:
+#   write_xbm_file:  #define {char}_width 7 / static char {char}_bits[] = { 0x.., ... };
+#   write_c_header:  #define char_{code}_width 7 / static unsigned char char_{code}_bits[] = {...};
+# Names are matched with \S+? because write_xbm_file uses the raw character, which is
+# not always a valid C identifier (e.g. "!_width").
+_DEFINE_RE = re.compile(rb"#define\s+(\S+?)_(width|height)\s+(\d+)")
+_BITS_RE = re.compile(rb"static\s+(?:unsigned\s+)?char\s+(\S+?)_bits\s*\[\s*\]\s*=\s*\{([^}]*)\}")
+_HEX_RE = re.compile(rb"0[xX]([0-9a-fA-F]+)")
+_CHAR_CODE_RE = re.compile(rb"char_(\d+)\Z")
+# First line of headers written by glyphset.write_glyphset_header
+_FORMAT_RE = re.compile(rb"/\*\s*\d+ glyphs, bit order: (lsb|msb)(?:, layout: (row|column|page))?")
+
+
+# Turns a C symbol prefix back into the character it was generated from.
+def _decode_name(name):
+    match = _CHAR_CODE_RE.match(name)
+    if match:
+        return chr(int(match.group(1)))
+    return name.decode("utf-8")
+
+
+# Converts the body of a bits[] array straight into packed bytes.
+# testing.py writes one int per row, which overflows two digits for widths above 8;
+# every other writer emits one 0x%02x value per byte. The two are told apart by token
+# count: height tokens are row values, split into bytes_per_row big-endian bytes, and
+# height * bytes_per_row tokens are plain bytes (a single unhexlify in the common case).
+# Without a height define the digit length is the only hint left.
+def _hex_to_bytes(body, width, height=None):
+    tokens = _HEX_RE.findall(body)
+    bytes_per_row = (width + 7) // 8
+    if height is not None:
+        row_values = len(tokens) == height and bytes_per_row > 1
+    else:
+        row_values = any(len(token) > 2 for token in tokens)
+
+    if not row_values:
+        joined = b"".join(tokens)
+        if len(joined) == 2 * len(tokens):
+            return binascii.unhexlify(joined)
+        return bytes(int(token, 16) for token in tokens)
+
+    out = bytearray()
+    for token in tokens:
+        out += int(token, 16).to_bytes(bytes_per_row, "big")
+    return bytes(out)
+
+
+# Parses every glyph found in a chunk of .xbm/.h source and adds it to glyphs.
+# Returns the number of glyphs parsed.
+def parse_xbm_bytes(data, glyphs):
+    sizes = {}
+    for name, kind, value in _DEFINE_RE.findall(data):
+        sizes[(name, kind)] = int(value)
+
+    count = 0
+    for match in _BITS_RE.finditer(data):
+        name, body = match.group(1), match.group(2)
+        width = sizes.get((name, b"width"))
+        if width is None:
+            print(f"Skipping '{name.decode('utf-8', 'replace')}': no _width define found.")
+            continue
+
+        height = sizes.get((name, b"height"))
+        bits = _hex_to_bytes(body, width, height)
+        if height is None:
+            height = len(bits) // ((width + 7) // 8) if width else 0
+        if (not width or not height) and bits == b"\x00":
+            # Empty glyphs are written with one placeholder byte to stay valid C
+            bits = b""
+        glyphs.add(_decode_name(name), width, height, bits)
+        count += 1
+
+    return count
+
+
+# Loads a single .xbm file written by write_xbm_file.
+def load_xbm_file(file_name, glyphs=None):
+    if glyphs is None:
+        glyphs = GlyphSet(bit_order="lsb")
+    with open(file_name, "rb") as f:
+        parse_xbm_bytes(f.read(), glyphs)
+    return glyphs
+
+
+# Loads every .xbm file in a directory into one GlyphSet.
+def load_xbm_dir(output_dir, glyphs=None):
+    if glyphs is None:
+        glyphs = GlyphSet(bit_order="lsb")
+
+    with os.scandir(output_dir) as entries:
+        paths = sorted(entry.path for entry in entries if entry.name.endswith(".xbm") and entry.is_file())
+
+    for path in paths:
+        with open(path, "rb") as f:
+            parse_xbm_bytes(f.read(), glyphs)
+
+    print(f"Loaded {len(glyphs)} glyphs from {len(paths)} XBM files in {output_dir}.")
+    return glyphs
+
+
+# Loads a C header written by testing.py's write_c_header (or any concatenation of XBM blocks).
+# testing.py packs rows MSB-first, hence the default bit_order. Headers written by
+# write_glyphset_header declare their bit order and layout, which then take precedence.
+def load_c_header(output_file, glyphs=None, bit_order="msb"):
+    with open(output_file, "rb") as f:
+        data = f.read()
+    if glyphs is None:
+        match = _FORMAT_RE.match(data)
+        if match:
+            glyphs = GlyphSet(bit_order=match.group(1).decode(), layout=(match.group(2) or b"row").decode())
+        else:
+            glyphs = GlyphSet(bit_order=bit_order)
+    count = parse_xbm_bytes(data, glyphs)
+
+    print(f"Loaded {count} glyphs from {output_file}.")
+    return glyphs
+
+
+# Loads whatever a converter produced: a directory of .xbm files, a single .xbm, a .gpk
+# glyph pack or a .h header. header_bit_order is only used for headers that do not
+# declare their own bit order (see load_c_header).
+def load_outputs(path, header_bit_order="msb"):
+    if os.path.isdir(path):
+        return load_xbm_dir(path)
+    if path.endswith(".xbm"):
+        return load_xbm_file(path)
+    if path.endswith(".gpk"):
+        return read_glyph_pack(path)[0]
+    return load_c_header(path, bit_order=header_bit_order)
+
+
+if __name__ == "__main__":
+    # Directory of .xbm files or a generated .h header
+    path = sys.argv[1] if len(sys.argv) > 1 else "output"
+
+    glyphs = load_outputs(path)
+    for char in glyphs:
+        width, height, bits = glyphs.get(char)
+        print(f"{char!r}: {width}x{height}, {len(bits)} bytes")